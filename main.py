@@ -12,14 +12,18 @@
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 
+import argparse
 import os
 import sys
+from pathlib import Path
 from typing import Callable, Literal
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
 
-from pystudy_cli.core.traceback_logger import setup_traceback_logger
+from pystudy_cli.cli.parser import add_subcommands
+from pystudy_cli.core import diagnostics, paths
+from pystudy_cli.core.registry import profiles
 
 UI = Literal["tui", "gui"]
 
@@ -33,8 +37,130 @@ def get_runner(ui: UI) -> Callable[[], None]:
 
     return _run
 
+def profile_id(value: str) -> str:
+    if not profiles.is_valid_id(value):
+        raise argparse.ArgumentTypeError("profile ids are 1-64 letters, digits, '-' or '_'")
+    return value
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="pystudy", description="CLI-style flashcard manager.")
+    parser.add_argument("--data-dir", type=Path, metavar="DIR",
+                        help="data directory (default: $PYSTUDY_DATA_DIR, else data/ in the repo)")
+    parser.add_argument("--profile", type=profile_id, default="default", metavar="ID",
+                        help="profile to use, see the `profiles` command (default: default)")
+    parser.add_argument("--read-only", action="store_true",
+                        help="never save, safe to run next to another session on the same profile")
+    parser.add_argument(
+        "--latency", nargs="?", const="", default=None, metavar="TRACE_FILE",
+        help="record key-to-frame latency per screen, print percentiles on exit "
+             "and write a CSV trace (default: data/latency_trace.csv)"
+    )
+    parser.add_argument(
+        "--trace", nargs="?", const="", default=None, metavar="TRACE_FILE",
+        help="record loads, saves, question generation, grading and renders as spans and write "
+             "them as Chrome trace-event JSON on exit (default: data/trace.json)"
+    )
+
+    bench = parser.add_argument_group("startup benchmark")
+    bench.add_argument("--bench-startup", type=int, metavar="N",
+                       help="run N cold starts against a synthetic profile and report timings")
+    bench.add_argument("--bench-decks", type=int, default=20, metavar="N",
+                       help="number of decks in the synthetic profile (default: 20)")
+    bench.add_argument("--bench-cards", type=int, default=500, metavar="N",
+                       help="cards per synthetic deck (default: 500)")
+    bench.add_argument("--bench-baseline", type=Path, metavar="FILE",
+                       help="baseline file to compare against "
+                            "(default: benchmarks/startup_baseline.json, core_baseline.json for --bench-core)")
+    bench.add_argument("--bench-save-baseline", action="store_true",
+                       help="store the results as the new baseline instead of comparing")
+    bench.add_argument("--bench-threshold", type=float, default=1.25, metavar="RATIO",
+                       help="fail when a metric exceeds the baseline by this factor (default: 1.25)")
+
+    gui_bench = parser.add_argument_group("GUI benchmark")
+    gui_bench.add_argument("--bench-gui", type=int, metavar="FRAMES",
+                           help="play FRAMES scripted frames through the GUI on SDL's dummy drivers "
+                                "and print frame-time and allocation stats as JSON "
+                                "(uses --bench-decks/--bench-cards for the synthetic profile)")
+    gui_bench.add_argument("--bench-output", type=Path, metavar="FILE",
+                           help="also write the JSON report to FILE (GUI and core benchmarks)")
+    gui_bench.add_argument("--bench-text-renderer", choices=("cache", "atlas"), default="cache",
+                           help="text renderer for the card list (default: cache)")
+
+    core_bench = parser.add_argument_group("core benchmark")
+    core_bench.add_argument("--bench-core", action="store_true",
+                            help="time loading, saving, question generation, grading and deck stats "
+                                 "on synthetic profiles, compared against the baseline")
+    core_bench.add_argument("--bench-sizes", type=lambda s: s.split(","), metavar="DxC,...",
+                            help="profile sizes as DECKSxCARDS per deck (default: 1x1000,100x1000,5000x20; "
+                                 "10x100000 is 1M cards)")
+    core_bench.add_argument("--bench-repeat", type=int, default=5, metavar="N",
+                            help="runs per operation, the median is reported (default: 5)")
+    core_bench.add_argument("--bench-term-words", type=int, default=3, metavar="N",
+                            help="mean words per term (default: 3)")
+    core_bench.add_argument("--bench-def-words", type=int, default=12, metavar="N",
+                            help="mean words per definition (default: 12)")
+    core_bench.add_argument("--bench-length-dist", choices=("uniform", "lognormal", "fixed"), default="uniform",
+                            help="how term and definition lengths vary around the mean (default: uniform)")
+
+    add_subcommands(parser)
+    return parser.parse_args(argv)
+
+def run_startup_benchmark(args: argparse.Namespace) -> int:
+    from pystudy_cli.bench import startup
+
+    return startup.run(
+        args.bench_startup, args.bench_decks, args.bench_cards,
+        args.bench_baseline or startup.DEFAULT_BASELINE,
+        args.bench_save_baseline, args.bench_threshold,
+    )
+
+def run_gui_benchmark(args: argparse.Namespace) -> int:
+    from pystudy_cli.bench import gui_frames
+
+    return gui_frames.run(args.bench_gui, args.bench_decks, args.bench_cards,
+                          args.bench_output, args.bench_text_renderer)
+
+def run_core_benchmark(args: argparse.Namespace) -> int:
+    from pystudy_cli.bench import core_suite
+
+    try:
+        return core_suite.run(
+            args.bench_sizes, args.bench_repeat, args.bench_term_words, args.bench_def_words,
+            args.bench_length_dist, args.bench_baseline or core_suite.DEFAULT_BASELINE,
+            args.bench_save_baseline, args.bench_threshold, args.bench_output,
+        )
+    except ValueError as e:
+        print(f"pystudy: {e}", file=sys.stderr)
+        return 2
+
 def main():
-    setup_traceback_logger()
+    args = parse_args()
+    diagnostics.install()
+
+    if args.data_dir:
+        paths.set_data_dir(args.data_dir)
+    profiles.active = args.profile
+    profiles.read_only = args.read_only
+
+    if args.trace is not None:
+        from pystudy_cli.core.tracing import tracer
+        tracer.enable(Path(args.trace) if args.trace else paths.DATA_DIR / "trace.json")
+
+    if args.command:
+        from pystudy_cli.cli import commands
+        sys.exit(commands.run(args))
+
+    if args.bench_startup:
+        sys.exit(run_startup_benchmark(args))
+    if args.bench_gui:
+        sys.exit(run_gui_benchmark(args))
+    if args.bench_core:
+        sys.exit(run_core_benchmark(args))
+
+    if args.latency is not None:
+        from pystudy_cli.tui.latency import recorder
+        recorder.enable(Path(args.latency) if args.latency else paths.DATA_DIR / "latency_trace.csv")
+
     runner = get_runner("tui")
     runner()
 
@@ -0,0 +1,218 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Core hot path benchmark (`main.py --bench-core`).
+
+Times the core operations against seeded synthetic profiles of several
+sizes, given as DECKSxCARDS (cards per deck): by default one small deck,
+a hundred ordinary ones and 5,000 tiny ones. `10x100000` is the 1M card
+case, left out of the default run because generating it takes a while.
+
+Operations, each timed over every deck of the profile unless noted:
+
+    save_profile            whole profile, deck files, head and snapshot
+    load_profile_snapshot   load with a valid startup snapshot
+    load_profile_json       load with the snapshot removed
+    deck_from_json          Deck.from_json of every deck (already parsed)
+    deck_to_json            Deck.to_json of every deck
+    gen_mcqs                20 questions from the first deck
+    gen_written_qs          20 questions from the first deck
+    grade_exact             Question.is_correct_answer, 1,000 answers
+    grade_smart             same answers with smart grading
+    deck_stats              the deck menu statistics of every deck
+
+Each operation runs up to `repeat` times (fewer once it has used up
+TIME_BUDGET) and the median is reported. Results can be saved as a
+baseline and later runs compared against it, like the startup benchmark.
+"""
+
+import gc
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from pystudy_cli.bench.synthetic import generate_profile
+from pystudy_cli.core import paths, snapshot
+from pystudy_cli.core.data_manager import load_profile, save_profile
+from pystudy_cli.core.objects import Deck
+from pystudy_cli.core.profile import StudyProfile
+from pystudy_cli.core.questions import Question, gen_mcqs, gen_written_qs
+from pystudy_cli.core.stats import deck_stats
+
+DEFAULT_BASELINE = paths.ROOT_DIR / "benchmarks" / "core_baseline.json"
+DEFAULT_THRESHOLD = 1.25
+DEFAULT_SIZES = ("1x1000", "100x1000", "5000x20")
+DEFAULT_REPEAT = 5
+TIME_BUDGET = 10.0       # seconds per operation, after the first run
+MIN_COMPARABLE_MS = 0.05  # Faster than this is timer noise, never a regression
+QUESTIONS = 20
+ANSWERS = 1000
+
+
+def parse_size(size: str) -> tuple[int, int]:
+    """'100x1000' -> (100 decks, 1000 cards each)."""
+    decks, _, cards = size.lower().partition("x")
+    try:
+        result = int(decks), int(cards)
+    except ValueError:
+        raise ValueError(f"sizes look like DECKSxCARDS, not '{size}'") from None
+    if result[0] < 1 or result[1] < 1:
+        raise ValueError(f"size '{size}' needs at least one deck and one card")
+    return result
+
+def _measure(op: Callable[[], object], repeat: int, setup: Callable[[], object] | None = None) -> dict[str, float]:
+    times = []
+    budget_end = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        start = time.perf_counter()
+        op()
+        times.append((time.perf_counter() - start) * 1000)
+        budget_end = budget_end or time.perf_counter() + TIME_BUDGET
+        if time.perf_counter() > budget_end:
+            break
+    return {"median_ms": statistics.median(times), "min_ms": min(times), "runs": len(times)}
+
+def _answers(rng: random.Random, profile: StudyProfile) -> list[tuple[str, str]]:
+    """(correct answer, given answer) pairs: a third exact, a third with a typo, a third wrong."""
+    defs = [card.def_ for deck in profile.decks for card in deck.cards[:ANSWERS]][:ANSWERS * 4]
+    pairs = []
+    for i in range(ANSWERS):
+        correct = rng.choice(defs)
+        if i % 3 == 0:
+            given = correct.upper()
+        elif i % 3 == 1 and correct:
+            pos = rng.randrange(len(correct))
+            given = correct[:pos] + "x" + correct[pos + 1:]
+        else:
+            given = rng.choice(defs)
+        pairs.append((correct, given))
+    return pairs
+
+def _bench_profile(profile: StudyProfile, data_dir: Path, repeat: int) -> dict[str, dict[str, float]]:
+    head = data_dir / "save_data.json"
+    deck_json = [(deck.to_json(), deck.filename) for deck in profile.decks]
+    first = profile.decks[0]
+    pairs = _answers(random.Random(1), profile)
+
+    def save() -> None:
+        err = save_profile(profile, head, force=True)
+        if err is not None:
+            raise RuntimeError(f"save_profile failed: {err}")
+
+    def grade(smart: bool) -> Callable[[], None]:
+        def op() -> None:
+            for correct, given in pairs:
+                Question.is_correct_answer(correct, given, smart)
+        return op
+
+    results = {"save_profile": _measure(save, repeat)}
+    # Every load needs what save_profile left behind
+    results["load_profile_snapshot"] = _measure(lambda: load_profile(head), repeat)
+    results["load_profile_json"] = _measure(lambda: load_profile(head), repeat, lambda: snapshot.invalidate(head))
+    results["deck_from_json"] = _measure(lambda: [Deck.from_json(data, name) for data, name in deck_json], repeat)
+    results["deck_to_json"] = _measure(lambda: [deck.to_json() for deck in profile.decks], repeat)
+    random.seed(0)
+    results["gen_mcqs"] = _measure(lambda: gen_mcqs(first, QUESTIONS), repeat)
+    results["gen_written_qs"] = _measure(lambda: gen_written_qs(first, QUESTIONS), repeat)
+    results["grade_exact"] = _measure(grade(False), repeat)
+    results["grade_smart"] = _measure(grade(True), repeat)
+    results["deck_stats"] = _measure(lambda: [deck_stats(deck) for deck in profile.decks], repeat)
+    return results
+
+def _compare(report: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for size, scenario in report["scenarios"].items():
+        old_ops = baseline.get("scenarios", {}).get(size, {}).get("ops", {})
+        for op, stats in scenario["ops"].items():
+            old = old_ops.get(op, {}).get("median_ms")
+            new = stats["median_ms"]
+            if old and max(old, new) >= MIN_COMPARABLE_MS and new > old * threshold:
+                regressions.append(f"{size} {op}: {new:.2f} ms vs baseline {old:.2f} ms (x{new / old:.2f})")
+    return regressions
+
+def _print_report(report: dict, baseline: dict | None) -> None:
+    sizes = list(report["scenarios"])
+    ops = list(next(iter(report["scenarios"].values()))["ops"])
+    width = max(12, *(len(size) + 2 for size in sizes))
+
+    print(f"\nCore benchmark, median ms ({report['config']['length_dist']} text lengths)")
+    print(f"{'operation':<24}" + "".join(f"{size:>{width}}" for size in sizes))
+    for op in ops:
+        row = f"{op:<24}"
+        for size in sizes:
+            new = report["scenarios"][size]["ops"][op]["median_ms"]
+            old = (baseline or {}).get("scenarios", {}).get(size, {}).get("ops", {}).get(op, {}).get("median_ms")
+            cell = f"{new:.2f}" + (f" x{new / old:.2f}" if old else "")
+            row += f"{cell:>{width}}"
+        print(row)
+    if baseline is not None:
+        print("(xN: compared to the baseline)")
+
+def run(sizes: list[str] | None = None, repeat: int = DEFAULT_REPEAT,
+        term_words: int = 3, def_words: int = 12, length_dist: str = "uniform",
+        baseline_path: Path = DEFAULT_BASELINE, save_baseline: bool = False,
+        threshold: float = DEFAULT_THRESHOLD, output: Path | None = None) -> int:
+    """Runs the benchmark, returns the process exit code."""
+    sizes = sizes or list(DEFAULT_SIZES)
+    report: dict = {
+        "config": {"repeat": repeat, "term_words": term_words, "def_words": def_words, "length_dist": length_dist},
+        "scenarios": {},
+    }
+
+    for size in sizes:
+        num_decks, cards_per_deck = parse_size(size)
+        print(f"Generating {num_decks} decks x {cards_per_deck} cards...", flush=True)
+        profile = generate_profile(num_decks, cards_per_deck, seed=0, term_words=term_words,
+                                   def_words=def_words, length_dist=length_dist)
+        with tempfile.TemporaryDirectory(prefix="pystudy-bench-") as tmp:
+            ops = _bench_profile(profile, Path(tmp), repeat)
+        report["scenarios"][size] = {"decks": num_decks, "cards": num_decks * cards_per_deck, "ops": ops}
+        del profile
+
+    baseline = None
+    if not save_baseline and baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    _print_report(report, baseline)
+
+    if output is not None:
+        output.write_text(json.dumps(report, indent=4), encoding="utf-8")
+        print(f"\nResults written to {output}")
+
+    if save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=4), encoding="utf-8")
+        print(f"\nBaseline saved to {baseline_path}")
+        return 0
+
+    if baseline is None:
+        print(f"\nNo baseline at {baseline_path} (use --bench-save-baseline to create one)")
+        return 0
+
+    if baseline.get("config") != report["config"]:
+        print(f"\nNote: the baseline was recorded with different settings: {baseline.get('config')}")
+    regressions = _compare(report, baseline, threshold)
+    if regressions:
+        print(f"\nRegressions (threshold x{threshold}):")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+
+    print(f"\nNo regressions against {baseline_path}")
+    return 0
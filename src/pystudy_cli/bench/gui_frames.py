@@ -0,0 +1,282 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Headless GUI frame-time benchmark (`main.py --bench-gui N`).
+
+Runs the GUI widgets on SDL's dummy video and audio drivers, so it works on
+machines without a display. A seeded script of input events (hovering and
+clicking deck buttons, wheel and keyboard scrolling through a synthetic
+deck, idle frames) is posted to the event queue and each frame goes
+through the same steps as the real loop: event pump, widget updates,
+`check_click`, dirty-rect render. The card row under the pointer gets a
+fading hover highlight drawn with `draw_transparent_rect`, so the overlay
+surface pool is measured too.
+
+The script is played twice. The first pass measures frame times; the
+second runs under tracemalloc to count allocations per frame, since
+tracing would skew the timings. The results are printed as JSON.
+"""
+
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from pystudy_cli.bench.synthetic import generate_profile
+from pystudy_cli.core.stats import percentile
+
+WINDOW_SIZE = (960, 640)
+DECK_BUTTONS = 8
+PHASES = ("hover", "click", "wheel", "keys", "idle")
+PERCENTILES = (50, 90, 99)
+HIGHLIGHT_FADE = 8     # Frames for a row highlight to fade in
+HIGHLIGHT_ALPHA = 96
+
+
+def _use_dummy_drivers() -> None:
+    # Has to happen before pygame initialises SDL
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+def _script(frames: int, num_buttons: int, seed: int = 0) -> list[tuple[str, list[tuple[int, dict]]]]:
+    """Builds the scripted input: one (phase, [(event type, attrs), ...]) per frame.
+
+    Phases are played in blocks of 60 frames, cycling through PHASES."""
+    import pygame as pg
+
+    rng = random.Random(seed)
+    list_centre = (WINDOW_SIZE[0] * 2 // 3, WINDOW_SIZE[1] // 2)
+    scroll_keys = (pg.K_DOWN, pg.K_DOWN, pg.K_PAGEDOWN, pg.K_UP, pg.K_PAGEUP, pg.K_END, pg.K_HOME)
+
+    script = []
+    for frame in range(frames):
+        phase = PHASES[(frame // 60) % len(PHASES)]
+        events: list[tuple[int, dict]] = []
+
+        if phase == "hover":
+            pos = (rng.randint(0, WINDOW_SIZE[0] // 3), rng.randint(0, WINDOW_SIZE[1]))
+            events.append((pg.MOUSEMOTION, {"pos": pos, "rel": (0, 0), "buttons": (0, 0, 0)}))
+        elif phase == "click" and frame % 10 == 0:
+            button = rng.randrange(num_buttons)
+            pos = (WINDOW_SIZE[0] // 6, 120 + button * 56)
+            events.append((pg.MOUSEMOTION, {"pos": pos, "rel": (0, 0), "buttons": (0, 0, 0)}))
+            events.append((pg.MOUSEBUTTONDOWN, {"pos": pos, "button": 1}))
+            events.append((pg.MOUSEBUTTONUP, {"pos": pos, "button": 1}))
+        elif phase == "wheel":
+            if frame % 60 == 0:
+                events.append((pg.MOUSEMOTION, {"pos": list_centre, "rel": (0, 0), "buttons": (0, 0, 0)}))
+            events.append((pg.MOUSEWHEEL, {"x": 0, "y": rng.choice((-3, -1, -1, 1)), "flipped": False}))
+        elif phase == "keys" and frame % 6 == 0:
+            events.append((pg.KEYDOWN, {"key": rng.choice(scroll_keys), "mod": 0, "unicode": "", "scancode": 0}))
+
+        script.append((phase, events))
+    return script
+
+def _row_highlight(cards: Any) -> Any:
+    """Widget drawing a translucent bar over the row of `cards` under the
+    pointer, fading in over HIGHLIGHT_FADE frames whenever the row changes."""
+    import pygame as pg
+
+    from pystudy_cli.gui.ui_elements import Widget
+    from pystudy_cli.gui.utils import draw_transparent_rect
+
+    class RowHighlight(Widget):
+        def __init__(self) -> None:
+            super().__init__(pg.Rect(cards.rect.topleft, (0, 0)))
+            self.pointer: tuple[int, int] | None = None
+            self.fade = HIGHLIGHT_FADE
+
+        @property
+        def animating(self) -> bool:
+            return self.fade < HIGHLIGHT_FADE
+
+        def update(self, event_list: list[pg.event.Event]) -> None:
+            for e in event_list:
+                if e.type == pg.MOUSEMOTION:
+                    self.pointer = e.pos if cards.rect.collidepoint(e.pos) else None
+
+            rect = pg.Rect(cards.rect.topleft, (0, 0))
+            if self.pointer is not None and cards.index.count:
+                row = cards.index.row_at(cards.scroll_y + self.pointer[1] - cards.rect.top)
+                top = cards.rect.top + cards.index.offset(row) - int(cards.scroll_y)
+                rect = pg.Rect(cards.rect.left, top, cards.rect.width, cards.index.height(row)).clip(cards.rect)
+            if rect != self.rect:
+                if rect.top != self.rect.top:
+                    self.fade = 0  # Only restarted for a new row, not a row clipped while scrolling
+                self.rect = rect
+                self.mark_dirty()
+
+        def draw(self, wn: pg.Surface) -> None:
+            if self.rect.width and self.rect.height:
+                alpha = HIGHLIGHT_ALPHA * min(self.fade + 1, HIGHLIGHT_FADE) // HIGHLIGHT_FADE
+                draw_transparent_rect(wn, self.rect.topleft, self.rect.size, (255, 255, 255, alpha), 1)
+            self.fade = min(self.fade + 1, HIGHLIGHT_FADE)
+
+    return RowHighlight()
+
+class _Scene:
+    """Deck buttons on the left, the selected deck's cards in a ScrollableList on the right."""
+
+    def __init__(self, decks: list, text_renderer: str) -> None:
+        import pygame as pg
+
+        from pystudy_cli.gui.renderer import DirtyRectRenderer
+        from pystudy_cli.gui.run_gui import BG_COLOUR, BUTTON_COLOUR, BUTTON_HOVER_COLOUR, TEXT_COLOUR
+        from pystudy_cli.gui.ui_elements import Button, Label, ScrollableList
+
+        self.window = pg.display.set_mode(WINDOW_SIZE)
+        self.renderer = DirtyRectRenderer(self.window, BG_COLOUR)
+        self.decks = decks
+
+        column = WINDOW_SIZE[0] // 3
+        self.title = Label((column // 2, 40), decks[0].name, TEXT_COLOUR, 36, horiz_align="centre")
+        self.buttons = [
+            Button((column // 2, 120 + i * 56), column - 40, 44, BUTTON_COLOUR, TEXT_COLOUR,
+                   deck.name, text_size=24, hover_colour=BUTTON_HOVER_COLOUR)
+            for i, deck in enumerate(decks[:DECK_BUTTONS])
+        ]
+        self.cards = ScrollableList(
+            pg.Rect(column, 0, WINDOW_SIZE[0] - column, WINDOW_SIZE[1]), decks[0].cards, 32,
+            TEXT_COLOUR, BUTTON_COLOUR, item_text=lambda card: f"{card.term} - {card.def_}", text_size=20,
+            text_renderer=text_renderer,
+        )
+        self.highlight = _row_highlight(self.cards)
+        self.renderer.add(self.title, *self.buttons, self.cards, self.highlight)
+
+    def frame(self, events: list) -> None:
+        self.renderer.handle_events(events)
+        for button, deck in zip(self.buttons, self.decks):
+            if button.check_click(events):
+                self.title.set_text(deck.name)
+                self.cards.set_items(deck.cards, 32)
+        self.renderer.render()
+
+def _play(scene: _Scene, script: list, trace_allocations: bool) -> list[dict[str, Any]]:
+    import pygame as pg
+
+    from pystudy_cli.gui.surface_pool import overlays
+    from pystudy_cli.gui.text_cache import texts
+
+    samples = []
+    for phase, events in script:
+        for type_, attrs in events:
+            pg.event.post(pg.event.Event(type_, attrs))
+
+        sample: dict[str, Any] = {"phase": phase}
+        if trace_allocations:
+            tracemalloc.reset_peak()
+            before_mem, _ = tracemalloc.get_traced_memory()
+            before_blocks = sys.getallocatedblocks()
+            before_surfaces = texts.misses + overlays.allocations
+
+        start = time.perf_counter_ns()
+        scene.frame(pg.event.get())
+        sample["frame_ns"] = time.perf_counter_ns() - start
+
+        if trace_allocations:
+            _, peak = tracemalloc.get_traced_memory()
+            sample["peak_bytes"] = peak - before_mem
+            sample["net_blocks"] = sys.getallocatedblocks() - before_blocks
+            sample["surfaces"] = texts.misses + overlays.allocations - before_surfaces
+        samples.append(sample)
+    return samples
+
+def _frame_stats(values: list[int]) -> dict[str, float]:
+    values = sorted(values)
+    stats: dict[str, float] = {f"p{pct}_ms": percentile(values, pct) / 1e6 for pct in PERCENTILES}
+    stats["max_ms"] = values[-1] / 1e6 if values else 0.0
+    stats["mean_ms"] = sum(values) / len(values) / 1e6 if values else 0.0
+    return stats
+
+def _summarise(timed: list[dict], traced: list[dict]) -> dict[str, Any]:
+    phases: dict[str, Any] = {}
+    for phase in PHASES:
+        frame_ns = [s["frame_ns"] for s in timed if s["phase"] == phase]
+        allocs = [s for s in traced if s["phase"] == phase]
+        if not frame_ns:
+            continue
+        phases[phase] = {
+            "frames": len(frame_ns),
+            **_frame_stats(frame_ns),
+            "mean_peak_bytes_per_frame": sum(s["peak_bytes"] for s in allocs) / len(allocs),
+            "mean_net_blocks_per_frame": sum(s["net_blocks"] for s in allocs) / len(allocs),
+            "surfaces_per_frame": sum(s["surfaces"] for s in allocs) / len(allocs),
+        }
+
+    return {
+        "frames": len(timed),
+        "frame_time": _frame_stats([s["frame_ns"] for s in timed]),
+        "allocations": {
+            "mean_peak_bytes_per_frame": sum(s["peak_bytes"] for s in traced) / len(traced),
+            "max_peak_bytes_per_frame": max(s["peak_bytes"] for s in traced),
+            "mean_net_blocks_per_frame": sum(s["net_blocks"] for s in traced) / len(traced),
+            "surfaces_per_frame": sum(s["surfaces"] for s in traced) / len(traced),
+        },
+        "phases": phases,
+    }
+
+def run(frames: int, num_decks: int = 20, cards_per_deck: int = 500,
+        output: Path | None = None, text_renderer: str = "cache") -> int:
+    """Runs the benchmark and prints the JSON report, returns the process exit code."""
+    _use_dummy_drivers()
+    import pygame as pg
+
+    from pystudy_cli.gui.glyph_atlas import atlases
+    from pystudy_cli.gui.surface_pool import overlays
+    from pystudy_cli.gui.text_cache import texts
+
+    pg.init()
+    try:
+        profile = generate_profile(num_decks, cards_per_deck, seed=0)
+        scene = _Scene(profile.decks, text_renderer)
+        script = _script(frames, len(scene.buttons))
+
+        timed = _play(scene, script, trace_allocations=False)
+        text_stats = texts.stats()
+        atlas_stats = atlases.stats()
+        pool_stats = overlays.stats()
+        updated_area = scene.renderer.updated_area
+
+        tracemalloc.start()
+        try:
+            traced = _play(scene, script, trace_allocations=True)
+        finally:
+            tracemalloc.stop()
+    finally:
+        pg.quit()
+
+    report = {
+        "benchmark": "gui_frames",
+        "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+        "window": list(WINDOW_SIZE),
+        "profile": {"decks": num_decks, "cards_per_deck": cards_per_deck},
+        "text_renderer": text_renderer,
+        **_summarise(timed, traced),
+        "text_cache": text_stats,
+        "glyph_atlas": atlas_stats,
+        "surface_pool": pool_stats,
+        "rows_bound": scene.cards.rows_bound,
+        "mean_updated_pixels_per_frame": updated_area / frames,
+    }
+
+    text = json.dumps(report, indent=4)
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0
@@ -0,0 +1,187 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Startup benchmark (`main.py --bench-startup N`).
+
+Runs N cold starts of the TUI in fresh interpreters against a synthetic
+data directory and reports wall time, import time (parsed from
+`-X importtime`), `load_profile` time and time to the first rendered
+frame (the moment the main menu first waits for a key). Results can be
+saved as a baseline and later runs compared against it.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pystudy_cli.bench.synthetic import generate_profile, write_profile
+from pystudy_cli.core import paths
+
+DEFAULT_BASELINE = paths.ROOT_DIR / "benchmarks" / "startup_baseline.json"
+DEFAULT_THRESHOLD = 1.25  # Fail if a metric is 25% slower than the baseline
+METRICS = ("wall_ms", "import_ms", "load_profile_ms", "first_frame_ms")
+
+# Runs in the child process. Does what main.py does, but times each stage and
+# exits as soon as the main menu asks for its first key.
+DRIVER = """
+import json, os, sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, {root!r})
+sys.argv = ["main.py"]
+import main
+main.diagnostics.install()
+from pystudy_cli.tui import run_tui
+from pystudy_cli.tui.runtime import runtime
+timings = {{"import_ms": (time.perf_counter() - t0) * 1000}}
+
+_load_profile = run_tui.profiles.load
+def timed_load_profile(*args, **kwargs):
+    start = time.perf_counter()
+    result = _load_profile(*args, **kwargs)
+    timings["load_profile_ms"] = (time.perf_counter() - start) * 1000
+    return result
+run_tui.profiles.load = timed_load_profile
+
+def first_frame():
+    timings["first_frame_ms"] = (time.perf_counter() - t0) * 1000
+    with open(os.environ["PYSTUDY_BENCH_RESULT"], "w") as f:
+        json.dump(timings, f)
+    os._exit(0)
+runtime.key_source = first_frame
+
+run_tui.main()
+"""
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Parses `-X importtime` output into {module: (self_us, cumulative_us)}."""
+    result = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            result[name.strip()] = (int(self_us), int(cumulative_us))
+        except ValueError:
+            continue
+    return result
+
+def _run_once(data_dir: Path) -> tuple[dict[str, float], dict[str, tuple[int, int]]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        result_path = Path(tmp) / "result.json"
+        env = dict(os.environ, PYSTUDY_DATA_DIR=str(data_dir), PYSTUDY_BENCH_RESULT=str(result_path))
+
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", DRIVER.format(root=str(paths.ROOT_DIR))],
+            env=env, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE, text=True,
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+
+        if proc.returncode != 0 or not result_path.exists():
+            raise RuntimeError(f"startup run failed (exit code {proc.returncode}):\n{proc.stderr[-2000:]}")
+
+        timings = json.loads(result_path.read_text(encoding="utf-8"))
+        timings["wall_ms"] = wall_ms
+        return timings, parse_importtime(proc.stderr)
+
+def _summarise(runs: list[dict[str, float]], imports: list[dict[str, tuple[int, int]]]) -> dict:
+    metrics = {
+        name: {
+            "median": statistics.median(run.get(name, 0.0) for run in runs),
+            "min": min(run.get(name, 0.0) for run in runs),
+            "max": max(run.get(name, 0.0) for run in runs),
+        }
+        for name in METRICS
+    }
+
+    # Self time per top-level package, and the slowest modules overall
+    by_package: dict[str, float] = {}
+    cumulative: dict[str, float] = {}
+    for run in imports:
+        for module, (self_us, cumulative_us) in run.items():
+            package = module.split(".")[0]
+            by_package[package] = by_package.get(package, 0) + self_us / 1000 / len(imports)
+            cumulative[module] = cumulative.get(module, 0) + cumulative_us / 1000 / len(imports)
+
+    return {
+        "runs": len(runs),
+        "metrics": metrics,
+        "import_ms_by_package": dict(sorted(by_package.items(), key=lambda kv: -kv[1])[:15]),
+        "slowest_imports_ms": dict(sorted(cumulative.items(), key=lambda kv: -kv[1])[:15]),
+    }
+
+def _compare(summary: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for name in METRICS:
+        old = baseline.get("metrics", {}).get(name, {}).get("median")
+        new = summary["metrics"][name]["median"]
+        if old and new > old * threshold:
+            regressions.append(f"{name}: {new:.1f} ms vs baseline {old:.1f} ms (x{new / old:.2f})")
+    return regressions
+
+def _print_report(summary: dict) -> None:
+    print(f"\nStartup benchmark ({summary['runs']} runs)")
+    print(f"{'metric':<18}{'median':>10}{'min':>10}{'max':>10}")
+    for name, stats in summary["metrics"].items():
+        print(f"{name:<18}{stats['median']:>10.1f}{stats['min']:>10.1f}{stats['max']:>10.1f}")
+
+    print("\nImport time by package (self, ms)")
+    for package, ms in summary["import_ms_by_package"].items():
+        print(f"  {package:<30}{ms:>8.1f}")
+
+def run(runs: int, num_decks: int = 20, cards_per_deck: int = 500,
+        baseline_path: Path = DEFAULT_BASELINE, save_baseline: bool = False,
+        threshold: float = DEFAULT_THRESHOLD) -> int:
+    """Runs the benchmark, returns the process exit code."""
+    with tempfile.TemporaryDirectory(prefix="pystudy-bench-") as tmp:
+        data_dir = Path(tmp)
+        print(f"Generating {num_decks} decks x {cards_per_deck} cards...")
+        write_profile(generate_profile(num_decks, cards_per_deck, seed=0), data_dir)
+
+        results, imports = [], []
+        for i in range(runs):
+            timings, run_imports = _run_once(data_dir)
+            results.append(timings)
+            imports.append(run_imports)
+            print(f"  run {i + 1}/{runs}: {timings['wall_ms']:.1f} ms")
+
+    summary = _summarise(results, imports)
+    summary["profile"] = {"decks": num_decks, "cards_per_deck": cards_per_deck}
+    _print_report(summary)
+
+    if save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(summary, indent=4), encoding="utf-8")
+        print(f"\nBaseline saved to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"\nNo baseline at {baseline_path} (use --bench-save-baseline to create one)")
+        return 0
+
+    regressions = _compare(summary, json.loads(baseline_path.read_text(encoding="utf-8")), threshold)
+    if regressions:
+        print(f"\nRegressions (threshold x{threshold}):")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+
+    print(f"\nNo regressions against {baseline_path}")
+    return 0
@@ -0,0 +1,84 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""Seeded synthetic profiles for benchmarks."""
+
+import math
+import random
+import string
+from pathlib import Path
+
+from pystudy_cli.core import snapshot
+from pystudy_cli.core.constants import FAMILIARITY_LEVELS, VERSION_NUM
+from pystudy_cli.core.data_manager import write_json_atomic
+from pystudy_cli.core.objects import Card, ConfigObject, Deck
+from pystudy_cli.core.profile import StudyProfile
+
+# How text lengths vary around the mean word counts
+LENGTH_DISTRIBUTIONS = ("uniform", "lognormal", "fixed")
+LOGNORMAL_SIGMA = 0.8  # A few very long definitions, like real decks pasted from notes
+
+
+def _text(rng: random.Random, num_words: int) -> str:
+    return " ".join(
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10)))
+        for _ in range(max(1, num_words))
+    )
+
+def _words(rng: random.Random, mean: int, length_dist: str) -> int:
+    if length_dist == "fixed":
+        return max(1, mean)
+    if length_dist == "lognormal":
+        # mu chosen so the mean stays `mean`
+        return max(1, round(rng.lognormvariate(math.log(max(1, mean)) - LOGNORMAL_SIGMA ** 2 / 2, LOGNORMAL_SIGMA)))
+    return rng.randint(max(1, mean // 2), max(1, mean + mean // 2))
+
+def generate_deck(rng: random.Random, name: str, num_cards: int,
+                  term_words: int = 3, def_words: int = 12, length_dist: str = "uniform") -> Deck:
+    """Builds a deck with random text. Word counts are averages, spread
+    according to length_dist (uniform is +/- 50%)."""
+    def words(mean: int) -> int:
+        return _words(rng, mean, length_dist)
+
+    max_level = len(FAMILIARITY_LEVELS) - 1
+    cards = [
+        Card(_text(rng, words(term_words)), _text(rng, words(def_words)), rng.randint(0, max_level))
+        for _ in range(num_cards)
+    ]
+    filename = f"{name}.json"
+    return Deck("2026-01-01T00:00:00", name, cards, filename)
+
+def generate_profile(num_decks: int, cards_per_deck: int, seed: int = 0,
+                     term_words: int = 3, def_words: int = 12, length_dist: str = "uniform") -> StudyProfile:
+    rng = random.Random(seed)
+    decks = [
+        generate_deck(rng, f"deck-{i:05d}", cards_per_deck, term_words, def_words, length_dist)
+        for i in range(num_decks)
+    ]
+    return StudyProfile(VERSION_NUM, "Benchmark", decks, ConfigObject())
+
+def write_profile(profile: StudyProfile, data_dir: Path, with_snapshot: bool = True) -> Path:
+    """Writes a profile as a data directory, returns the head file path."""
+    decks_dir = data_dir / "decks"
+    head = data_dir / "save_data.json"
+
+    digests = [write_json_atomic(decks_dir / deck.filename, deck.to_json()) for deck in profile.decks]
+    head_digest = write_json_atomic(head, profile.to_json())
+
+    if with_snapshot:
+        sources = [snapshot.source_file(head, head_digest)] + [
+            snapshot.source_file(decks_dir / deck.filename, digest)
+            for deck, digest in zip(profile.decks, digests)
+        ]
+        snapshot.save(head, profile, sources)
+
+    return head
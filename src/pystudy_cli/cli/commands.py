@@ -0,0 +1,611 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Non-interactive batch commands (`main.py <command> ...`).
+
+These work straight on core.data_manager and never import the TUI or
+pygame, so they're cheap to run from scripts and nightly jobs. Output goes
+to stdout (or -o FILE) as JSON or CSV and is written record by record.
+Every command returns a process exit code.
+"""
+
+import argparse
+import csv
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from pystudy_cli.cli.records import open_input, open_output, records
+from pystudy_cli.core import interchange, library, locking, memory, paths, snapshot
+from pystudy_cli.core.constants import FAMILIARITY_LEVELS
+from pystudy_cli.core.data_manager import (
+    LoadStatCategory,
+    decks_dir_for,
+    load_deck,
+    load_profile,
+    make_deck_filename,
+)
+from pystudy_cli.core.exceptions import DeckError, ImportFormatError, LockTimeoutError
+from pystudy_cli.core.objects import Card, Deck, on_correct, on_incorrect
+from pystudy_cli.core.profile import StudyProfile
+from pystudy_cli.core.questions import Question
+from pystudy_cli.core.registry import profiles
+from pystudy_cli.core.stats import deck_stats
+
+LEVEL_FIELDS = [lvl.ui_text.lower() for lvl in FAMILIARITY_LEVELS.values()]
+MAX_REPORTED_ROWS = 20  # Malformed input rows listed on stderr before going quiet
+
+
+def head_path() -> Path:
+    return profiles.head_path()
+
+def library_dir() -> Path:
+    return paths.LIBRARY_DIR
+
+def _error(msg: str) -> None:
+    print(f"pystudy: {msg}", file=sys.stderr)
+
+def _load(writable: bool = False) -> StudyProfile | None:
+    """Loads the profile, or reports why it can't be used and returns None.
+
+    Commands that save refuse partially loaded profiles, since saving would
+    drop the decks that failed to load."""
+    if writable and profiles.read_only:
+        _error("this command saves, it can't run with --read-only")
+        return None
+    profile, status = load_profile(head_path(), library_dir())
+    if status.category in (LoadStatCategory.CORRUPT, LoadStatCategory.ERROR):
+        _error(f"can't load {head_path()} ({status.category.name.lower()}) {status.msg}".rstrip())
+        return None
+    if status.category == LoadStatCategory.PARTIAL:
+        if writable:
+            _error(f"{status.msg}. Refusing to save, run `fsck` first.")
+            return None
+        _error(f"warning: {status.msg}")
+    return profile
+
+def _save(profile: StudyProfile, deck: Deck | None = None) -> int:
+    """Saves the profile, or only `deck` if nothing else changed."""
+    err = profiles.save(profile) if deck is None else profiles.save_deck(deck)
+    if err is not None:
+        _error(f"save failed: {err}")
+        return 1
+    return 0
+
+def _select_decks(profile: StudyProfile, names: list[str]) -> list[Deck] | None:
+    if not names:
+        return profile.decks
+    by_name = {deck.name: deck for deck in profile.decks}
+    missing = [name for name in names if name not in by_name]
+    if missing:
+        _error("no such deck: " + ", ".join(missing))
+        return None
+    return [by_name[name] for name in names]
+
+def _csv_rows(f, header_first: str) -> Iterator[tuple[int, list[str]]]:
+    """Yields (line number, row), skipping a header row that starts with header_first."""
+    for line_no, row in enumerate(csv.reader(f), start=1):
+        if line_no == 1 and row and row[0].strip().lower() == header_first:
+            continue
+        if not row or not any(cell.strip() for cell in row):
+            continue
+        yield line_no, row
+
+class _RowErrors:
+    """Counts malformed input rows, printing the first few to stderr."""
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.count = 0
+
+    def add(self, line_no: int, msg: str) -> None:
+        self.count += 1
+        if self.count <= MAX_REPORTED_ROWS:
+            _error(f"{self.source}:{line_no}: {msg}")
+        elif self.count == MAX_REPORTED_ROWS + 1:
+            _error(f"{self.source}: more malformed rows, not listing them all")
+
+# list
+def cmd_list(args: argparse.Namespace) -> int:
+    profile = _load()
+    if profile is None:
+        return 1
+
+    with records(args.output, args.format, ["name", "filename", "cards", "creation_date", "library"]) as out:
+        for deck in profile.decks:
+            out.write({
+                "name": deck.name,
+                "filename": deck.filename,
+                "cards": len(deck.cards),
+                "creation_date": deck.creation_date,
+                "library": deck.library,
+            })
+    return 0
+
+# stats
+def cmd_stats(args: argparse.Namespace) -> int:
+    profile = _load()
+    if profile is None:
+        return 1
+    decks = _select_decks(profile, args.decks)
+    if decks is None:
+        return 1
+
+    with records(args.output, args.format, ["name", "cards", "progress", *LEVEL_FIELDS]) as out:
+        for deck in decks:
+            stats = deck_stats(deck)
+            record: dict[str, Any] = {"name": deck.name, "cards": stats.cards, "progress": round(stats.progress, 4)}
+            for lvl_int, field in zip(FAMILIARITY_LEVELS, LEVEL_FIELDS):
+                record[field] = stats.level_counts[lvl_int]
+            out.write(record)
+    return 0
+
+# export
+def cmd_export(args: argparse.Namespace) -> int:
+    profile = _load()
+    if profile is None:
+        return 1
+    decks = _select_decks(profile, args.decks)
+    if decks is None:
+        return 1
+
+    delimiter = _separator(args.delimiter) if args.delimiter else None
+    if args.format == "text":
+        with open_output(args.output) as out:
+            changed = interchange.write_text(out, (card for deck in decks for card in deck.cards),
+                                             delimiter or interchange.DELIMITERS["text"],
+                                             _separator(args.card_separator))
+        if changed:
+            _error(f"warning: {changed} card(s) contained a separator, replaced with spaces")
+        return 0
+
+    with records(args.output, args.format, ["deck", "term", "definition", "familiarity_level"], delimiter) as out:
+        for deck in decks:
+            for card in deck.cards:
+                out.write({
+                    "deck": deck.name,
+                    "term": card.term,
+                    "definition": card.def_,
+                    "familiarity_level": card.familiarity_level,
+                })
+    return 0
+
+# import
+PROGRESS_EVERY = 100_000  # Cards between progress lines when stderr isn't a terminal
+
+def _separator(value: str) -> str:
+    """Separators on the command line can use \\t, \\n and \\r."""
+    return value.replace("\\t", "\t").replace("\\n", "\n").replace("\\r", "\r")
+
+def _input_format(path: Path) -> str:
+    suffix = path.suffix.lower()
+    return "json" if suffix == ".json" else interchange.SUFFIXES.get(suffix, "csv")
+
+class _Progress:
+    """Counts cards as they're consumed, reporting on stderr now and then."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._tty = sys.stderr.isatty()
+
+    def wrap(self, cards: Iterable[Card]) -> Iterator[Card]:
+        every = 10_000 if self._tty else PROGRESS_EVERY
+        for card in cards:
+            self.count += 1
+            if self.count % every == 0:
+                if self._tty:
+                    print(f"\r{self.count:,} cards read", end="", file=sys.stderr, flush=True)
+                else:
+                    print(f"{self.count:,} cards read", file=sys.stderr, flush=True)
+            yield card
+        if self._tty and self.count >= every:
+            print(f"\r{self.count:,} cards read", file=sys.stderr)
+
+def _cards_from_json(f, errors: _RowErrors) -> Iterator[Card]:
+    data = json.load(f)
+    items = data.get("cards", []) if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        errors.add(1, "expected a list of cards or a deck file")
+        return
+
+    for i, item in enumerate(items, start=1):
+        try:
+            term = str(item["term"]).strip()
+            definition = str(item.get("definition", item.get("def_", ""))).strip()
+            level = interchange.parse_level(str(item.get("familiarity_level", 0)))
+        except (KeyError, TypeError, AttributeError, ValueError) as e:
+            errors.add(i, f"bad card ({e})")
+            continue
+        if not term:
+            errors.add(i, "empty term")
+            continue
+        yield Card(term, definition, level)
+
+def cmd_import(args: argparse.Namespace) -> int:
+    profile = _load(writable=not args.dry_run)
+    if profile is None:
+        return 1
+
+    fmt = args.format or _input_format(args.file)
+    deck_name = args.deck or (args.file.stem if str(args.file) != "-" else "")
+    if not deck_name:
+        _error("--deck is required when reading from stdin")
+        return 1
+
+    deck = next((d for d in profile.decks if d.name == deck_name), None)
+    created = deck is None
+    if deck is None:
+        filename = make_deck_filename(deck_name, (d.filename for d in profile.decks))
+        try:
+            profile.new_deck(datetime.now().isoformat(), deck_name, filename)
+        except DeckError as e:
+            _error(str(e))
+            return 1
+        deck = profile.decks[-1]
+    elif deck.library is not None:
+        _error(f"'{deck_name}' is a library deck and can't be changed, import into another deck")
+        return 1
+    elif args.replace:
+        deck.cards.clear()
+
+    errors = _RowErrors(str(args.file))
+    progress = _Progress()
+    existing = len(deck.cards)
+    try:
+        with open_input(args.file) as f:
+            if fmt == "json":
+                cards = progress.wrap(_cards_from_json(f, errors))
+            else:
+                delimiter = _separator(args.delimiter) if args.delimiter else None
+                cards = progress.wrap(interchange.read_cards(f, fmt, errors.add, delimiter,
+                                                             _separator(args.card_separator)))
+
+            if args.dry_run:
+                for _ in cards:
+                    pass
+            elif created:
+                # Straight to the deck file, a new deck is never held in memory
+                if (err := profiles.save_new_decks(profile, [(deck, cards)])) is not None:
+                    _error(f"import failed: {err}")
+                    return 1
+            else:
+                deck.cards.extend(cards)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError, csv.Error) as e:
+        _error(f"can't read {args.file}: {e}")
+        return 1
+
+    if not args.dry_run and not created:
+        if (code := _save(profile, deck)) != 0:
+            return code
+
+    with records(None, "json", []) as out:
+        out.write({"deck": deck.name, "created": created, "imported": progress.count,
+                   "skipped": errors.count, "total_cards": existing + progress.count, "saved": not args.dry_run})
+    return 0
+
+# import-anki
+def _unique_name(name: str, taken: set[str]) -> str:
+    unique, n = name, 1
+    while unique in taken:
+        n += 1
+        unique = f"{name} {n}"
+    taken.add(unique)
+    return unique
+
+def cmd_import_anki(args: argparse.Namespace) -> int:
+    import sqlite3
+    import zipfile
+
+    from pystudy_cli.core import anki  # sqlite3 and zipfile are only needed here
+
+    profile = _load(writable=not args.dry_run)
+    if profile is None:
+        return 1
+
+    errors = _RowErrors(str(args.file))
+    progress = _Progress()
+    names = {deck.name for deck in profile.decks}
+    imported: list[dict[str, Any]] = []
+
+    def counted(cards: Iterable[Card], record: dict[str, Any]) -> Iterator[Card]:
+        for card in cards:
+            record["cards"] += 1
+            yield card
+
+    def new_decks(conn: sqlite3.Connection) -> Iterator[tuple[Deck, Iterator[Card]]]:
+        if args.deck:
+            groups: Iterable[tuple[str, Iterator[Card]]] = [
+                ("", (card for _, card in anki.notes(conn, args.fields, args.levels, errors.add)))
+            ]
+        else:
+            groups = anki.decks(conn, args.fields, args.levels, errors.add)
+
+        for anki_name, cards in groups:
+            name = _unique_name(args.deck or anki_name, names)
+            profile.new_deck(datetime.now().isoformat(), name,
+                             make_deck_filename(name, (d.filename for d in profile.decks)))
+            record = {"deck": name, "anki_deck": anki_name or None, "cards": 0}
+            imported.append(record)
+            yield profile.decks[-1], progress.wrap(counted(cards, record))
+
+    try:
+        with anki.open_collection(args.file) as conn:
+            if args.dry_run:
+                for _, cards in new_decks(conn):
+                    for _ in cards:
+                        pass
+            elif (err := profiles.save_new_decks(profile, new_decks(conn))) is not None:
+                _error(f"import failed: {err}")
+                return 1
+    except (OSError, zipfile.BadZipFile, sqlite3.DatabaseError, ImportFormatError) as e:
+        _error(f"can't read {args.file}: {e}")
+        return 1
+
+    with records(None, "json", []) as out:
+        for record in imported:
+            out.write({**record, "saved": not args.dry_run})
+    if errors.count:
+        _error(f"{errors.count} note(s) skipped")
+    return 0
+
+# grade
+def cmd_grade(args: argparse.Namespace) -> int:
+    profile = _load(writable=not args.dry_run)
+    if profile is None:
+        return 1
+
+    decks = {deck.name: deck for deck in profile.decks}
+    card_index: dict[str, dict[str, Card]] = {}  # Built per deck on first use
+    errors = _RowErrors(str(args.file))
+    graded = 0
+
+    fields = ["deck", "term", "answer", "status", "correct", "familiarity_level"]
+    with open_input(args.file) as f, records(args.output, args.format, fields) as out:
+        for line_no, row in _csv_rows(f, "deck"):
+            if len(row) < 3:
+                errors.add(line_no, "expected deck,term,answer")
+                continue
+            deck_name, term, answer = row[0], row[1].strip(), row[2]
+            record: dict[str, Any] = {"deck": deck_name, "term": term, "answer": answer,
+                                      "correct": None, "familiarity_level": None}
+
+            deck = decks.get(deck_name)
+            if deck is None:
+                out.write({**record, "status": "unknown deck"})
+                continue
+            if deck_name not in card_index:
+                card_index[deck_name] = {}
+                for card in deck.cards:
+                    card_index[deck_name].setdefault(card.term, card)
+            card = card_index[deck_name].get(term)
+            if card is None:
+                out.write({**record, "status": "unknown card"})
+                continue
+
+            correct = Question.is_correct_answer(card.def_, answer, args.smart, args.strictness)
+            if not args.dry_run:
+                (on_correct if correct else on_incorrect)(card)
+            graded += 1
+            out.write({**record, "status": "graded", "correct": correct,
+                       "familiarity_level": card.familiarity_level})
+
+    if graded and not args.dry_run:
+        profile.mark_studied()
+        return _save(profile)
+    return 0
+
+# fsck
+def _fsck_issues(head: Path) -> Iterable[tuple[str, str, str]]:
+    """Yields (severity, file, problem) for everything wrong with the data directory."""
+    if not head.exists():
+        yield "warning", str(head), "no save file (nothing to check)"
+        return
+
+    try:
+        raw = json.loads(head.read_text(encoding="utf-8"))
+        assert isinstance(raw, dict), "head file isn't a JSON object"
+    except (json.JSONDecodeError, UnicodeDecodeError, AssertionError) as e:
+        yield "error", str(head), f"unreadable save file: {e}"
+        return
+
+    if "deck_files" not in raw:
+        if "decks" in raw:
+            yield "warning", str(head), "decks are stored inline (old format), `compact` splits them into deck files"
+        return
+
+    deck_files = raw["deck_files"]
+    if not isinstance(deck_files, list):
+        yield "error", str(head), "deck_files isn't a list"
+        return
+
+    decks_dir = decks_dir_for(head)
+    seen_files: set[str] = set()
+    seen_names: set[str] = set()
+    for filename in map(str, deck_files):
+        path = decks_dir / filename
+        if filename in seen_files:
+            yield "error", str(path), "listed more than once in the save file"
+            continue
+        seen_files.add(filename)
+
+        if not path.is_file():
+            yield "error", str(path), "deck file is missing"
+            continue
+        try:
+            deck = load_deck(filename, decks_dir, library_dir())
+        except Exception as e:
+            yield "error", str(path), f"unreadable deck file: {e!r}"
+            continue
+
+        if deck.name in seen_names:
+            yield "error", str(path), f"duplicate deck name '{deck.name}'"
+        seen_names.add(deck.name)
+
+        bad_levels = sum(1 for card in deck.cards if card.familiarity_level not in FAMILIARITY_LEVELS)
+        if bad_levels:
+            yield "error", str(path), f"{bad_levels} card(s) have an out of range familiarity level"
+
+    if decks_dir.is_dir():
+        for path in sorted(decks_dir.glob("*.json")):
+            if path.name not in seen_files:
+                yield "warning", str(path), "not referenced by the save file, `compact` moves it to trash"
+
+    for directory in (head.parent, decks_dir):
+        for path in sorted(directory.glob("*.tmp")):
+            yield "warning", str(path), "leftover temporary file from an interrupted save"
+
+    if snapshot.snapshot_path(head).exists() and snapshot.load(head) is None:
+        yield "info", str(snapshot.snapshot_path(head)), "startup snapshot is stale, it's rebuilt on the next save"
+
+def cmd_fsck(args: argparse.Namespace) -> int:
+    errors = 0
+    with records(args.output, args.format, ["severity", "file", "problem"]) as out:
+        for severity, file, problem in _fsck_issues(head_path()):
+            errors += severity == "error"
+            out.write({"severity": severity, "file": file, "problem": problem})
+    return 1 if errors else 0
+
+# compact
+def _dir_size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file()) if path.is_dir() else 0
+
+def cmd_compact(args: argparse.Namespace) -> int:
+    profile = _load(writable=True)
+    if profile is None:
+        return 1
+
+    data_dir = head_path().parent
+    bytes_before = _dir_size(data_dir)
+
+    # Rewrites every deck file, moves unreferenced ones to trash and refreshes the snapshot
+    if (code := _save(profile)) != 0:
+        return code
+
+    tmp_removed = 0
+    decks_dir = decks_dir_for(head_path())
+    try:
+        # Another session's save could be halfway through writing one
+        with locking.profile_lock(head_path()):
+            for directory in (data_dir, decks_dir):
+                for path in directory.glob("*.tmp"):
+                    path.unlink()
+                    tmp_removed += 1
+    except LockTimeoutError as e:
+        _error(f"temporary files not removed: {e}")
+
+    trash_removed = 0
+    trash_dir = decks_dir / "trash"
+    if not args.keep_trash and trash_dir.is_dir():
+        for path in trash_dir.iterdir():
+            if path.is_file():
+                path.unlink()
+                trash_removed += 1
+
+    with records(None, "json", []) as out:
+        out.write({"decks": len(profile.decks), "cards": sum(len(d.cards) for d in profile.decks),
+                   "bytes_before": bytes_before, "bytes_after": _dir_size(data_dir),
+                   "tmp_removed": tmp_removed, "trash_removed": trash_removed})
+    return 0
+
+# publish
+def cmd_publish(args: argparse.Namespace) -> int:
+    profile = _load(writable=not args.dry_run)
+    if profile is None:
+        return 1
+    decks = _select_decks(profile, args.decks)
+    if decks is None:
+        return 1
+
+    with records(args.output, args.format, ["name", "cards", "library", "status"]) as out:
+        for deck in decks:
+            if deck.library is not None:
+                status = "already published"
+            elif args.dry_run:
+                status = "would publish"
+            else:
+                status = "published" if library.publish(deck, library_dir()) else "shared"
+            out.write({"name": deck.name, "cards": len(deck.cards), "library": deck.library, "status": status})
+
+    if not args.dry_run:
+        return _save(profile)
+    return 0
+
+# profiles
+def cmd_profiles(args: argparse.Namespace) -> int:
+    summaries = profiles.summaries()
+    if args.sort == "last-studied":
+        summaries.sort(key=lambda s: s.last_studied or "", reverse=True)
+    elif args.sort == "name":
+        summaries.sort(key=lambda s: s.name.casefold())
+
+    with records(args.output, args.format, ["profile", "name", "decks", "last_studied"]) as out:
+        for summary in summaries:
+            out.write({"profile": summary.profile_id, "name": summary.name,
+                       "decks": summary.decks, "last_studied": summary.last_studied})
+    return 0
+
+# memory
+def cmd_memory(args: argparse.Namespace) -> int:
+    memory.start_tracing()  # Before loading, so the profile's allocations are attributed
+    profile = _load()
+    if profile is None:
+        return 1
+
+    previous = None
+    if args.compare:
+        try:
+            previous = memory.load_snapshot(args.compare)
+        except Exception as e:
+            _error(f"can't read snapshot {args.compare}: {e}")
+            return 1
+
+    report = memory.build_report(profile, head_path(), previous, args.top)
+    snapshot_taken = report.pop("_snapshot")
+    if args.save_snapshot:
+        snapshot_taken.dump(str(args.save_snapshot))
+
+    with open_output(args.output) as out:
+        if args.text:
+            out.write("\n".join(memory.format_report(report, max_decks=args.top)) + "\n")
+        else:
+            json.dump(report, out, indent=4)
+            out.write("\n")
+    return 0
+
+# serve
+def cmd_serve(args: argparse.Namespace) -> int:
+    from pystudy_cli.server import app
+
+    return app.run(args.root or paths.PROFILES_DIR, args.port, args.cache_size, args.save_delay,
+                   args.library or library_dir())
+
+COMMANDS = {
+    "list": cmd_list,
+    "stats": cmd_stats,
+    "export": cmd_export,
+    "import": cmd_import,
+    "import-anki": cmd_import_anki,
+    "grade": cmd_grade,
+    "fsck": cmd_fsck,
+    "compact": cmd_compact,
+    "publish": cmd_publish,
+    "profiles": cmd_profiles,
+    "memory": cmd_memory,
+    "serve": cmd_serve,
+}
+
+def run(args: argparse.Namespace) -> int:
+    """Runs the command cli.parser parsed."""
+    return COMMANDS[args.command](args)
@@ -0,0 +1,130 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+The batch commands' arguments, kept apart from cli.commands so main.py can
+build its parser without importing the commands. They're imported only
+once a command is given.
+"""
+
+import argparse
+from pathlib import Path
+
+from pystudy_cli.core.constants import DEFAULT_SMART_GRADING_STRICTNESS
+from pystudy_cli.core.memory import TOP_SITES
+
+OUTPUT_FORMATS = ("json", "csv", "tsv")          # cli.records.FORMATS
+EXPORT_FORMATS = (*OUTPUT_FORMATS, "text")
+IMPORT_FORMATS = ("json", "csv", "tsv", "text")  # json and core.interchange.FORMATS
+
+
+def _parse_fields(value: str) -> tuple[int, int]:
+    """'1,2' -> (0, 1), the fields are numbered from 1 on the command line."""
+    try:
+        term, definition = (int(v) - 1 for v in value.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected TERM,DEFINITION field numbers, not '{value}'") from None
+    if term < 0 or definition < 0:
+        raise argparse.ArgumentTypeError("field numbers start at 1")
+    return term, definition
+
+def add_subcommands(parser: argparse.ArgumentParser) -> None:
+    """Registers the batch commands on main.py's parser."""
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND",
+                                     title="batch commands (run without a command for the TUI)")
+
+    def add(name: str, help: str, output: bool = True) -> argparse.ArgumentParser:
+        sub = commands.add_parser(name, help=help, description=help)
+        if output:
+            sub.add_argument("--format", choices=OUTPUT_FORMATS, default="json", help="output format (default: json)")
+            sub.add_argument("-o", "--output", type=Path, metavar="FILE", help="write to FILE instead of stdout")
+        return sub
+
+    add("list", "list decks")
+
+    sub = add("stats", "study progress per deck")
+    sub.add_argument("decks", nargs="*", metavar="DECK", help="deck names (default: all decks)")
+
+    def add_separators(sub: argparse.ArgumentParser) -> None:
+        sub.add_argument("--delimiter", metavar="SEP",
+                         help="column separator, e.g. ';' or '\\t' (default: comma for csv, tab otherwise)")
+        sub.add_argument("--card-separator", default="\\n", metavar="SEP",
+                         help="text format only: what separates cards (default: a new line)")
+
+    sub = add("export", "export cards", output=False)
+    sub.add_argument("decks", nargs="*", metavar="DECK", help="deck names (default: all decks)")
+    sub.add_argument("--format", choices=EXPORT_FORMATS, default="json",
+                     help="output format, text is term<TAB>definition lines like Quizlet (default: json)")
+    sub.add_argument("-o", "--output", type=Path, metavar="FILE", help="write to FILE instead of stdout")
+    add_separators(sub)
+
+    sub = add("import", "import cards into a deck, creating it if needed", output=False)
+    sub.add_argument("file", type=Path,
+                     help="CSV/TSV (term,definition[,familiarity_level] or with a header), "
+                          "text (term<TAB>definition lines, as exported by Quizlet) or JSON file, - for stdin")
+    sub.add_argument("--deck", help="deck to import into (default: the file name)")
+    sub.add_argument("--format", choices=IMPORT_FORMATS,
+                     help="input format (default: from the file extension, .txt is text, otherwise csv)")
+    add_separators(sub)
+    sub.add_argument("--replace", action="store_true", help="replace the deck's cards instead of appending")
+    sub.add_argument("--dry-run", action="store_true", help="parse and report without saving")
+
+    sub = add("import-anki", "import an Anki package, one deck per Anki deck", output=False)
+    sub.add_argument("file", type=Path, help=".apkg or .colpkg file")
+    sub.add_argument("--deck", help="put every note in this one new deck instead")
+    sub.add_argument("--fields", type=_parse_fields, default=(0, 1), metavar="TERM,DEF",
+                     help="note fields to use as the term and definition (default: 1,2)")
+    sub.add_argument("--levels", action="store_true",
+                     help="set familiarity levels from the Anki review state (default: all new)")
+    sub.add_argument("--dry-run", action="store_true", help="read and report without saving")
+
+    sub = add("grade", "grade answers from a CSV (deck,term,answer) and update familiarity")
+    sub.add_argument("file", type=Path, help="CSV file, - for stdin")
+    sub.add_argument("--smart", action="store_true", help="accept close answers (smart grading)")
+    sub.add_argument("--strictness", type=float, default=DEFAULT_SMART_GRADING_STRICTNESS,
+                     help=f"similarity needed with --smart (default: {DEFAULT_SMART_GRADING_STRICTNESS})")
+    sub.add_argument("--dry-run", action="store_true", help="grade without updating familiarity")
+
+    add("fsck", "check the data directory for problems (exit code 1 on errors)")
+
+    sub = add("compact", "rewrite all deck files, clear temporary files and empty the trash",
+              output=False)
+    sub.add_argument("--keep-trash", action="store_true", help="don't empty the deck trash")
+
+    sub = add("publish", "move decks' card text into the shared library, keeping progress")
+    sub.add_argument("decks", nargs="*", metavar="DECK", help="deck names (default: all decks)")
+    sub.add_argument("--dry-run", action="store_true", help="report without changing anything")
+
+    sub = add("profiles", "list profiles in the data directory (select one with --profile)")
+    sub.add_argument("--sort", choices=("id", "name", "last-studied"), default="id",
+                     help="sort order (default: id)")
+
+    sub = add("memory", "memory used by the profile's decks, indexes, caches and top allocation sites",
+              output=False)
+    sub.add_argument("--text", action="store_true", help="print tables instead of JSON")
+    sub.add_argument("--top", type=int, default=TOP_SITES, metavar="N",
+                     help=f"allocation sites (and decks with --text) to list (default: {TOP_SITES})")
+    sub.add_argument("--save-snapshot", type=Path, metavar="FILE", help="also save the tracemalloc snapshot to FILE")
+    sub.add_argument("--compare", type=Path, metavar="FILE",
+                     help="show what grew since a snapshot saved with --save-snapshot")
+    sub.add_argument("-o", "--output", type=Path, metavar="FILE", help="write to FILE instead of stdout")
+
+    sub = add("serve", "serve many profiles over HTTP/JSON on localhost", output=False)
+    sub.add_argument("--port", type=int, default=8765, help="port to listen on (default: 8765)")
+    sub.add_argument("--root", type=Path, metavar="DIR",
+                     help="directory with one sub-directory per profile (default: data/profiles)")
+    sub.add_argument("--cache-size", type=int, default=64, metavar="N",
+                     help="profiles kept loaded (default: 64)")
+    sub.add_argument("--save-delay", type=float, default=2.0, metavar="SECONDS",
+                     help="write-behind delay before a changed profile is saved (default: 2)")
+    sub.add_argument("--library", type=Path, metavar="DIR",
+                     help="shared deck library used by every profile (default: data/library)")
@@ -0,0 +1,89 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""Streaming JSON/CSV/TSV output for the batch commands."""
+
+import contextlib
+import csv
+import json
+import sys
+from pathlib import Path
+from typing import Any, Iterator, Literal, TextIO
+
+OutputFormat = Literal["json", "csv", "tsv"]
+FORMATS = ("json", "csv", "tsv")
+
+
+class RecordWriter:
+    """Writes records one at a time, as a JSON array or CSV/TSV rows.
+
+    Nothing is buffered beyond the current record, so exporting a huge deck
+    never holds the whole output in memory."""
+
+    def __init__(self, stream: TextIO, fmt: OutputFormat, fields: list[str], delimiter: str | None = None) -> None:
+        self.stream = stream
+        self.fmt = fmt
+        self.fields = fields
+        self.count = 0
+        self._csv: Any = None
+
+        if fmt in ("csv", "tsv"):
+            delimiter = delimiter or ("\t" if fmt == "tsv" else ",")
+            self._csv = csv.DictWriter(stream, fields, extrasaction="ignore", lineterminator="\n", delimiter=delimiter)
+            self._csv.writeheader()
+        elif fmt == "json":
+            stream.write("[")
+        else:
+            raise ValueError(f"unknown output format: {fmt}")
+
+    def write(self, record: dict[str, Any]) -> None:
+        if self._csv is not None:
+            self._csv.writerow(record)
+        else:
+            self.stream.write(",\n    " if self.count else "\n    ")
+            self.stream.write(json.dumps(record, ensure_ascii=False))
+        self.count += 1
+
+    def close(self) -> None:
+        if self.fmt == "json":
+            self.stream.write("\n]\n" if self.count else "]\n")
+        self.stream.flush()
+
+
+@contextlib.contextmanager
+def open_output(path: Path | None) -> Iterator[TextIO]:
+    """Opens path for writing, or yields stdout for None or '-'."""
+    if path is None or str(path) == "-":
+        yield sys.stdout
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as f:
+        yield f
+
+@contextlib.contextmanager
+def records(path: Path | None, fmt: OutputFormat, fields: list[str],
+            delimiter: str | None = None) -> Iterator[RecordWriter]:
+    with open_output(path) as stream:
+        writer = RecordWriter(stream, fmt, fields, delimiter)
+        try:
+            yield writer
+        finally:
+            writer.close()
+
+@contextlib.contextmanager
+def open_input(path: Path) -> Iterator[TextIO]:
+    """Opens path for reading, or yields stdin for '-'."""
+    if str(path) == "-":
+        yield sys.stdin
+        return
+    with path.open("r", encoding="utf-8", newline="") as f:
+        yield f
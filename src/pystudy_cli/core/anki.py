@@ -0,0 +1,153 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Anki package (.apkg/.colpkg) reading, stdlib only.
+
+A package is a zip holding the collection, an SQLite database. It's copied
+out to a temporary file (SQLite can't read inside a zip) and read through a
+cursor, a batch of notes at a time, so only the current batch is ever in
+memory. Each note becomes one card: by default its first field is the term
+and its second the definition, with HTML, cloze markup and sound tags
+stripped. Media isn't imported.
+
+Packages from recent Anki versions only hold a zstd compressed collection
+(collection.anki21b), which the stdlib can't read. Those need exporting
+again with "Support older Anki versions" ticked.
+
+Review history can be mapped to familiarity levels, from the state of a
+note's most advanced card:
+
+    new                         New
+    learning, relearning        Learning
+    review, interval < 7 days   Familiar
+    review, < 21 days           Proficient
+    review, 21+ days            Mastered   (what Anki calls mature)
+"""
+
+import contextlib
+import html
+import itertools
+import json
+import re
+import shutil
+import sqlite3
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Callable, Iterator
+
+from pystudy_cli.core.exceptions import ImportFormatError
+from pystudy_cli.core.objects import Card
+from pystudy_cli.core.tracing import tracer
+
+COLLECTIONS = ("collection.anki21", "collection.anki2")  # Newest readable first
+BATCH = 2000  # Notes fetched at a time
+FIELD_SEP = "\x1f"
+
+ErrorCallback = Callable[[int, str], None]
+
+# Cards in a filtered deck keep their home deck in odid
+_NOTES_QUERY = """
+    SELECT n.id, n.flds,
+           MIN(CASE WHEN c.odid != 0 THEN c.odid ELSE c.did END) AS deck,
+           MAX(CASE
+               WHEN c.type = 2 AND c.ivl >= 21 THEN 4
+               WHEN c.type = 2 AND c.ivl >= 7 THEN 3
+               WHEN c.type = 2 THEN 2
+               WHEN c.type IN (1, 3) THEN 1
+               ELSE 0
+           END) AS level
+    FROM notes n JOIN cards c ON c.nid = n.id
+    GROUP BY n.id
+    ORDER BY deck, n.id
+"""
+
+_BREAK = re.compile(r"<br\s*/?>|</div>|</p>|</li>", re.IGNORECASE)
+_TAG = re.compile(r"<[^>]*>")
+_CLOZE = re.compile(r"\{\{c\d+::(.*?)(?:::[^}]*)?\}\}", re.DOTALL)
+_SOUND = re.compile(r"\[sound:[^\]]*\]")
+
+
+def clean_field(text: str) -> str:
+    """A note field as plain text on one line."""
+    if "<" in text:
+        text = _TAG.sub("", _BREAK.sub(" ", text))
+    if "{{" in text:
+        text = _CLOZE.sub(r"\1", text)
+    if "[sound:" in text:
+        text = _SOUND.sub("", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return " ".join(text.split())
+
+@contextlib.contextmanager
+def open_collection(path: Path) -> Iterator[sqlite3.Connection]:
+    """The collection in an Anki package, opened read-only."""
+    with tracer.span("anki_open", path.name), zipfile.ZipFile(path) as package:
+        names = set(package.namelist())
+        if "collection.anki21b" in names and "collection.anki21" not in names:
+            # Any collection.anki2 next to it only holds a note asking to update Anki
+            raise ImportFormatError("this package only has a zstd compressed collection, export it again from "
+                                    "Anki with \"Support older Anki versions\" ticked")
+        name = next((n for n in COLLECTIONS if n in names), None)
+        if name is None:
+            raise ImportFormatError("no Anki collection in this file")
+
+        with tempfile.TemporaryDirectory(prefix="pystudy-anki-") as tmp:
+            db_path = Path(tmp) / name
+            with package.open(name) as src, db_path.open("wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+
+            conn = sqlite3.connect(db_path.as_uri() + "?mode=ro&immutable=1", uri=True)
+            try:
+                yield conn
+            finally:
+                conn.close()
+
+def deck_names(conn: sqlite3.Connection) -> dict[int, str]:
+    """Anki deck ids to names, subdecks as Parent::Child."""
+    has_table = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'decks'").fetchone()
+    if has_table:
+        # Schema 18+, nesting is stored with the field separator
+        return {did: name.replace(FIELD_SEP, "::") for did, name in conn.execute("SELECT id, name FROM decks")}
+    (decks,) = conn.execute("SELECT decks FROM col").fetchone()
+    return {int(did): deck["name"] for did, deck in json.loads(decks).items()}
+
+def notes(conn: sqlite3.Connection, fields: tuple[int, int] = (0, 1), levels: bool = False,
+          on_error: ErrorCallback | None = None) -> Iterator[tuple[int, Card]]:
+    """(Anki deck id, card) for every note, grouped by deck. Notes without
+    the term field, or with nothing in it, go to `on_error` by note id."""
+    term_field, def_field = fields
+    needed = max(fields)
+    cursor = conn.execute(_NOTES_QUERY)
+    while batch := cursor.fetchmany(BATCH):
+        for note_id, flds, deck_id, level in batch:
+            values = flds.split(FIELD_SEP, needed + 1)
+            if len(values) <= needed:
+                if on_error is not None:
+                    on_error(note_id, f"note has {len(values)} field(s), needs {needed + 1}")
+                continue
+            term = clean_field(values[term_field])
+            if not term:
+                if on_error is not None:
+                    on_error(note_id, "empty term")
+                continue
+            yield deck_id, Card(term, clean_field(values[def_field]), level if levels else 0)
+
+def decks(conn: sqlite3.Connection, fields: tuple[int, int] = (0, 1), levels: bool = False,
+          on_error: ErrorCallback | None = None) -> Iterator[tuple[str, Iterator[Card]]]:
+    """(Anki deck name, its cards) for every deck with notes in it. Each
+    deck's cards must be used up before moving on to the next deck."""
+    names = deck_names(conn)
+    for deck_id, group in itertools.groupby(notes(conn, fields, levels, on_error), key=lambda note: note[0]):
+        yield names.get(deck_id, f"Anki deck {deck_id}"), (card for _, card in group)
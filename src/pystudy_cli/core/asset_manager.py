@@ -10,33 +10,182 @@
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 
-"""File to manage core assets"""
+"""File to manage core assets
 
-import pygame as pg
+Assets are listed in assets/manifest.json and decoded lazily the first time
+they are accessed (e.g. `sounds.click`). `preload()` can decode them on a
+background thread instead. Decoding happens outside the bank's lock, so a
+`get` from the main thread never waits on the preloader decoding some
+other asset. Decoded assets are kept in an LRU cache with a memory budget,
+and an asset that is missing or fails to decode is replaced by a silent
+placeholder rather than crashing the GUI.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
 
 from pystudy_cli.core import paths
+from pystudy_cli.core.memory import accountant
+
+# pygame is only imported when an asset is actually loaded, so that
+# importing core never pulls in pygame/SDL for the TUI
+if TYPE_CHECKING:
+    import pygame as pg
+
+DEFAULT_ASSET_BUDGET = 64 * 1024 * 1024  # bytes of decoded data per bank
 
 
+def load_manifest(path: Path = paths.ASSET_MANIFEST) -> dict[str, dict[str, str]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
 class AssetBank:
-    def __init__(self) -> None:
+    """Lazily loaded, size-capped collection of assets from one manifest section."""
+
+    MANIFEST_SECTION: str = ""
+
+    def __init__(self, manifest: dict[str, dict[str, str]] | None = None,
+                 budget: int = DEFAULT_ASSET_BUDGET) -> None:
         """Base method to set assets."""
+        if manifest is None:
+            manifest = load_manifest()
+        self._entries: dict[str, str] = dict(manifest.get(self.MANIFEST_SECTION, {}))
+        self._cache: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._loading: dict[str, threading.Event] = {}  # Set when that asset's decode finishes
+        self._lock = threading.Lock()  # Only for the cache, never held while decoding
+        self.budget = budget
+        accountant.register("cache", f"assets: {self.MANIFEST_SECTION}", lambda: self.nbytes, lambda: self.budget)
+        self.nbytes = 0
+        self.failed: dict[str, str] = {}  # Asset name -> reason it fell back to a placeholder
         self.augment()
 
     def augment(self) -> None:
         """Base method to adjust assets."""
         pass
 
-    def _load(self) -> None:
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes that don't exist normally, i.e. asset names
+        entries = self.__dict__.get("_entries", {})
+        if name in entries:
+            return self.get(name)
+        raise AttributeError(f"{type(self).__name__} has no asset '{name}'")
+
+    def names(self) -> list[str]:
+        return list(self._entries)
+
+    def get(self, name: str) -> Any:
+        while True:
+            with self._lock:
+                cached = self._cache.get(name)
+                if cached is not None:
+                    self._cache.move_to_end(name)
+                    return cached[0]
+                in_flight = self._loading.get(name)
+                if in_flight is None:
+                    done = self._loading[name] = threading.Event()
+                    break
+            # Another thread is decoding this one, use its result (or decode
+            # it again if it was evicted straight away)
+            in_flight.wait()
+
+        try:
+            try:
+                asset = self._load(paths.ASSETS_DIR / self._entries[name])
+                size = self._sizeof(asset)
+            except Exception as e:
+                self.failed[name] = str(e)
+                asset, size = self._placeholder(), 0
+
+            with self._lock:
+                self._cache[name] = (asset, size)
+                self.nbytes += size
+
+                # Evict least recently used assets, they're decoded again on next access
+                while self.nbytes > self.budget and len(self._cache) > 1:
+                    _, (_, evicted_size) = self._cache.popitem(last=False)
+                    self.nbytes -= evicted_size
+        finally:
+            with self._lock:
+                del self._loading[name]
+            done.set()
+        return asset
+
+    def preload(self, names: Iterable[str] | None = None) -> threading.Thread:
+        """Decodes assets on a background daemon thread and returns it. Stops
+        once the budget is used up, rather than evicting what it just loaded."""
+        to_load = list(self._entries if names is None else names)
+
+        def _worker() -> None:
+            for name in to_load:
+                if self.nbytes >= self.budget:
+                    break
+                self.get(name)
+
+        thread = threading.Thread(target=_worker, name=f"{type(self).__name__}-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def _load(self, path: Path) -> Any:
         """Base method to load individual assets."""
         raise NotImplementedError
 
+    def _placeholder(self) -> Any:
+        """Base method for the stand-in used when an asset can't be loaded."""
+        raise NotImplementedError
+
+    def _sizeof(self, asset: Any) -> int:
+        """Base method to estimate the decoded size of an asset in bytes."""
+        return 0
+
+class SilentSound:
+    """Placeholder with the parts of the pg.mixer.Sound API the GUI uses."""
+
+    def play(self, *args, **kwargs) -> None:
+        return None
+
+    def stop(self) -> None:
+        pass
+
+    def fadeout(self, ms: int) -> None:
+        pass
+
+    def set_volume(self, value: float) -> None:
+        pass
+
+    def get_volume(self) -> float:
+        return 0.0
+
+    def get_length(self) -> float:
+        return 0.0
+
 class Sounds(AssetBank):
-    def __init__(self) -> None:
-        self.wrong_answer = self._load("wrong_answer.ogg")
-        self.correct_answer = self._load("correct_answer.ogg")
-        self.click = self._load("button_click.ogg")
+    MANIFEST_SECTION = "sounds"
 
-        self.augment()
+    # Declared for type checkers, resolved lazily through the manifest
+    if TYPE_CHECKING:
+        wrong_answer: pg.mixer.Sound
+        correct_answer: pg.mixer.Sound
+        click: pg.mixer.Sound
+
+    def _load(self, path: Path) -> pg.mixer.Sound:
+        import pygame as pg
+        return pg.mixer.Sound(path)
+
+    def _placeholder(self) -> SilentSound:
+        return SilentSound()
 
-    def _load(self, name: str) -> pg.mixer.Sound:
-        return pg.mixer.Sound(paths.SOUNDS_DIR / name)
+    def _sizeof(self, asset: pg.mixer.Sound) -> int:
+        import pygame as pg
+        mixer = pg.mixer.get_init()
+        if mixer is None:
+            return 0
+        frequency, fmt, channels = mixer
+        return int(asset.get_length() * frequency * channels * (abs(fmt) // 8))
@@ -12,19 +12,18 @@
 
 from typing import TypeAlias
 
-import pygame as pg
-
 Colour: TypeAlias = tuple[int, int, int]
 AColour: TypeAlias = tuple[int, int, int, int]
 
 RealNumber: TypeAlias = int | float
 Coord2: TypeAlias = tuple[RealNumber, RealNumber]
 DiscreteCoord2: TypeAlias = tuple[int, int]
-Surface: TypeAlias = pg.Surface
 
 JSONValue: TypeAlias = (
     str | int | float | bool | None |
     list["JSONValue"] |
     dict[str, "JSONValue"]
 )
-JSONObject: TypeAlias = dict[str, JSONValue]
\ No newline at end of file
+JSONObject: TypeAlias = dict[str, JSONValue]
+# (inode, mtime_ns, size) of a data file as it was last read or written, see data_manager
+Revision: TypeAlias = tuple[int, int, int]
@@ -13,18 +13,24 @@
 """File manager for local user data"""
 
 import json
+import os
 import re
 import uuid
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
-from typing import Iterable
+from typing import IO, Iterable
 
-from pystudy_cli.core import paths
+from pystudy_cli.core import library, locking, paths, snapshot
+from pystudy_cli.core.diagnostics import diagnostics
+from pystudy_cli.core.custom_types import Revision
+from pystudy_cli.core.exceptions import LockTimeoutError, SaveConflictError
 from pystudy_cli.core.profile import StudyProfile
-from pystudy_cli.core.objects import JSONObject, ConfigObject, Deck
+from pystudy_cli.core.tracing import traced, tracer
+from pystudy_cli.core.objects import JSONObject, ConfigObject, Card, Deck
 from pystudy_cli.core.constants import VERSION_NUM
 
+STREAM_CHUNK = 1000  # Cards per write in save_new_decks
 
 class LoadStatCategory(Enum):
     SUCCESS = auto()
@@ -53,63 +59,144 @@ def make_deck_filename(name: str, existing: Iterable[str] | None = None) -> str:
         if filename not in existing_set:
             return filename
 
-def write_json_atomic(path: Path, data: JSONObject) -> None:
+def decks_dir_for(head_path: Path) -> Path:
+    """Deck files live in a `decks` directory next to the head file."""
+    return head_path.parent / "decks"
+
+def write_json_atomic(path: Path, data: JSONObject) -> str:
     """Helper to write JSON data to a file.
     Writes to a temporary file first to avoid
     data truncation or corruption if the program errors
-    mid-write."""
+    mid-write. Returns the content hash of what was written."""
 
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
-    tmp.replace(path)
+    with tracer.span("write_json_atomic", path.name):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        encoded = json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+        with tmp.open("wb") as f:
+            f.write(encoded)
+        tmp.replace(path)
+        return snapshot.file_digest(encoded)
 
 def trash_deck(path: Path) -> None:
-    trash_dir = paths.TRASH_DIR
-    trash_dir.mkdir(parents=True, exist_ok=True)
-    target = trash_dir / path.name
-    if target.exists():
-        target = trash_dir / f"{path.stem}-{uuid.uuid4().hex[:8]}{path.suffix}"
-    path.replace(target)
-
-def save_profile(data: StudyProfile, path: Path = paths.DATA_DIR / "save_data.json") -> str | None:
-    """Returns None if success, else return error description."""
+    with tracer.span("trash_deck", path.name):
+        trash_dir = path.parent / "trash"
+        trash_dir.mkdir(parents=True, exist_ok=True)
+        target = trash_dir / path.name
+        if target.exists():
+            target = trash_dir / f"{path.stem}-{uuid.uuid4().hex[:8]}{path.suffix}"
+        path.replace(target)
+
+def file_revision(path: Path) -> Revision | None:
+    """Identifies the current version of a data file, None if it doesn't exist.
+    Every save replaces the file, so any write by anyone changes this."""
     try:
-        paths.DECKS_DIR.mkdir(parents=True, exist_ok=True)
-        deck_filenames = []
-        for deck in data.decks:
-            if not deck.filename:
-                raise ValueError(f"deck '{deck.name}' is missing a filename")
-            deck_filenames.append(deck.filename)
-            write_json_atomic(paths.DECKS_DIR / deck.filename, deck.to_json())
-
-        # Move stale deck files not referenced by the head file to trash
-        existing_files = {p.name for p in paths.DECKS_DIR.glob("*.json")}
-        for stale in existing_files - set(deck_filenames):
-            trash_deck(paths.DECKS_DIR / stale)
-
-        write_json_atomic(path, data.to_json())
-
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+def _open_revision(f: IO) -> Revision:
+    """Revision of an open file, i.e. exactly the version being read."""
+    stat = os.fstat(f.fileno())
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+def find_conflicts(data: StudyProfile, path: Path) -> list[str]:
+    """Files of this profile that changed on disk since they were loaded
+    (or last saved) by this session, i.e. another session wrote them."""
+    decks_dir = decks_dir_for(path)
+    conflicts = [path.name] if file_revision(path) != data.revision else []
+    conflicts += [deck.name for deck in data.decks if file_revision(decks_dir / deck.filename) != deck.revision]
+    return conflicts
+
+@traced("save_profile")
+def save_profile(data: StudyProfile, path: Path | None = None, force: bool = False) -> str | None:
+    """Returns None if success, else return error description.
+
+    Refuses to overwrite anything another session saved since this one
+    loaded the profile, unless `force` is set."""
+    path = path or paths.save_file()
+    decks_dir = decks_dir_for(path)
+    try:
+        with locking.profile_lock(path):
+            if not force and (conflicts := find_conflicts(data, path)):
+                raise SaveConflictError("changed by another session since they were loaded: " + ", ".join(conflicts))
+            _write_profile(data, path, decks_dir)
+    except (SaveConflictError, LockTimeoutError) as e:
+        diagnostics.warning("save_refused", path=str(path), error=str(e))
+        return str(e)  # Nothing was written
     except Exception as e:
+        diagnostics.warning("save_failed", path=str(path), error=repr(e))
+        snapshot.invalidate(path)
         return str(e)
-
     return None
 
-def load_profile(path = paths.DATA_DIR / "save_data.json") -> tuple[StudyProfile, LoadStatus]:
+def _write_profile(data: StudyProfile, path: Path, decks_dir: Path) -> None:
+    """Writes every deck, then the head file, then the snapshot. The caller holds the profile lock."""
+    decks_dir.mkdir(parents=True, exist_ok=True)
+    deck_filenames = []
+    deck_digests = []
+    for deck in data.decks:
+        if not deck.filename:
+            raise ValueError(f"deck '{deck.name}' is missing a filename")
+        deck_filenames.append(deck.filename)
+        deck_digests.append(write_json_atomic(decks_dir / deck.filename, deck.to_json()))
+        deck.revision = file_revision(decks_dir / deck.filename)
+
+    # Move stale deck files not referenced by the head file to trash. The head
+    # file is unchanged since this session loaded it (or the save was forced),
+    # so these really are decks this session deleted
+    existing_files = {p.name for p in decks_dir.glob("*.json")}
+    for stale in existing_files - set(deck_filenames):
+        trash_deck(decks_dir / stale)
+
+    head_digest = write_json_atomic(path, data.to_json())
+    data.revision = file_revision(path)
+
+    # Snapshot of exactly what was just written, for fast startup next time
+    try:
+        sources = [snapshot.source_file(path, head_digest)] + [
+            snapshot.source_file(decks_dir / filename, digest)
+            for filename, digest in zip(deck_filenames, deck_digests)
+        ]
+    except OSError:
+        snapshot.invalidate(path)
+    else:
+        snapshot.save(path, data, sources)
+
+@traced("load_profile")
+def load_profile(path: Path | None = None, library_dir: Path | None = None) -> tuple[StudyProfile, LoadStatus]:
     """
     Load data from save files.
     """
+    path = path or paths.save_file()
+    try:
+        with locking.profile_lock(path, shared=True):
+            profile, status = _load_profile(path, library_dir)
+    except LockTimeoutError as e:
+        profile, status = StudyProfile(VERSION_NUM, "", [], ConfigObject()), LoadStatus(LoadStatCategory.ERROR, str(e))
+
+    if status.category not in (LoadStatCategory.SUCCESS, LoadStatCategory.NEW):
+        diagnostics.warning("load_" + status.category.name.lower(), path=str(path), msg=status.msg)
+    return profile, status
 
+def _load_profile(path: Path, library_dir: Path | None) -> tuple[StudyProfile, LoadStatus]:
     msg = None
 
+    # Fast path: restore from the startup snapshot if nothing changed on disk
+    cached = snapshot.load(path)
+    if cached is not None:
+        return cached, LoadStatus(LoadStatCategory.SUCCESS, "")
+
     try:
         with open(path, "r", encoding="utf-8") as f:
+            revision = _open_revision(f)
             raw_data: JSONObject = json.load(f)
 
         name = str(raw_data.get("name", ""))
         version = str(raw_data.get("version", VERSION_NUM))
         config = ConfigObject.from_json(raw_data.get("config", {}))
+        last_studied = raw_data.get("last_studied")
 
         decks: list[Deck] = []
         errors: list[str] = []
@@ -121,7 +208,7 @@ def load_profile(path = paths.DATA_DIR / "save_data.json") -> tuple[StudyProfile
             deck_files = [str(f) for f in deck_files_raw]
             for filename in deck_files:
                 try:
-                    decks.append(load_deck(filename))
+                    decks.append(load_deck(filename, decks_dir_for(path), library_dir))
                 except Exception as e:
                     errors.append(f"{filename}: {e}")
         elif "decks" in raw_data:
@@ -134,7 +221,7 @@ def load_profile(path = paths.DATA_DIR / "save_data.json") -> tuple[StudyProfile
                 existing.add(filename)
                 decks.append(Deck.from_json(deck_data, filename))  # type: ignore
 
-        profile = StudyProfile(version, name, decks, config)
+        profile = StudyProfile(version, name, decks, config, str(last_studied) if last_studied else None, revision)
         category = LoadStatCategory.SUCCESS if not errors else LoadStatCategory.PARTIAL
         if errors:
             msg = "Some deck files could not be loaded: " + "; ".join(errors)
@@ -144,21 +231,103 @@ def load_profile(path = paths.DATA_DIR / "save_data.json") -> tuple[StudyProfile
         category = LoadStatCategory.NEW
 
     except json.JSONDecodeError:
-        profile = StudyProfile(VERSION_NUM, "", [], ConfigObject())
+        # Saving over a corrupt file is allowed, it isn't another session's work
+        profile = StudyProfile(VERSION_NUM, "", [], ConfigObject(), revision=file_revision(path))
         category = LoadStatCategory.CORRUPT
 
     except Exception as e:
-        profile = StudyProfile(VERSION_NUM, "", [], ConfigObject())
+        profile = StudyProfile(VERSION_NUM, "", [], ConfigObject(), revision=file_revision(path))
         category = LoadStatCategory.ERROR
         msg = str(e)
 
     return profile, LoadStatus(category, msg if msg is not None else "")
 
-def save_deck(deck: Deck, filename: str):
-    write_json_atomic(paths.DECKS_DIR / filename, deck.to_json())
+@traced("save_deck")
+def save_deck(deck: Deck, head_path: Path | None = None, force: bool = False) -> str | None:
+    """Saves one deck of a profile, leaving the head file and other decks
+    alone, so sessions working on different decks don't conflict. The deck
+    must already be listed in the head file. Returns None if success, else
+    return error description."""
+    head_path = head_path or paths.save_file()
+    path = decks_dir_for(head_path) / deck.filename
+    try:
+        with locking.profile_lock(head_path, shared=True), locking.deck_lock(head_path, deck.filename):
+            if not force and file_revision(path) != deck.revision:
+                raise SaveConflictError(f"'{deck.name}' was changed by another session since it was loaded")
+            write_json_atomic(path, deck.to_json())
+            deck.revision = file_revision(path)
+    except Exception as e:
+        diagnostics.warning("save_deck_failed", path=str(path), error=repr(e))
+        return str(e)
+    return None
+
+def _write_deck_stream(path: Path, deck: Deck, cards: Iterable[Card]) -> None:
+    """Writes a deck file from `cards`, a chunk at a time."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with tracer.span("write_deck_stream", path.name), tmp.open("w", encoding="utf-8") as f:
+            header = json.dumps({"creation_date": deck.creation_date, "name": deck.name}, ensure_ascii=False)
+            f.write(header[:-1] + ', "cards": [')
+            count = 0
+            chunk: list[JSONObject] = []
+            for card in cards:
+                chunk.append({"term": card.term, "def_": card.def_, "familiarity_level": card.familiarity_level})
+                if len(chunk) >= STREAM_CHUNK:
+                    # One dumps call per chunk, without the list's brackets
+                    f.write(("," if count else "") + json.dumps(chunk, ensure_ascii=False)[1:-1])
+                    count += len(chunk)
+                    chunk.clear()
+            if chunk:
+                f.write(("," if count else "") + json.dumps(chunk, ensure_ascii=False)[1:-1])
+            f.write("]}\n")
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+@traced("save_new_decks")
+def save_new_decks(data: StudyProfile, new_decks: Iterable[tuple[Deck, Iterable[Card]]],
+                   head_path: Path | None = None, force: bool = False) -> str | None:
+    """Writes new decks straight from iterables of cards, a chunk at a time,
+    then the head file listing them. For imports too big to hold in memory:
+    the cards are consumed lazily and never all loaded at once. Each deck
+    must be added to the profile (with no cards) by the time its cards are
+    used up, `new_decks` can do that as it goes. Returns None if success,
+    else return error description.
+
+    The decks stay empty in memory and keep no revision, so this profile
+    can't be saved over the new files by mistake. Load it again to use them."""
+    head_path = head_path or paths.save_file()
+    decks_dir = decks_dir_for(head_path)
+    written: list[Path] = []  # Deleted again if the head file never lists them
+    try:
+        with locking.profile_lock(head_path):
+            if not force and (conflicts := find_conflicts(data, head_path)):
+                raise SaveConflictError("changed by another session since they were loaded: " + ", ".join(conflicts))
+
+            decks_dir.mkdir(parents=True, exist_ok=True)
+            for deck, cards in new_decks:
+                path = decks_dir / deck.filename
+                if path.exists():
+                    raise FileExistsError(f"deck file {deck.filename} already exists")
+                _write_deck_stream(path, deck, cards)
+                written.append(path)
+
+            write_json_atomic(head_path, data.to_json())
+            written.clear()
+            data.revision = file_revision(head_path)
+            snapshot.invalidate(head_path)
+    except (SaveConflictError, LockTimeoutError) as e:
+        diagnostics.warning("save_refused", path=str(head_path), error=str(e))
+        return str(e)
+    except Exception as e:
+        diagnostics.warning("save_deck_failed", path=str(head_path), error=repr(e))
+        for path in written:
+            path.unlink(missing_ok=True)
+        return str(e)
+    return None
 
-def load_deck(filename: str) -> Deck:
-    path = paths.DECKS_DIR / filename
+def load_deck(filename: str, decks_dir: Path | None = None, library_dir: Path | None = None) -> Deck:
+    path = (decks_dir or paths.DECKS_DIR) / filename
 
     if not path.exists():
         raise FileNotFoundError("deck file doesn't exist")
@@ -166,5 +335,10 @@ def load_deck(filename: str) -> Deck:
     if path.is_dir():
         raise IsADirectoryError("this is a directory")
 
-    with open(path, "r", encoding="utf-8") as f:
-        return Deck.from_json(json.load(f), filename)
+    with tracer.span("load_deck", filename):
+        with open(path, "r", encoding="utf-8") as f:
+            revision = _open_revision(f)
+            data = json.load(f)
+        deck = library.load_deck(data, filename, library_dir) if "library" in data else Deck.from_json(data, filename)
+    deck.revision = revision
+    return deck
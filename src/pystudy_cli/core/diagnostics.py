@@ -0,0 +1,232 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Diagnostics log: crashes and non-fatal events (partial loads, failed or
+retried saves) as JSON lines in LOG_DIR/diagnostics.log.
+
+    diagnostics.event("save_retry", force=True)
+    diagnostics.warning("load_partial", path=str(path), msg=status.msg)
+
+The log is capped at MAX_BYTES per file. Full files are rotated and
+gzipped, and only BACKUP_COUNT old segments are kept. Recording an event
+only formats it and puts it on a queue; a background thread writes,
+rotates and compresses. The logging machinery is set up on the first
+event, so a session where nothing goes wrong never even imports it.
+
+Every process on the data directory (TUI sessions, `serve`, batch
+commands) appends to the same file. Each write and rotation happens under
+`locking.log_lock`, and a process reopens the file when another one has
+rotated it away. Failing to write an entry drops it silently.
+
+Crashes (see `install`) are written the same way and flushed before exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import sys
+import threading
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pystudy_cli.core import paths
+from pystudy_cli.core.terminal import terminal
+
+if TYPE_CHECKING:
+    import logging
+    import logging.handlers
+
+LOG_NAME = "diagnostics.log"
+MAX_BYTES = 256 * 1024
+BACKUP_COUNT = 4  # Compressed, so all of them together are a fraction of MAX_BYTES
+
+
+def _gzip_rotate(source: str, dest: str) -> None:
+    import gzip
+    import os
+    import shutil
+
+    try:
+        with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(source)
+    except FileNotFoundError:
+        pass  # Already rotated away (only possible without fcntl locks)
+
+def _shared_file_handler(path: Path) -> logging.handlers.RotatingFileHandler:
+    """RotatingFileHandler for a log that other processes append to as well."""
+    import logging
+    import logging.handlers
+    import os
+
+    from pystudy_cli.core import locking
+
+    class SharedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+        def _reopen_if_moved(self) -> None:
+            if self.stream is None:
+                return
+            try:
+                moved = os.stat(self.baseFilename).st_ino != os.fstat(self.stream.fileno()).st_ino
+            except FileNotFoundError:
+                moved = True
+            if moved:
+                # Another process rotated it, keep writing to the new file
+                self.stream.close()
+                self.stream = None  # type: ignore[assignment]
+
+        def emit(self, record: logging.LogRecord) -> None:
+            try:
+                with locking.log_lock(path):
+                    self._reopen_if_moved()
+                    if self.shouldRollover(record):
+                        self.doRollover()
+                    logging.FileHandler.emit(self, record)
+            except Exception:
+                self.handleError(record)
+
+        def handleError(self, record: logging.LogRecord) -> None:
+            pass  # Never print logging errors over the TUI, the entry is just lost
+
+    handler = SharedRotatingFileHandler(path, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT,
+                                        encoding="utf-8", delay=True)
+    handler.namer = lambda name: name + ".gz"
+    handler.rotator = _gzip_rotate
+    return handler
+
+
+class DiagnosticsLog:
+    """Structured, size-capped log written by a background thread."""
+
+    def __init__(self) -> None:
+        self._logger: logging.Logger | None = None
+        self._listener: logging.handlers.QueueListener | None = None
+        self._setup_lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return paths.LOG_DIR / LOG_NAME
+
+    def _get_logger(self) -> logging.Logger:
+        with self._setup_lock:
+            if self._logger is not None:
+                return self._logger
+
+            import logging
+            import logging.handlers
+            import queue
+
+            paths.LOG_DIR.mkdir(parents=True, exist_ok=True)
+            file_handler = _shared_file_handler(self.path)
+
+            records: queue.SimpleQueue = queue.SimpleQueue()
+            queue_handler = logging.handlers.QueueHandler(records)
+            queue_handler.setFormatter(_JSONFormatter())  # Formats in the caller, the JSON line is what's queued
+
+            logger = logging.getLogger("pystudy.diagnostics")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            logger.addHandler(queue_handler)
+
+            self._listener = logging.handlers.QueueListener(records, file_handler)
+            self._listener.start()
+            atexit.register(self.close)
+            self._logger = logger
+            return logger
+
+    def _log(self, level: int, name: str, fields: dict[str, Any], exc_info: Any = None) -> None:
+        try:
+            self._get_logger().log(level, name, exc_info=exc_info, extra={"fields": fields})
+        except Exception:
+            pass  # Diagnostics must never take the app down with them
+
+    def event(self, name: str, **fields: Any) -> None:
+        self._log(20, name, fields)  # logging.INFO, without importing logging
+
+    def warning(self, name: str, **fields: Any) -> None:
+        self._log(30, name, fields)
+
+    def crash(self, exc_type, exc_value, exc_tb) -> None:
+        self._log(50, "crash", {}, (exc_type, exc_value, exc_tb))
+        self.close()
+
+    def close(self) -> None:
+        """Writes everything still queued. Safe to call more than once."""
+        with self._setup_lock:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+            if self._logger is not None:
+                for handler in self._logger.handlers:
+                    handler.close()
+
+
+class _JSONFormatter:
+    """One JSON object per line: time, level, event, pid, the event's fields
+    and the traceback if there is one."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "event": record.getMessage(),
+            "pid": record.process,
+            **getattr(record, "fields", {}),
+        }
+        if record.exc_info:
+            entry["traceback"] = "".join(traceback.format_exception(*record.exc_info))
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+diagnostics = DiagnosticsLog()
+
+
+# Store the original excepthook
+original_excepthook = sys.excepthook
+
+def custom_excepthook(exc_type, exc_value, exc_tb):
+    """
+    Custom exception hook to log unhandled exceptions to the diagnostics
+    log, ignoring KeyboardInterrupt and EOFError.
+    """
+
+    # Excepthook has its own copy of the colour function
+    def col(code: int, bg: bool = False): # 256 colours
+        return f"\033[{48 if bg else 38};5;{code}m"
+
+    # Ignore user-initiated exits
+    if issubclass(exc_type, (KeyboardInterrupt, EOFError)):
+        # Call the original hook to preserve default exit behavior
+        original_excepthook(exc_type, exc_value, exc_tb)
+        sys.exit(1)
+
+    diagnostics.crash(exc_type, exc_value, exc_tb)
+
+    # Terminal width for the separator (cached, falls back if not a tty)
+    separator = "=" * terminal.columns
+    formatted_traceback = "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
+
+    # Also print to stderr so the user sees the error in the console
+    print(f"\n{col(197)}!{col(189)}  Oops, something went wrong!")
+    print(f"{col(220)}i{col(189)}  The error was recorded in {diagnostics.path}")
+    print(f"{col(220)}i{col(189)}  For support, contact Louis @ <...> and attach that file.")  # TODO: add contact
+    print(f"\n{col(220)}i{col(189)}  Full traceback (for nerds)")
+    print(f"{col(146)}{separator}\n{formatted_traceback}{separator}\n", file=sys.stderr)
+
+    sys.exit(1)
+
+def install():
+    """Assigns the custom exception hook to sys.excepthook."""
+    sys.excepthook = custom_excepthook
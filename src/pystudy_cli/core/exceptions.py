@@ -25,5 +25,9 @@ class DeckError(ApplicationError):
 
 class SaveError(DataManagementError): pass
 class LoadError(DataManagementError): pass
+class SaveConflictError(SaveError): pass
+class ImportFormatError(LoadError): pass
+class LockTimeoutError(DataManagementError): pass
 class DeckNotFoundError(DeckError): pass
 class DeckExistsError(DeckError): pass
+class ReadOnlyDeckError(DeckError): pass
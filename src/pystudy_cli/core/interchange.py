@@ -0,0 +1,135 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Delimited text cards, read and written a row at a time.
+
+    csv     quoted, comma separated. An optional header row names the
+            columns (term, definition, familiarity_level, anything else
+            is ignored), without one they're term,definition[,level]
+    tsv     the same with tabs
+    text    what Quizlet and most flashcard apps export: one card per
+            line (or per card separator), term and definition split at the
+            first delimiter (a tab by default), no quoting or header
+
+Readers yield cards and report malformed rows through `on_error` instead
+of stopping, so one bad line doesn't lose a million good ones.
+"""
+
+import csv
+from typing import Callable, Iterable, Iterator, TextIO
+
+from pystudy_cli.core.constants import FAMILIARITY_LEVELS
+from pystudy_cli.core.objects import Card
+
+FORMATS = ("csv", "tsv", "text")
+DELIMITERS = {"csv": ",", "tsv": "\t", "text": "\t"}
+SUFFIXES = {".csv": "csv", ".tsv": "tsv", ".txt": "text"}
+READ_CHUNK = 1 << 16  # Characters, when splitting on a custom card separator
+WRITE_CHUNK = 1000    # Rows per write
+
+ErrorCallback = Callable[[int, str], None]
+
+_COLUMNS = {
+    "term": "term",
+    "definition": "definition", "def": "definition", "def_": "definition",
+    "familiarity_level": "level", "level": "level",
+}
+
+
+def parse_level(value: str) -> int:
+    level = int(value)
+    if level not in FAMILIARITY_LEVELS:
+        raise ValueError(f"familiarity level {level} out of range")
+    return level
+
+def _header(row: list[str]) -> dict[str, int] | None:
+    """Column positions if row is a header naming at least the term column."""
+    columns: dict[str, int] = {}
+    for i, cell in enumerate(row):
+        key = _COLUMNS.get(cell.strip().lower())
+        if key is not None:
+            columns.setdefault(key, i)
+    return columns if "term" in columns else None
+
+def _read_table(f: TextIO, delimiter: str, on_error: ErrorCallback) -> Iterator[Card]:
+    columns = {"term": 0, "definition": 1, "level": 2}
+    term_col, def_col, level_col = 0, 1, 2
+    for line_no, row in enumerate(csv.reader(f, delimiter=delimiter), start=1):
+        if line_no == 1 and (header := _header(row)) is not None:
+            columns = header
+            term_col, def_col, level_col = columns["term"], columns.get("definition", -1), columns.get("level", -1)
+            continue
+        if len(row) <= max(term_col, def_col) or not row[term_col].strip():
+            if any(cell.strip() for cell in row):  # Blank lines are just skipped
+                on_error(line_no, f"expected columns {', '.join(columns)}")
+            continue
+        try:
+            level = parse_level(row[level_col]) if 0 <= level_col < len(row) and row[level_col].strip() else 0
+        except ValueError as e:
+            on_error(line_no, str(e))
+            continue
+        yield Card(row[term_col].strip(), row[def_col].strip() if def_col >= 0 else "", level)
+
+def _split(f: TextIO, separator: str) -> Iterator[str]:
+    """Records of f separated by separator, read a chunk at a time."""
+    if separator == "\n":
+        for line in f:
+            yield line.rstrip("\r\n")
+        return
+
+    pending = ""
+    while chunk := f.read(READ_CHUNK):
+        records = (pending + chunk).split(separator)
+        pending = records.pop()
+        yield from records
+    if pending:
+        yield pending
+
+def _read_text(f: TextIO, delimiter: str, card_separator: str, on_error: ErrorCallback) -> Iterator[Card]:
+    for record_no, record in enumerate(_split(f, card_separator), start=1):
+        if not record.strip():
+            continue
+        term, found, definition = record.partition(delimiter)
+        if not found or not term.strip():
+            on_error(record_no, f"expected a term and definition separated by {delimiter!r}")
+            continue
+        yield Card(term.strip(), definition.strip())
+
+def read_cards(f: TextIO, fmt: str, on_error: ErrorCallback, delimiter: str | None = None,
+               card_separator: str = "\n") -> Iterator[Card]:
+    """Cards from f, lazily. Errors are reported by line (record for text) number."""
+    delimiter = delimiter or DELIMITERS[fmt]
+    if fmt == "text":
+        return _read_text(f, delimiter, card_separator, on_error)
+    if fmt in ("csv", "tsv"):
+        return _read_table(f, delimiter, on_error)
+    raise ValueError(f"unknown format: {fmt}")
+
+def write_text(f: TextIO, cards: Iterable[Card], delimiter: str = "\t", card_separator: str = "\n") -> int:
+    """Writes cards in the text format. The format can't escape anything, so
+    separators inside a term or definition become spaces. Returns how many
+    cards had to be changed like that."""
+    changed = 0
+    chunk: list[str] = []
+    for card in cards:
+        term, definition = card.term, card.def_
+        if any(sep in term or sep in definition for sep in (delimiter, card_separator)):
+            for sep in (delimiter, card_separator):
+                term, definition = term.replace(sep, " "), definition.replace(sep, " ")
+            changed += 1
+        chunk.append(f"{term}{delimiter}{definition}{card_separator}")
+        if len(chunk) >= WRITE_CHUNK:
+            f.write("".join(chunk))
+            chunk.clear()
+    f.write("".join(chunk))
+    return changed
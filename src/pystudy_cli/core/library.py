@@ -0,0 +1,255 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Shared read-only deck library.
+
+When a class studies the same curriculum, every profile used to keep its
+own copy of every card. A library deck stores the card text once, in an
+immutable file under LIBRARY_DIR that is named after a hash of its
+content, so publishing the same deck from many profiles ends up with one
+file. The profile's deck file then only holds an overlay: the deck name,
+creation date, the library file it uses and one familiarity level per card.
+
+Library files are memory-mapped, not parsed. Card text is decoded on
+access, and the pages are the OS's file cache, so every process reading
+the same library deck shares them instead of holding its own strings.
+
+File layout (integers are little endian):
+    MAGIC | header length (8 bytes) | header JSON | padding to 8 bytes
+    | card offsets (2 * cards + 1, 8 bytes each) | UTF-8 text
+Card i's term is text[offsets[2i]:offsets[2i+1]], its definition
+text[offsets[2i+1]:offsets[2i+2]].
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterator, Sequence, overload
+
+from pystudy_cli.core import paths
+from pystudy_cli.core.exceptions import LoadError, ReadOnlyDeckError
+from pystudy_cli.core.memory import accountant
+from pystudy_cli.core.objects import Card, Deck, JSONObject
+
+MAGIC = b"PYSTUDY-LIBRARY1"
+LIBRARY_SUFFIX = ".lib"
+
+_OFFSET = struct.Struct("<Q")
+
+
+class LibraryFile:
+    """One memory-mapped library file. Use `libraries.open` to share them."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if self._mm[:len(MAGIC)] != MAGIC:
+                raise LoadError(f"{path.name} isn't a library file")
+            header_start = len(MAGIC) + _OFFSET.size
+            header_len, = _OFFSET.unpack_from(self._mm, len(MAGIC))
+            header = json.loads(self._mm[header_start:header_start + header_len])
+
+            self.title: str = header["title"]
+            self.count: int = header["cards"]
+            self._table = -(-(header_start + header_len) // 8) * 8
+            self._text = self._table + _OFFSET.size * (2 * self.count + 1)
+            text_len, = _OFFSET.unpack_from(self._mm, self._text - _OFFSET.size)
+            if self._text + text_len != len(self._mm):
+                raise LoadError(f"{path.name} is truncated")
+        except (LoadError, ValueError, KeyError, struct.error):
+            self._mm.close()
+            raise
+
+        # Offsets are read straight out of the mapping where the byte order allows
+        self._offsets: Sequence[int]
+        if sys.byteorder == "little":
+            self._offsets = memoryview(self._mm)[self._table:self._text].cast("Q")
+        else:
+            offsets = array("Q", self._mm[self._table:self._text])
+            offsets.byteswap()
+            self._offsets = offsets
+
+    def term(self, index: int) -> str:
+        offsets, base = self._offsets, self._text
+        return self._mm[base + offsets[2 * index]:base + offsets[2 * index + 1]].decode("utf-8")
+
+    def definition(self, index: int) -> str:
+        offsets, base = self._offsets, self._text
+        return self._mm[base + offsets[2 * index + 1]:base + offsets[2 * index + 2]].decode("utf-8")
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._mm)
+
+    def close(self) -> None:
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._mm.close()
+
+
+class LibraryStore:
+    """Open library files by path, so every deck using one shares the mapping."""
+
+    def __init__(self) -> None:
+        self._files: dict[Path, LibraryFile] = {}
+
+    def open(self, path: Path) -> LibraryFile:
+        path = path.resolve()
+        file = self._files.get(path)
+        if file is None:
+            if not path.is_file():
+                raise FileNotFoundError(f"library file {path.name} doesn't exist")
+            file = self._files[path] = LibraryFile(path)
+        return file
+
+    def stats(self) -> dict[str, int]:
+        return {"files": len(self._files), "mapped_bytes": sum(f.nbytes for f in self._files.values())}
+
+    def close(self) -> None:
+        for file in self._files.values():
+            file.close()
+        self._files.clear()
+
+
+class LibraryCard(Card):
+    """A card of a library deck. Term and definition come from the library
+    file and can't be changed, the familiarity level is the profile's own."""
+
+    def __init__(self, cards: LibraryCards, index: int) -> None:
+        self._cards = cards
+        self._index = index
+
+    def _read_only(self, value: str) -> None:
+        raise ReadOnlyDeckError("library cards can't be edited, make a private copy of the deck first")
+
+    term = property(lambda self: self._cards.file.term(self._index), _read_only)  # type: ignore[assignment]
+    def_ = property(lambda self: self._cards.file.definition(self._index), _read_only)  # type: ignore[assignment]
+
+    @property  # type: ignore[override]
+    def familiarity_level(self) -> int:
+        return self._cards.levels[self._index]
+
+    @familiarity_level.setter
+    def familiarity_level(self, value: int) -> None:
+        self._cards.levels[self._index] = value
+
+
+class LibraryCards(Sequence[Card]):
+    """Cards of a library deck: the shared file plus this profile's levels.
+    Card objects are made on access and never kept."""
+
+    def __init__(self, file: LibraryFile, levels: array) -> None:
+        if len(levels) != file.count:
+            raise LoadError(f"{len(levels)} familiarity levels for {file.count} library cards")
+        self.file = file
+        self.levels = levels
+
+    def __len__(self) -> int:
+        return self.file.count
+
+    @overload
+    def __getitem__(self, index: int) -> Card: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[Card]: ...
+    def __getitem__(self, index: int | slice) -> Card | list[Card]:
+        if isinstance(index, slice):
+            return [LibraryCard(self, i) for i in range(*index.indices(self.file.count))]
+        if index < 0:
+            index += self.file.count
+        if not 0 <= index < self.file.count:
+            raise IndexError("library card index out of range")
+        return LibraryCard(self, index)
+
+    def __iter__(self) -> Iterator[Card]:
+        return (LibraryCard(self, i) for i in range(self.file.count))
+
+    def __reduce__(self):
+        return _reopen, (str(self.file.path), self.levels.tobytes())
+
+
+def _reopen(path: str, levels: bytes) -> LibraryCards:
+    return LibraryCards(libraries.open(Path(path)), array("b", levels))
+
+
+def encode(cards: Sequence[Card], title: str) -> bytes:
+    """Builds the contents of a library file."""
+    text = bytearray()
+    offsets = array("Q", [0])
+    for card in cards:
+        for value in (card.term, card.def_):
+            text += value.encode("utf-8")
+            offsets.append(len(text))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    header = json.dumps({"title": title, "cards": len(cards)}, ensure_ascii=False).encode("utf-8")
+    header += b" " * (-(len(MAGIC) + _OFFSET.size + len(header)) % 8)
+    return MAGIC + _OFFSET.pack(len(header)) + header + offsets.tobytes() + bytes(text)
+
+def write(cards: Sequence[Card], title: str, library_dir: Path | None = None) -> tuple[Path, bool]:
+    """Writes the library file for these cards unless an identical one exists.
+    Returns (path, whether it was created)."""
+    library_dir = library_dir or paths.LIBRARY_DIR
+    data = encode(cards, title)
+    path = library_dir / (hashlib.blake2b(data, digest_size=16).hexdigest() + LIBRARY_SUFFIX)
+    if path.is_file():
+        return path, False
+
+    library_dir.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return path, True
+
+def publish(deck: Deck, library_dir: Path | None = None) -> bool:
+    """Moves a deck's card text into the library, keeping its progress.
+    Returns whether a new library file was written."""
+    if deck.library is not None:
+        return False
+    path, created = write(deck.cards, deck.name, library_dir)
+    levels = array("b", (card.familiarity_level for card in deck.cards))
+    deck.cards = LibraryCards(libraries.open(path), levels)  # type: ignore[assignment]
+    deck.library = path.name
+    return created
+
+def make_private(deck: Deck) -> None:
+    """Turns a library deck back into an ordinary, editable deck."""
+    if deck.library is None:
+        return
+    deck.cards = [Card(card.term, card.def_, card.familiarity_level) for card in deck.cards]
+    deck.library = None
+
+def load_deck(data: JSONObject, filename: str, library_dir: Path | None = None) -> Deck:
+    """Builds a library deck from its overlay in a profile's deck file."""
+    assert isinstance(data["name"], str)
+    assert isinstance(data["creation_date"], str)
+    assert isinstance(data["library"], str)
+    assert isinstance(data["levels"], list)
+
+    file = libraries.open((library_dir or paths.LIBRARY_DIR) / data["library"])
+    cards = LibraryCards(file, array("b", data["levels"]))  # type: ignore[arg-type]
+    return Deck(data["creation_date"], data["name"], cards, filename, data["library"])  # type: ignore[arg-type]
+
+
+# Shared by every profile loaded in this process
+libraries = LibraryStore()
+accountant.register("mapped", "library files", lambda: libraries.stats()["mapped_bytes"])
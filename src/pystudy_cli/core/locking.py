@@ -0,0 +1,103 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Advisory inter-process locks for profile data directories.
+
+Lock files live in a `.locks` directory next to the profile's head file
+and are never deleted (removing a lock file someone is waiting on breaks
+the lock). There are two levels:
+
+    profile lock  exclusive for save_profile, which rewrites the head file
+                  and every deck. Shared for loading and single-deck saves.
+    deck lock     exclusive while one deck file is checked and written.
+
+Logs shared by every process on the data directory have a lock of their
+own (`log_lock`), held while appending and rotating, and so does the
+profile summary index (`index_lock`) while it's merged and rewritten.
+
+Any number of sessions can load at once, different decks can be saved at
+once, and a whole-profile save waits for everyone else. Locks only keep
+writes from interleaving; whether a file is still the version a session
+loaded is checked separately (see Revision in data_manager).
+
+Uses fcntl.flock. Without fcntl (Windows) the locks do nothing.
+"""
+
+import contextlib
+import os
+import time
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+from pystudy_cli.core.exceptions import LockTimeoutError
+from pystudy_cli.core.tracing import tracer
+
+LOCK_DIR = ".locks"
+DEFAULT_TIMEOUT = 10.0  # seconds
+MAX_RETRY_DELAY = 0.05  # seconds between attempts while waiting
+LOG_LOCK_TIMEOUT = 2.0  # An entry is dropped rather than waited on for longer
+
+
+def lock_dir_for(head_path: Path) -> Path:
+    return head_path.parent / LOCK_DIR
+
+@contextlib.contextmanager
+def _flock(path: Path, shared: bool, timeout: float) -> Iterator[None]:
+    if fcntl is None:
+        yield
+        return
+
+    if not shared:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError:
+        # Nothing was ever saved here (no lock dir), or the data dir is read-only:
+        # either way there's no writer to wait for
+        yield
+        return
+
+    try:
+        op = (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB
+        deadline = time.monotonic() + timeout
+        delay = 0.001
+        with tracer.span("lock_wait", path.stem):
+            while True:
+                try:
+                    fcntl.flock(fd, op)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        raise LockTimeoutError(f"{path.stem} is locked by another session") from None
+                    time.sleep(delay)
+                    delay = min(delay * 2, MAX_RETRY_DELAY)
+        yield
+    finally:
+        os.close(fd)  # Releases the lock
+
+def profile_lock(head_path: Path, shared: bool = False, timeout: float = DEFAULT_TIMEOUT):
+    return _flock(lock_dir_for(head_path) / "profile.lock", shared, timeout)
+
+def deck_lock(head_path: Path, filename: str, shared: bool = False, timeout: float = DEFAULT_TIMEOUT):
+    return _flock(lock_dir_for(head_path) / f"{filename}.lock", shared, timeout)
+
+def log_lock(log_path: Path, timeout: float = LOG_LOCK_TIMEOUT):
+    return _flock(lock_dir_for(log_path) / f"{log_path.name}.lock", False, timeout)
+
+def index_lock(index_path: Path, timeout: float = DEFAULT_TIMEOUT):
+    return _flock(lock_dir_for(index_path) / f"{index_path.name}.lock", False, timeout)
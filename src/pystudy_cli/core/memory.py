@@ -0,0 +1,315 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Memory accounting (`main.py memory`, and M on the TUI main menu).
+
+A report has three parts:
+
+    decks       per deck: card objects, their term/definition strings and,
+                for library decks, the levels and the mapped card text
+                (shared between processes, so not part of the heap)
+    accounts    indexes, caches and buffers, registered with
+                `accountant.register` by the module that owns them, next
+                to their budget if they have one
+    allocations tracemalloc's top allocation sites and, given an earlier
+                snapshot, what grew since
+
+Object sizes are sys.getsizeof summed over everything reachable that
+wasn't counted yet, so a string shared by two cards counts once.
+tracemalloc is imported only when a report is made.
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from pystudy_cli.core import paths
+
+if TYPE_CHECKING:
+    import tracemalloc
+
+    from pystudy_cli.core.objects import Deck
+    from pystudy_cli.core.profile import StudyProfile
+
+ACCOUNT_KINDS = ("index", "cache", "buffer", "mapped")
+NFRAMES = 8
+TOP_SITES = 15
+
+_ATOMIC = (str, bytes, bytearray, int, float, bool, type(None), memoryview)
+_OPAQUE = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def deep_size(obj: Any, seen: set[int] | None = None) -> int:
+    """Size of obj and everything it references that isn't in `seen` yet.
+    Stops at modules, classes and functions."""
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if id(o) in seen or isinstance(o, _OPAQUE):
+            continue
+        seen.add(id(o))
+        total += sys.getsizeof(o)
+        if isinstance(o, _ATOMIC):
+            continue
+        if isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        if hasattr(o, "__dict__"):
+            stack.append(vars(o))
+        for slot in getattr(type(o), "__slots__", ()):
+            if hasattr(o, slot):
+                stack.append(getattr(o, slot))
+    return total
+
+
+@dataclass
+class DeckMemory:
+    name: str
+    cards: int
+    card_bytes: int    # Card objects, their attribute dicts and the card list
+    string_bytes: int  # Terms and definitions
+    other_bytes: int   # Levels of library decks
+    mapped_bytes: int  # Library card text, shared
+
+    @property
+    def heap_bytes(self) -> int:
+        return self.card_bytes + self.string_bytes + self.other_bytes
+
+def deck_memory(deck: Deck, seen: set[int] | None = None) -> DeckMemory:
+    from pystudy_cli.core.library import LibraryCards
+
+    seen = set() if seen is None else seen
+    if isinstance(deck.cards, LibraryCards):
+        levels = deck.cards.levels
+        return DeckMemory(deck.name, len(deck.cards), sys.getsizeof(deck.cards), sys.getsizeof(levels), 0,
+                          deck.cards.file.nbytes)
+
+    card_bytes = sys.getsizeof(deck.cards)
+    string_bytes = 0
+    for card in deck.cards:
+        card_bytes += sys.getsizeof(card)
+        attrs = getattr(card, "__dict__", None)
+        if attrs is not None:
+            card_bytes += sys.getsizeof(attrs)
+        for text in (card.term, card.def_):
+            if id(text) not in seen:
+                seen.add(id(text))
+                string_bytes += sys.getsizeof(text)
+    return DeckMemory(deck.name, len(deck.cards), card_bytes, string_bytes, 0, 0)
+
+
+@dataclass
+class Account:
+    kind: str
+    name: str
+    size: Callable[[], int]
+    budget: Callable[[], int | None] | None = None
+
+class MemoryAccountant:
+    """Indexes, caches and buffers that can grow, by name."""
+
+    def __init__(self) -> None:
+        self._accounts: dict[str, Account] = {}
+
+    def register(self, kind: str, name: str, size: Callable[[], int],
+                 budget: Callable[[], int | None] | None = None) -> None:
+        """Registers (or replaces) an account. `size` returns its current bytes."""
+        if kind not in ACCOUNT_KINDS:
+            raise ValueError(f"unknown account kind: {kind}")
+        self._accounts[name] = Account(kind, name, size, budget)
+
+    def report(self) -> list[dict[str, Any]]:
+        result = []
+        for account in sorted(self._accounts.values(), key=lambda a: (ACCOUNT_KINDS.index(a.kind), a.name)):
+            try:
+                size = account.size()
+                budget = account.budget() if account.budget is not None else None
+            except Exception as e:
+                result.append({"kind": account.kind, "name": account.name, "error": repr(e)})
+                continue
+            result.append({"kind": account.kind, "name": account.name, "bytes": size, "budget": budget})
+        return result
+
+
+# Shared by every module that owns something worth accounting for
+accountant = MemoryAccountant()
+
+
+def resident_memory() -> dict[str, int] | None:
+    """Resident memory of this process in KiB (Linux), None elsewhere."""
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+    result = {}
+    for line in lines:
+        key, _, value = line.partition(":")
+        if key in ("VmRSS", "VmHWM", "RssAnon", "RssFile"):
+            result[key] = int(value.split()[0])
+    return result
+
+def start_tracing(nframes: int = NFRAMES) -> None:
+    """Starts tracemalloc. Only allocations made after this are attributed,
+    and every allocation is slower until `stop_tracing`."""
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(nframes)
+
+def stop_tracing() -> None:
+    import tracemalloc
+
+    tracemalloc.stop()
+
+def is_tracing() -> bool:
+    import tracemalloc
+
+    return tracemalloc.is_tracing()
+
+def take_snapshot() -> tracemalloc.Snapshot:
+    import tracemalloc
+
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+
+def load_snapshot(path: Path) -> tracemalloc.Snapshot:
+    """A snapshot saved with Snapshot.dump, e.g. by `memory --save-snapshot`."""
+    import tracemalloc
+
+    return tracemalloc.Snapshot.load(str(path))
+
+def _site(frame) -> str:
+    filename = Path(frame.filename)
+    try:
+        filename = filename.relative_to(paths.ROOT_DIR)
+    except ValueError:
+        pass
+    return f"{filename}:{frame.lineno}"
+
+def top_sites(snapshot: tracemalloc.Snapshot, limit: int = TOP_SITES) -> list[dict[str, Any]]:
+    return [
+        {"site": _site(stat.traceback[0]), "bytes": stat.size, "blocks": stat.count}
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+def compare(old: tracemalloc.Snapshot, new: tracemalloc.Snapshot, limit: int = TOP_SITES) -> list[dict[str, Any]]:
+    """Allocation sites that changed most between two snapshots."""
+    return [
+        {"site": _site(stat.traceback[0]), "bytes": stat.size, "bytes_diff": stat.size_diff,
+         "blocks_diff": stat.count_diff}
+        for stat in new.compare_to(old, "lineno")[:limit]
+    ]
+
+def _disk_usage(head_path: Path) -> dict[str, int]:
+    from pystudy_cli.core.data_manager import decks_dir_for
+    from pystudy_cli.core.snapshot import snapshot_path
+
+    def size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    decks_dir = decks_dir_for(head_path)
+    return {
+        "head": size(head_path),
+        "decks": sum(size(p) for p in decks_dir.glob("*.json")) if decks_dir.is_dir() else 0,
+        "snapshot": size(snapshot_path(head_path)),
+    }
+
+def build_report(profile: StudyProfile, head_path: Path | None = None,
+                 previous: tracemalloc.Snapshot | None = None, top: int = TOP_SITES) -> dict[str, Any]:
+    """The full report. Allocation sites are included if tracemalloc is running."""
+    import tracemalloc
+
+    seen: set[int] = set()
+    decks = [deck_memory(deck, seen) for deck in profile.decks]
+    report: dict[str, Any] = {
+        "resident_kib": resident_memory(),
+        "profile": {
+            "name": profile.name,
+            "cards": sum(d.cards for d in decks),
+            "heap_bytes": sum(d.heap_bytes for d in decks),
+            "mapped_bytes": sum(d.mapped_bytes for d in decks),
+            "disk_bytes": _disk_usage(head_path) if head_path is not None else None,
+        },
+        "decks": [{**asdict(d), "heap_bytes": d.heap_bytes} for d in decks],
+        "accounts": accountant.report(),
+    }
+
+    if tracemalloc.is_tracing():
+        snapshot = take_snapshot()
+        traced, peak = tracemalloc.get_traced_memory()
+        report["tracemalloc"] = {"traced_bytes": traced, "peak_bytes": peak, "top_sites": top_sites(snapshot, top)}
+        if previous is not None:
+            report["tracemalloc"]["since_previous"] = compare(previous, snapshot, top)
+        report["_snapshot"] = snapshot  # For the caller to keep or dump, not part of the output
+    return report
+
+def _kib(n: int | None) -> str:
+    return "-" if n is None else f"{n / 1024:,.1f}"
+
+def format_report(report: dict[str, Any], max_decks: int = 20) -> list[str]:
+    """The report as plain text lines, sizes in KiB."""
+    lines = []
+    rss = report["resident_kib"]
+    if rss:
+        lines.append("Resident: " + ", ".join(f"{k} {v:,} KiB" for k, v in rss.items()))
+
+    profile = report["profile"]
+    lines.append(f"Profile '{profile['name']}': {profile['cards']:,} cards, heap {_kib(profile['heap_bytes'])} KiB, "
+                 f"mapped {_kib(profile['mapped_bytes'])} KiB")
+    if profile["disk_bytes"]:
+        lines.append("On disk: " + ", ".join(f"{k} {_kib(v)} KiB" for k, v in profile["disk_bytes"].items()))
+
+    lines.append("")
+    lines.append(f"{'deck':<28}{'cards':>9}{'cards KiB':>12}{'strings KiB':>13}{'other KiB':>11}{'mapped KiB':>12}")
+    decks = sorted(report["decks"], key=lambda d: -(d["heap_bytes"] + d["mapped_bytes"]))
+    for d in decks[:max_decks]:
+        lines.append(f"{d['name'][:27]:<28}{d['cards']:>9,}{_kib(d['card_bytes']):>12}{_kib(d['string_bytes']):>13}"
+                     f"{_kib(d['other_bytes']):>11}{_kib(d['mapped_bytes']):>12}")
+    if len(decks) > max_decks:
+        lines.append(f"...and {len(decks) - max_decks} smaller decks")
+
+    lines.append("")
+    lines.append(f"{'kind':<8}{'account':<32}{'KiB':>12}{'budget KiB':>12}")
+    for account in report["accounts"]:
+        if "error" in account:
+            lines.append(f"{account['kind']:<8}{account['name'][:31]:<32}  {account['error']}")
+            continue
+        lines.append(f"{account['kind']:<8}{account['name'][:31]:<32}{_kib(account['bytes']):>12}"
+                     f"{_kib(account['budget']):>12}")
+
+    traced = report.get("tracemalloc")
+    if traced:
+        lines.append("")
+        lines.append(f"Traced {_kib(traced['traced_bytes'])} KiB (peak {_kib(traced['peak_bytes'])} KiB), top sites:")
+        for site in traced["top_sites"]:
+            lines.append(f"  {_kib(site['bytes']):>10} KiB {site['blocks']:>9,} blocks  {site['site']}")
+        if "since_previous" in traced:
+            lines.append("Since the previous report:")
+            for site in traced["since_previous"]:
+                lines.append(f"  {site['bytes_diff'] / 1024:>+10,.1f} KiB {site['blocks_diff']:>+9,} blocks  {site['site']}")
+    return lines
@@ -13,11 +13,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from typing import Self, Mapping, Any, cast
 
 from pystudy_cli.core.constants import FAMILIARITY_LEVELS
-from pystudy_cli.core.custom_types import JSONObject, JSONValue
+from pystudy_cli.core.custom_types import JSONObject, JSONValue, Revision
 
 class JSONConvertible(ABC):
     """
@@ -61,8 +61,18 @@ class Deck(JSONConvertible):
     name: str
     cards: list[Card]
     filename: str
+    library: str | None = None  # Library file holding the card text, see core.library
+    revision: Revision | None = field(default=None, compare=False, repr=False)  # Of the deck file when loaded
 
     def to_json(self) -> JSONObject:
+        if self.library is not None:
+            # Only this profile's progress, the text is in the library file
+            return {
+                "creation_date": self.creation_date,
+                "name": self.name,
+                "library": self.library,
+                "levels": [card.familiarity_level for card in self.cards],
+            }
         return {
             "creation_date": self.creation_date,
             "name": self.name,
@@ -10,6 +10,7 @@
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 
+import os
 from pathlib import Path
 
 # Base directory
@@ -18,8 +19,28 @@ ROOT_DIR: Path = Path(__file__).resolve().parents[3]
 # Asset directories
 ASSETS_DIR: Path = ROOT_DIR / "assets"
 SOUNDS_DIR: Path = ASSETS_DIR / "sounds"
+ASSET_MANIFEST: Path = ASSETS_DIR / "manifest.json"
 
-# Data directories
-DATA_DIR: Path = ROOT_DIR / "data"
+# Data directories (PYSTUDY_DATA_DIR or main.py --data-dir override the default location).
+# Read these as `paths.DATA_DIR` at call time, not as default arguments, so
+# set_data_dir() reaches them.
+DATA_DIR: Path = Path(os.environ.get("PYSTUDY_DATA_DIR") or ROOT_DIR / "data").resolve()
 DECKS_DIR: Path = DATA_DIR / "decks"
-TRASH_DIR: Path = DECKS_DIR / "trash"
\ No newline at end of file
+TRASH_DIR: Path = DECKS_DIR / "trash"
+LIBRARY_DIR: Path = DATA_DIR / "library"    # Shared by every profile, see core.library
+PROFILES_DIR: Path = DATA_DIR / "profiles"  # Extra profiles, see core.registry
+LOG_DIR: Path = DATA_DIR / "logs"            # See core.diagnostics
+
+def set_data_dir(path: Path) -> None:
+    """Moves every data directory under `path`."""
+    global DATA_DIR, DECKS_DIR, TRASH_DIR, LIBRARY_DIR, PROFILES_DIR, LOG_DIR
+    DATA_DIR = path.resolve()
+    DECKS_DIR = DATA_DIR / "decks"
+    TRASH_DIR = DECKS_DIR / "trash"
+    LIBRARY_DIR = DATA_DIR / "library"
+    PROFILES_DIR = DATA_DIR / "profiles"
+    LOG_DIR = DATA_DIR / "logs"
+
+def save_file() -> Path:
+    """Head file of the default profile."""
+    return DATA_DIR / "save_data.json"
\ No newline at end of file
@@ -12,10 +12,12 @@
 
 """The profile module - stores logic for StudyProfile, including converting to and from JSON."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Self
 
 from pystudy_cli.core.exceptions import DeckError, DeckExistsError, DeckNotFoundError
+from pystudy_cli.core.custom_types import Revision
 from pystudy_cli.core.objects import ConfigObject, Deck, JSONObject
 from pystudy_cli.core.constants import VERSION_NUM
 
@@ -26,6 +28,8 @@ class StudyProfile:
     name: str
     decks: list[Deck]
     config: ConfigObject
+    last_studied: str | None = None  # ISO timestamp of the last revision session
+    revision: Revision | None = field(default=None, compare=False, repr=False)  # Of the head file when loaded
 
     def to_json(self) -> JSONObject:
         """Serialise to dict"""
@@ -33,6 +37,7 @@ class StudyProfile:
             "version": self.version,
             "name": self.name,
             "config": self.config.to_json(),
+            "last_studied": self.last_studied,
             "deck_files": [deck.filename for deck in self.decks],
         }
 
@@ -51,11 +56,15 @@ class StudyProfile:
             config=ConfigObject.from_json(
                 data["config"]
             ),
-            decks=[]
+            decks=[],
+            last_studied=data.get("last_studied")  # type: ignore[arg-type]
         )
 
         return profile
 
+    def mark_studied(self) -> None:
+        self.last_studied = datetime.now().isoformat(timespec="seconds")
+
     def new_deck(self, timestamp: str, name: str, filename: str) -> None:
         """Adds a new deck to the instance. Deck names must be unique."""
         if not name:
@@ -0,0 +1,101 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""Questions for the revision modes, and the grading rules they share with the batch CLI."""
+
+import difflib
+import random
+
+from pystudy_cli.core.constants import DEFAULT_SMART_GRADING_STRICTNESS, NUM_MCQ_OPTIONS
+from pystudy_cli.core.objects import Deck
+from pystudy_cli.core.tracing import traced, tracer
+
+
+class Question:
+    """Base class for Question objects."""
+    def __init__(self, text: str, correct_ans: str):
+        self.text = text
+        self.correct_ans = correct_ans
+        self.user_ans: str | None = None
+
+    @staticmethod
+    def is_correct_answer(
+        correct_ans: str, user_ans: str | None,
+        smart_grading: bool = False,
+        strictness: float = DEFAULT_SMART_GRADING_STRICTNESS
+    ) -> bool:
+        if user_ans is None:
+            return False
+
+        user_ans_clean = user_ans.strip().lower()
+        correct_ans_clean = correct_ans.strip().lower()
+
+        if smart_grading:
+            # Only smart grading is worth a span, an exact comparison is a string compare
+            with tracer.span("smart_grade"):
+                similarity = difflib.SequenceMatcher(None, user_ans_clean, correct_ans_clean).ratio()
+            return similarity >= strictness
+        return user_ans_clean == correct_ans_clean
+
+    def is_correct(self, smart_grading: bool = False,
+                   strictness: float = DEFAULT_SMART_GRADING_STRICTNESS) -> bool:
+        return Question.is_correct_answer(
+            self.correct_ans, self.user_ans,
+            smart_grading, strictness
+        )
+
+class MCQuestion(Question):
+    def __init__(
+            self, text: str, options: list[str], correct_ans: int):
+        self.text = text
+        self.options = options
+        self.correct_ans: int = correct_ans  # Zero-based indices for MCQs
+        self.user_ans: int | None = None     # None = no answer selected
+
+    def is_correct(self) -> bool:
+        if self.user_ans is None:
+            return False
+        return self.user_ans == self.correct_ans
+
+@traced("gen_written_qs")
+def gen_written_qs(deck: Deck, num_questions: int) -> list[Question]:
+    cards_sample = random.sample(deck.cards, min(num_questions, len(deck.cards)))
+    questions = [
+        Question(card.term, card.def_)
+        for card in cards_sample
+    ]
+    return questions
+
+@traced("gen_mcqs")
+def gen_mcqs(deck: Deck, num_questions: int) -> list[MCQuestion]:
+    if len(deck.cards) < NUM_MCQ_OPTIONS:
+        # Not enough cards to generate meaningful distractors
+        return []
+
+    all_defs: list[str] = [c.def_ for c in deck.cards]
+    cards_sample = random.sample(deck.cards, min(num_questions, len(deck.cards)))
+    questions = []
+
+    for card in cards_sample:
+        # Remove the current card's def (read once, library cards decode it on every access)
+        correct_def = card.def_
+        distractor_pool = [d for d in all_defs if d != correct_def]
+
+        # Select distractors
+        distractors = random.sample(distractor_pool, NUM_MCQ_OPTIONS - 1)
+
+        options: list[str] = [*distractors, correct_def]
+        random.shuffle(options)
+        correct_idx = options.index(correct_def)
+
+        questions.append(MCQuestion(card.term, options, correct_idx))
+    return questions
@@ -0,0 +1,222 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Registry of study profiles in the data directory.
+
+The default profile lives straight in DATA_DIR, as it always has. Every
+other profile gets PROFILES_DIR/<profile id>/ with the same layout, which
+is also what `main.py serve` serves.
+
+Listing profiles goes through a summary index (PROFILES_DIR/index.json)
+holding each profile's name, deck count and last studied time, keyed by
+the size and mtime of its head file. Listing only stats the head files;
+the few that changed since are re-read (the head file only, never the
+decks), so a class of thousands of profiles lists instantly. Saving never
+touches the index, the next listing picks the change up and merges just
+those entries back under a lock.
+"""
+
+import json
+import os
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable
+
+from pystudy_cli.core import locking, paths
+from pystudy_cli.core.data_manager import (
+    LoadStatus,
+    load_profile,
+    save_deck,
+    save_new_decks,
+    save_profile,
+    slugify_filename,
+    write_json_atomic,
+)
+from pystudy_cli.core.exceptions import LockTimeoutError
+from pystudy_cli.core.memory import accountant, deep_size
+from pystudy_cli.core.objects import Card, Deck
+from pystudy_cli.core.profile import StudyProfile
+
+DEFAULT_PROFILE = "default"
+PROFILE_ID = re.compile(r"[A-Za-z0-9_-]{1,64}")
+INDEX_FORMAT = 1
+
+
+@dataclass
+class ProfileSummary:
+    profile_id: str
+    name: str
+    decks: int
+    last_studied: str | None
+    mtime_ns: int  # Of the head file when this was read
+    size: int
+
+
+def _read_summary(profile_id: str, head: Path, stat: os.stat_result) -> ProfileSummary | None:
+    """Summarises a profile from its head file alone, None if it's unreadable."""
+    try:
+        with open(head, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        deck_list = raw.get("deck_files", raw.get("decks", []))
+        last_studied = raw.get("last_studied")
+        return ProfileSummary(profile_id, str(raw.get("name", "")), len(deck_list),
+                              str(last_studied) if last_studied else None, stat.st_mtime_ns, stat.st_size)
+    except (OSError, ValueError, AttributeError, TypeError):
+        return None
+
+
+class ProfileRegistry:
+    """Finds, loads and saves profiles by id and keeps the summary index.
+    `active` is the profile the TUI and batch commands work on. With
+    `read_only` set, saving does nothing, so a read-only session never gets
+    in the way of one that's studying."""
+
+    def __init__(self) -> None:
+        self.active = DEFAULT_PROFILE
+        self.read_only = False
+        self._index: dict[str, ProfileSummary] = {}  # From the last listing
+
+    @staticmethod
+    def is_valid_id(profile_id: str) -> bool:
+        return PROFILE_ID.fullmatch(profile_id) is not None
+
+    def head_path(self, profile_id: str | None = None) -> Path:
+        profile_id = profile_id or self.active
+        if profile_id == DEFAULT_PROFILE:
+            return paths.save_file()
+        if not self.is_valid_id(profile_id):
+            raise ValueError(f"invalid profile id '{profile_id}'")
+        return paths.PROFILES_DIR / profile_id / "save_data.json"
+
+    def ids(self) -> list[str]:
+        """Profile ids with a data directory, whether or not they were saved yet."""
+        ids = [DEFAULT_PROFILE] if paths.save_file().exists() else []
+        try:
+            with os.scandir(paths.PROFILES_DIR) as entries:
+                ids += sorted(e.name for e in entries if e.is_dir() and self.is_valid_id(e.name)
+                              and e.name != DEFAULT_PROFILE)
+        except OSError:
+            pass
+        return ids
+
+    def exists(self, profile_id: str) -> bool:
+        return profile_id == DEFAULT_PROFILE or self.head_path(profile_id).parent.is_dir()
+
+    def make_id(self, name: str) -> str:
+        """A free profile id based on name."""
+        base = slugify_filename(name)[:56]
+        profile_id, n = base, 1
+        while profile_id == DEFAULT_PROFILE or (paths.PROFILES_DIR / profile_id).exists():
+            n += 1
+            profile_id = f"{base}-{n}"
+        return profile_id
+
+    def create(self, profile_id: str) -> None:
+        """Makes the data directory of a new profile. It's saved like any other."""
+        if self.exists(profile_id):
+            raise FileExistsError(f"profile '{profile_id}' already exists")
+        self.head_path(profile_id).parent.mkdir(parents=True)
+
+    def load(self, profile_id: str | None = None) -> tuple[StudyProfile, LoadStatus]:
+        return load_profile(self.head_path(profile_id))
+
+    def save(self, profile: StudyProfile, profile_id: str | None = None, force: bool = False) -> str | None:
+        """Saves like save_profile. The summary index is left to the next
+        listing, which notices the changed head file."""
+        if self.read_only:
+            return None
+        return save_profile(profile, self.head_path(profile_id), force)
+
+    def save_deck(self, deck: Deck, profile_id: str | None = None, force: bool = False) -> str | None:
+        """Saves one deck like data_manager.save_deck."""
+        if self.read_only:
+            return None
+        return save_deck(deck, self.head_path(profile_id), force)
+
+    def save_new_decks(self, profile: StudyProfile, new_decks: Iterable[tuple[Deck, Iterable[Card]]],
+                       profile_id: str | None = None) -> str | None:
+        """Streams new decks like data_manager.save_new_decks."""
+        if self.read_only:
+            return None
+        return save_new_decks(profile, new_decks, self.head_path(profile_id))
+
+    def summaries(self) -> list[ProfileSummary]:
+        """Summaries of every profile, sorted by id. Re-reads only changed head files."""
+        index = self._read_index()
+        result = []
+        updated: dict[str, ProfileSummary] = {}
+        for profile_id in self.ids():
+            head = self.head_path(profile_id)
+            try:
+                stat = head.stat()
+            except OSError:
+                continue  # Created but never saved
+
+            summary = index.get(profile_id)
+            if summary is None or (summary.mtime_ns, summary.size) != (stat.st_mtime_ns, stat.st_size):
+                summary = _read_summary(profile_id, head, stat)
+                if summary is None:
+                    continue
+                updated[profile_id] = summary
+            result.append(summary)
+
+        # Forget deleted profiles
+        listed = {s.profile_id for s in result}
+        removed = [profile_id for profile_id in index if profile_id not in listed]
+
+        if updated or removed:
+            self._update_index(updated, removed)
+        self._index = {s.profile_id: s for s in result}
+        return result
+
+    @staticmethod
+    def _index_path() -> Path:
+        return paths.PROFILES_DIR / "index.json"
+
+    def _read_index(self) -> dict[str, ProfileSummary]:
+        index: dict[str, ProfileSummary] = {}
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            if raw.get("format") == INDEX_FORMAT:
+                for item in raw["profiles"]:
+                    summary = ProfileSummary(**item)
+                    index[summary.profile_id] = summary
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass  # Missing or damaged, rebuilt from the head files
+        return index
+
+    def _update_index(self, updated: dict[str, ProfileSummary], removed: list[str]) -> None:
+        """Merges changed entries into the index on disk. It's re-read under
+        the lock, so sessions listing at once never drop each other's entries."""
+        if not paths.PROFILES_DIR.is_dir():
+            return  # Only the default profile, not worth a directory for the index
+        path = self._index_path()
+        try:
+            with locking.index_lock(path):
+                index = self._read_index()
+                index.update(updated)
+                for profile_id in removed:
+                    index.pop(profile_id, None)
+                write_json_atomic(path, {
+                    "format": INDEX_FORMAT,
+                    "profiles": [asdict(s) for s in index.values()],
+                })
+        except (OSError, LockTimeoutError):
+            pass  # Only a cache
+
+
+# Shared registry, `active` is set from main.py --profile
+profiles = ProfileRegistry()
+accountant.register("index", "profile summaries", lambda: deep_size(profiles._index))
@@ -0,0 +1,195 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Startup snapshot of a loaded StudyProfile.
+
+After a successful save, the whole profile is pickled into a single file
+next to the head file, together with a key describing every source file
+(mtime, size and content hash). On the next launch `load_profile` reads
+the snapshot in one go and only falls back to parsing JSON if a source
+file changed.
+
+File layout: MAGIC | header length (8 bytes, little endian) | header | profile
+The header is pickled separately so the key can be checked without
+unpickling the (much larger) profile. Cards are stored column-wise (all
+terms, all definitions, one byte per familiarity level), which pickles
+and restores noticeably faster than a list of Card dataclasses. Library
+decks only store their library file and levels, never the card text.
+
+The data directory is shared by many profiles and the study server, so a
+snapshot is untrusted input: it's unpickled with an allow-list of classes
+and functions, and anything else makes it invalid.
+"""
+
+import hashlib
+import io
+import os
+import pickle
+from array import array
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pystudy_cli.core import library
+from pystudy_cli.core.constants import VERSION_NUM
+from pystudy_cli.core.custom_types import Revision
+from pystudy_cli.core.objects import Card, ConfigObject, Deck
+from pystudy_cli.core.profile import StudyProfile
+from pystudy_cli.core.tracing import traced
+
+MAGIC = b"PYSTUDY-SNAPSHOT"
+SNAPSHOT_FORMAT = 3
+
+
+class SourceFile(NamedTuple):
+    """Identity of one JSON file the snapshot was built from."""
+    path: str
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+# The only globals a snapshot may reference, everything else is plain data
+_ALLOWED_GLOBALS = {
+    (SourceFile.__module__, "SourceFile"): SourceFile,
+    (library.__name__, "_reopen"): library._reopen,  # LibraryCards.__reduce__
+}
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> Any:
+        try:
+            return _ALLOWED_GLOBALS[module, name]
+        except KeyError:
+            raise pickle.UnpicklingError(f"{module}.{name} isn't allowed in a snapshot") from None
+
+def _loads(data: memoryview) -> Any:
+    return _SnapshotUnpickler(io.BytesIO(data)).load()
+
+
+def file_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def snapshot_path(head_path: Path) -> Path:
+    return head_path.with_name(head_path.name + ".snapshot")
+
+def source_file(path: Path, digest: str) -> SourceFile:
+    stat = path.stat()
+    return SourceFile(str(path), stat.st_mtime_ns, stat.st_size, digest)
+
+def _unchanged_revision(source: SourceFile) -> Revision | None:
+    """The file's current revision if it still holds what was snapshotted, else None."""
+    try:
+        stat = os.stat(source.path)
+    except OSError:
+        return None
+
+    revision = stat.st_ino, stat.st_mtime_ns, stat.st_size
+    if stat.st_size != source.size:
+        return None
+    if stat.st_mtime_ns == source.mtime_ns:
+        return revision
+
+    # Same size but touched: only the content hash can tell
+    with open(source.path, "rb") as f:
+        return revision if file_digest(f.read()) == source.digest else None
+
+def _pack(profile: StudyProfile) -> tuple:
+    decks = []
+    for deck in profile.decks:
+        levels = bytes(card.familiarity_level for card in deck.cards)
+        if isinstance(deck.cards, library.LibraryCards):
+            decks.append((deck.creation_date, deck.name, deck.filename, str(deck.cards.file.path), None, levels))
+            continue
+        decks.append((
+            deck.creation_date, deck.name, deck.filename,
+            [card.term for card in deck.cards],
+            [card.def_ for card in deck.cards],
+            levels,
+        ))
+    return profile.version, profile.name, profile.config.to_json(), profile.last_studied, decks
+
+def _unpack(packed: tuple) -> StudyProfile:
+    version, name, config, last_studied, decks_packed = packed
+    decks = []
+    for creation_date, deck_name, filename, terms, defs, levels in decks_packed:
+        if defs is None:
+            # Library deck, `terms` is the library file's path
+            cards = library.LibraryCards(library.libraries.open(Path(terms)), array("b", levels))
+            decks.append(Deck(creation_date, deck_name, cards, filename, Path(terms).name))  # type: ignore[arg-type]
+            continue
+        decks.append(Deck(creation_date, deck_name, [Card(*fields) for fields in zip(terms, defs, levels)], filename))
+    return StudyProfile(version, name, decks, ConfigObject.from_json(config), last_studied)
+
+@traced("snapshot.save")
+def save(head_path: Path, profile: StudyProfile, sources: list[SourceFile]) -> None:
+    """Writes the snapshot. Never raises: a missing snapshot only costs startup time."""
+    path = snapshot_path(head_path)
+    try:
+        header = pickle.dumps({
+            "format": SNAPSHOT_FORMAT,
+            "version": VERSION_NUM,
+            "sources": sources,
+        }, protocol=pickle.HIGHEST_PROTOCOL)
+        body = pickle.dumps(_pack(profile), protocol=pickle.HIGHEST_PROTOCOL)
+
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            f.write(body)
+        tmp.replace(path)
+    except Exception:
+        invalidate(head_path)
+
+@traced("snapshot.load")
+def load(head_path: Path) -> StudyProfile | None:
+    """Returns the snapshotted profile if every source file is unchanged, else None."""
+    try:
+        with open(snapshot_path(head_path), "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    try:
+        if not data.startswith(MAGIC):
+            return None
+        view = memoryview(data)
+        start = len(MAGIC) + 8
+        header_len = int.from_bytes(view[len(MAGIC):start], "little")
+        header = _loads(view[start:start + header_len])
+
+        if header.get("format") != SNAPSHOT_FORMAT or header.get("version") != VERSION_NUM:
+            return None
+
+        sources: list[SourceFile] = header["sources"]
+        if not sources or sources[0].path != str(head_path):
+            return None
+        revisions = [_unchanged_revision(source) for source in sources]
+        if None in revisions:
+            return None
+
+        profile = _unpack(_loads(view[start + header_len:]))
+        if len(profile.decks) != len(sources) - 1:
+            return None
+        profile.revision = revisions[0]
+        for deck, revision in zip(profile.decks, revisions[1:]):
+            deck.revision = revision
+        return profile
+    except Exception:
+        return None
+
+def invalidate(head_path: Path) -> None:
+    try:
+        snapshot_path(head_path).unlink()
+    except OSError:
+        pass
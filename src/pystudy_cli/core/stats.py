@@ -0,0 +1,43 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""Per-deck study statistics, shared by the deck menu and the batch CLI,
+and the percentile helper the latency recorder and benchmarks report with."""
+
+from dataclasses import dataclass
+
+from pystudy_cli.core.constants import FAMILIARITY_LEVELS
+from pystudy_cli.core.objects import Deck
+
+
+@dataclass
+class DeckStats:
+    cards: int
+    level_counts: dict[int, int]  # Familiarity level -> number of cards
+    progress: float               # Weighted by FamiliarityLevel.weight, 0 to 1
+
+def deck_stats(deck: Deck) -> DeckStats:
+    level_counts = dict.fromkeys(FAMILIARITY_LEVELS, 0)
+    for card in deck.cards:
+        if card.familiarity_level in level_counts:  # Out of range levels are fsck's problem
+            level_counts[card.familiarity_level] += 1
+
+    total_weight = sum(FAMILIARITY_LEVELS[lvl_int].weight * count for lvl_int, count in level_counts.items())
+    progress = total_weight / len(deck.cards) if deck.cards else 0.0
+    return DeckStats(len(deck.cards), level_counts, progress)
+
+def percentile(sorted_values: list[int], pct: float) -> int:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
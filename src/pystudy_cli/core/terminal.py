@@ -0,0 +1,115 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Cached terminal geometry.
+
+Querying the terminal size is a syscall, and the TUI used to do it on every
+screen. This module keeps the last known size and only asks the OS again
+after a SIGWINCH (window resize). On platforms without SIGWINCH (Windows)
+the size is re-queried at most every RESIZE_POLL_INTERVAL seconds instead.
+"""
+
+import os
+import signal
+import threading
+import time
+
+from pystudy_cli.core.constants import FALLBACK_STATUS_BAR_WIDTH
+
+FALLBACK_TERMINAL_HEIGHT = 24
+RESIZE_POLL_INTERVAL = 0.5  # seconds, only used without SIGWINCH
+
+
+class TerminalGeometry:
+    """Caches the terminal size and invalidates it on resize."""
+
+    def __init__(self) -> None:
+        self._columns = FALLBACK_STATUS_BAR_WIDTH
+        self._lines = FALLBACK_TERMINAL_HEIGHT
+        self._stale = True
+        self._queried_at = 0.0
+        self._generation = 0  # Bumped whenever the size actually changes
+        self._has_sigwinch = False
+        self._listeners: list = []
+
+    def install(self) -> None:
+        """Registers the SIGWINCH handler. Safe to call more than once."""
+        if self._has_sigwinch or not hasattr(signal, "SIGWINCH"):
+            return
+
+        # Signal handlers can only be set from the main thread
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        previous = signal.getsignal(signal.SIGWINCH)
+
+        def _on_resize(signum, frame):
+            self._stale = True
+            if callable(previous):
+                previous(signum, frame)
+
+        signal.signal(signal.SIGWINCH, _on_resize)
+        self._has_sigwinch = True
+
+    def invalidate(self) -> None:
+        self._stale = True
+
+    def add_listener(self, callback) -> None:
+        """Registers a callback(columns, lines) to run when the size changes."""
+        self._listeners.append(callback)
+
+    def _refresh(self) -> None:
+        if not self._stale:
+            if self._has_sigwinch:
+                return
+            if time.monotonic() - self._queried_at < RESIZE_POLL_INTERVAL:
+                return
+
+        try:
+            size = os.get_terminal_size()
+            columns, lines = size.columns, size.lines
+        except OSError:
+            columns, lines = FALLBACK_STATUS_BAR_WIDTH, FALLBACK_TERMINAL_HEIGHT
+
+        self._stale = False
+        self._queried_at = time.monotonic()
+
+        if (columns, lines) != (self._columns, self._lines):
+            self._columns, self._lines = columns, lines
+            self._generation += 1
+            for callback in self._listeners:
+                callback(columns, lines)
+
+    @property
+    def columns(self) -> int:
+        self._refresh()
+        return self._columns
+
+    @property
+    def lines(self) -> int:
+        self._refresh()
+        return self._lines
+
+    @property
+    def generation(self) -> int:
+        """Changes every time the size changes, useful as a cache key."""
+        self._refresh()
+        return self._generation
+
+    def size(self) -> tuple[int, int]:
+        self._refresh()
+        return self._columns, self._lines
+
+
+# Shared instance, everything that lays out text should read from this
+terminal = TerminalGeometry()
@@ -0,0 +1,200 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Opt-in tracing spans (`main.py --trace`).
+
+    with tracer.span("write_json_atomic", path.name):
+        ...
+
+    @traced("gen_mcqs")
+    def gen_mcqs(...): ...
+
+When tracing is off, `span` hands back one shared no-op context manager
+and `traced` functions only check a flag before calling straight through.
+When it's on, finished spans go into a fixed-size ring buffer of integer
+arrays (the oldest are dropped once it's full) and are written on exit as
+Chrome trace-event JSON, which chrome://tracing, Perfetto or speedscope
+open directly.
+"""
+
+import atexit
+import contextlib
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from array import array
+from pathlib import Path
+
+from pystudy_cli.core.memory import accountant
+
+DEFAULT_CAPACITY = 65536  # Spans kept, about 1.5 MB
+FRAMES_TID = 0            # Own lane for frames, they don't nest with screens
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_detail", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, detail: str | None) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._detail = detail
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info) -> None:
+        self._tracer.add(self._name, self._start, time.perf_counter_ns(), self._detail)
+
+
+class Tracer:
+    """Records finished spans in a ring buffer and writes them as a Chrome trace."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.enabled = False
+        self.trace_path: Path | None = None
+        self.capacity = capacity
+
+        self._names: list[str] = []
+        self._name_ids: dict[str, int] = {}
+        self._threads: dict[int, int] = {}
+        self._thread_names: dict[int, str] = {FRAMES_TID: "frames"}
+        self._lock = threading.Lock()  # Spans also finish in worker threads (server saves)
+
+        # Allocated by enable, most sessions never trace
+        self._name = array('H')
+        self._tid = array('H')
+        self._start_ns = array('q')
+        self._end_ns = array('q')
+        self._detail: list[str | None] = []
+        self._next = 0
+        self._count = 0
+        self.dropped = 0
+
+    def enable(self, trace_path: Path) -> None:
+        capacity = self.capacity
+        self._name = array('H', bytes(2 * capacity))
+        self._tid = array('H', bytes(2 * capacity))
+        self._start_ns = array('q', bytes(8 * capacity))
+        self._end_ns = array('q', bytes(8 * capacity))
+        self._detail = [None] * capacity
+        self.enabled = True
+        self.trace_path = trace_path
+        atexit.register(self.dump)
+
+    @property
+    def nbytes(self) -> int:
+        buffers = (self._name, self._tid, self._start_ns, self._end_ns, self._detail)
+        return sum(sys.getsizeof(buffer) for buffer in buffers)
+
+    def span(self, name: str, detail: str | None = None) -> contextlib.AbstractContextManager:
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, detail)
+
+    def _thread_id(self) -> int:
+        ident = threading.get_ident()
+        tid = self._threads.get(ident)
+        if tid is None:
+            tid = self._threads[ident] = len(self._threads) + 1
+            self._thread_names[tid] = threading.current_thread().name
+        return tid
+
+    def add(self, name: str, start_ns: int, end_ns: int, detail: str | None = None, tid: int | None = None) -> None:
+        """Records a finished span."""
+        if not self.enabled:
+            return
+        with self._lock:
+            name_id = self._name_ids.get(name)
+            if name_id is None:
+                name_id = self._name_ids[name] = len(self._names)
+                self._names.append(name)
+
+            i = self._next
+            self._name[i] = name_id
+            self._tid[i] = self._thread_id() if tid is None else tid
+            self._start_ns[i] = start_ns
+            self._end_ns[i] = end_ns
+            self._detail[i] = detail
+
+            self._next = (i + 1) % self.capacity
+            if self._count == self.capacity:
+                self.dropped += 1
+            self._count = min(self._count + 1, self.capacity)
+
+    def events(self):
+        """Yields the buffered spans as Chrome trace events, oldest first."""
+        pid = os.getpid()
+        start = (self._next - self._count) % self.capacity
+        for n in range(self._count):
+            i = (start + n) % self.capacity
+            event = {
+                "name": self._names[self._name[i]],
+                "ph": "X",
+                "ts": self._start_ns[i] / 1000,
+                "dur": (self._end_ns[i] - self._start_ns[i]) / 1000,
+                "pid": pid,
+                "tid": self._tid[i],
+            }
+            if self._detail[i] is not None:
+                event["args"] = {"detail": self._detail[i]}
+            yield event
+
+        for tid, name in self._thread_names.items():
+            yield {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+
+    def dump(self) -> None:
+        """Writes the trace file."""
+        if not self.enabled or self.trace_path is None:
+            return
+
+        self.trace_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.trace_path.open("w", encoding="utf-8") as f:
+            json.dump({
+                "traceEvents": list(self.events()),
+                "displayTimeUnit": "ms",
+                "otherData": {"spans": self._count, "dropped": self.dropped},
+            }, f)
+        dropped = f", {self.dropped} oldest dropped" if self.dropped else ""
+        print(f"Trace of {self._count} spans written to {self.trace_path}{dropped}", file=sys.stderr)
+
+
+tracer = Tracer()
+accountant.register("buffer", "trace spans", lambda: tracer.nbytes)
+
+def traced(name: str):
+    """Decorator, records a span for every call while tracing is enabled."""
+    def decorate(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not tracer.enabled:
+                    return await func(*args, **kwargs)
+                with _Span(tracer, name, None):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with _Span(tracer, name, None):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorate
@@ -0,0 +1,210 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Glyph atlas text renderer.
+
+The text cache renders a whole surface per distinct string, which is ideal
+for a handful of labels but churns when scrolling through thousands of
+different card terms. Here each (font, size) rasterises its glyphs once,
+in white, into a few atlas pages, and strings are composed by blitting
+glyph rects out of a tinted copy of the page. Memory is a few pages per
+font size no matter how many strings are drawn.
+
+No kerning or shaping, so it's meant for card text in lists, not titles.
+"""
+
+from pathlib import Path
+from typing import Callable
+
+import pygame as pg
+
+from pystudy_cli.core.custom_types import Colour
+from pystudy_cli.core.memory import accountant
+from pystudy_cli.gui.custom_types import Surface
+from pystudy_cli.gui.text_cache import FontCache, FontKey, fonts, surface_nbytes
+
+PAGE_SIZE = 512
+PRELOADED_CHARS = "".join(chr(c) for c in range(32, 127))  # Everything else is added on first use
+GLYPH_PADDING = 1
+MAX_TINTS = 16  # Tinted page copies kept per atlas
+
+
+def wrap_words(text: str, width: int, measure: Callable[[str], int]) -> list[str]:
+    """Greedy word wrap. Words longer than `width` get a line to themselves."""
+    lines: list[str] = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split(" "):
+            candidate = f"{line} {word}" if line else word
+            if line and measure(candidate) > width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return lines
+
+
+class GlyphAtlas:
+    """Glyphs of one (font, size), packed into white atlas pages."""
+
+    def __init__(self, font: pg.font.Font, preload: str = PRELOADED_CHARS) -> None:
+        self.font = font
+        self.height = font.get_height()
+        self.line_height = font.get_linesize()
+        self.pages: list[Surface] = []
+        self.glyphs: dict[str, tuple[int, pg.Rect, int]] = {}  # char -> (page, rect, advance)
+        self._tints: dict[tuple[int, Colour], Surface] = {}
+        self._cursor = (PAGE_SIZE, PAGE_SIZE)  # Forces a page on the first glyph
+        self._row_height = 0
+
+        for char in preload:
+            self._add(char)
+
+    def _add(self, char: str) -> tuple[int, pg.Rect, int]:
+        img = self.font.render(char, True, (255, 255, 255))
+        advance = self.font.size(char)[0]
+        w, h = img.get_size()
+
+        x, y = self._cursor
+        if x + w > PAGE_SIZE:
+            x, y = 0, y + self._row_height + GLYPH_PADDING
+            self._row_height = 0
+        if y + h > PAGE_SIZE:
+            self.pages.append(pg.Surface((PAGE_SIZE, PAGE_SIZE), pg.SRCALPHA))
+            x, y = 0, 0
+            self._row_height = 0
+
+        page = len(self.pages) - 1
+        self.pages[page].blit(img, (x, y))
+        self._cursor = (x + w + GLYPH_PADDING, y)
+        self._row_height = max(self._row_height, h)
+
+        # The page changed, its tinted copies are stale
+        for key in [key for key in self._tints if key[0] == page]:
+            del self._tints[key]
+
+        glyph = (page, pg.Rect(x, y, w, h), advance)
+        self.glyphs[char] = glyph
+        return glyph
+
+    def glyph(self, char: str) -> tuple[int, pg.Rect, int]:
+        glyph = self.glyphs.get(char)
+        return glyph if glyph is not None else self._add(char)
+
+    def _tinted(self, page: int, colour: Colour) -> Surface:
+        key = (page, colour)
+        tinted = self._tints.get(key)
+        if tinted is None:
+            if len(self._tints) >= MAX_TINTS:
+                del self._tints[next(iter(self._tints))]
+            tinted = self.pages[page].copy()
+            tinted.fill((*colour[:3], 255), special_flags=pg.BLEND_RGBA_MULT)
+            if pg.display.get_surface() is not None:
+                tinted = tinted.convert_alpha()  # Display pixel format blits faster
+            self._tints[key] = tinted
+        return tinted
+
+    def measure(self, text: str) -> int:
+        glyph = self.glyph
+        return sum(glyph(char)[2] for char in text)
+
+    def draw(self, surface: Surface, pos: tuple[int, int], text: str, colour: Colour,
+             special_flags: int = 0) -> int:
+        """Blits one line of text with its top-left at pos, returns its width."""
+        colour = tuple(colour)
+        x, y = pos
+        blits = []
+        for char in text:
+            page, rect, advance = self.glyph(char)
+            if char != " ":
+                blits.append((self._tinted(page, colour), (x, y), rect, special_flags))
+            x += advance
+        surface.blits(blits, doreturn=False)
+        return x - pos[0]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(surface_nbytes(page) for page in [*self.pages, *self._tints.values()])
+
+
+class AtlasTextRenderer:
+    """Atlases for every (font, size) drawn with it, built on demand."""
+
+    def __init__(self, fonts: FontCache) -> None:
+        self.fonts = fonts
+        self._atlases: dict[FontKey, GlyphAtlas] = {}
+
+    def atlas(self, size: int, font_path: Path | str | None = None) -> GlyphAtlas:
+        key = (str(font_path) if font_path else None, size)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = self._atlases[key] = GlyphAtlas(self.fonts.get(font_path, size))
+        return atlas
+
+    def layout(self, text: str, size: int, font_path: Path | str | None = None,
+               wrap_width: int | None = None) -> tuple[list[str], int, int]:
+        """Splits text into lines and returns (lines, width, height)."""
+        atlas = self.atlas(size, font_path)
+        if wrap_width is None:
+            lines = text.split("\n")
+        else:
+            lines = wrap_words(text, wrap_width, atlas.measure)
+        width = max(atlas.measure(line) for line in lines)
+        height = atlas.height + atlas.line_height * (len(lines) - 1)
+        return lines, width, height
+
+    def draw(self, surface: Surface, pos: tuple[int, int], lines: list[str], colour: Colour,
+             size: int, font_path: Path | str | None = None) -> None:
+        atlas = self.atlas(size, font_path)
+        x, y = pos
+        for line in lines:
+            atlas.draw(surface, (x, y), line, colour)
+            y += atlas.line_height
+
+    def compose(self, buffer: Surface | None, lines: list[str], text_size: tuple[int, int],
+                colour: Colour, size: int, font_path: Path | str | None = None) -> Surface:
+        """Draws lines into a transparent buffer and returns it. The buffer is
+        reused if it's big enough, so recycled list rows stop allocating once
+        they have seen their longest text."""
+        w, h = text_size
+        if buffer is None or buffer.get_width() < w or buffer.get_height() < h:
+            old_w, old_h = buffer.get_size() if buffer is not None else (0, 0)
+            buffer = pg.Surface((max(w, old_w, 1), max(h, old_h, 1)), pg.SRCALPHA)
+        else:
+            buffer.fill((0, 0, 0, 0))
+
+        # MAX instead of alpha blending, so glyph edges don't pick up the
+        # buffer's transparent black
+        atlas = self.atlas(size, font_path)
+        y = 0
+        for line in lines:
+            atlas.draw(buffer, (0, y), line, colour, pg.BLEND_RGBA_MAX)
+            y += atlas.line_height
+        return buffer
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "atlases": len(self._atlases),
+            "pages": sum(len(atlas.pages) for atlas in self._atlases.values()),
+            "glyphs": sum(len(atlas.glyphs) for atlas in self._atlases.values()),
+            "bytes": sum(atlas.nbytes for atlas in self._atlases.values()),
+        }
+
+    def clear(self) -> None:
+        self._atlases.clear()
+
+
+# Shared atlas renderer, used by draw_text(renderer="atlas")
+atlases = AtlasTextRenderer(fonts)
+accountant.register("cache", "render: glyph atlases", lambda: atlases.stats()["bytes"])
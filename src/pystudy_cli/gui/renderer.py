@@ -0,0 +1,118 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""Dirty-rectangle renderer and idle-aware event pump for the GUI."""
+
+import pygame as pg
+
+from pystudy_cli.core.custom_types import Colour
+from pystudy_cli.core.tracing import traced
+from pystudy_cli.gui.custom_types import Surface
+from pystudy_cli.gui.ui_elements import Widget
+
+FPS_CAP = 60
+IDLE_WAKEUP_MS = 1000  # Longest the loop sleeps without input, keeps the window responsive
+
+# Events that mean the whole window has to be redrawn
+FULL_REDRAW_EVENTS = {pg.VIDEORESIZE, pg.VIDEOEXPOSE, pg.WINDOWEXPOSED, pg.WINDOWSIZECHANGED}
+
+
+class DirtyRectRenderer:
+    """Redraws only the widgets that reported changes and updates only
+    those parts of the display, instead of flipping the whole window."""
+
+    def __init__(self, window: Surface, background: Colour) -> None:
+        self.window = window
+        self.background = background
+        self.widgets: list[Widget] = []
+        self.full_redraw = True
+        self.frames = 0
+        self.updated_area = 0  # Pixels pushed to the display, for benchmarks
+
+    def add(self, *widgets: Widget) -> None:
+        self.widgets.extend(widgets)
+        self.full_redraw = True
+
+    def remove(self, widget: Widget) -> None:
+        self.widgets.remove(widget)
+        self.full_redraw = True
+
+    def invalidate(self) -> None:
+        """Forces a full redraw on the next frame (e.g. after a resize)."""
+        self.full_redraw = True
+
+    @property
+    def animating(self) -> bool:
+        return any(widget.visible and widget.animating for widget in self.widgets)
+
+    def handle_events(self, event_list: list[pg.event.Event]) -> None:
+        for e in event_list:
+            if e.type in FULL_REDRAW_EVENTS:
+                self.invalidate()
+        for widget in self.widgets:
+            widget.update(event_list)
+
+    @traced("gui.render")
+    def render(self) -> list[pg.Rect]:
+        """Draws the next frame and returns the rects that were updated."""
+        if self.full_redraw:
+            self.window.fill(self.background)
+            for widget in self.widgets:
+                if widget.visible:
+                    widget.draw(self.window)
+                    widget.mark_drawn()
+            pg.display.flip()
+            self.full_redraw = False
+            self.frames += 1
+            rect = self.window.get_rect()
+            self.updated_area += rect.w * rect.h
+            return [rect]
+
+        rects: list[pg.Rect] = []
+        for widget in self.widgets:
+            if widget.animating:
+                widget.mark_dirty()
+            if widget.dirty:
+                rects.extend(widget.dirty_rects())
+
+        if not rects:
+            return []
+
+        for rect in rects:
+            self.window.fill(self.background, rect)
+
+        # Redraw everything touching a cleared area, so overlapping widgets stay intact
+        for widget in self.widgets:
+            if not widget.visible:
+                if widget.dirty:
+                    widget.dirty = False
+                    widget._drawn_rect = None
+                continue
+            if widget.dirty or widget.rect.collidelist(rects) != -1:
+                widget.draw(self.window)
+                widget.mark_drawn()
+
+        pg.display.update(rects)
+        self.frames += 1
+        self.updated_area += sum(rect.w * rect.h for rect in rects)
+        return rects
+
+def wait_for_events(animating: bool) -> list[pg.event.Event]:
+    """Returns pending events. When nothing is animating this blocks until
+    input arrives (or IDLE_WAKEUP_MS passes), so an idle window uses no CPU."""
+    if animating:
+        return pg.event.get()
+
+    first = pg.event.wait(IDLE_WAKEUP_MS)
+    if first.type == pg.NOEVENT:
+        return []
+    return [first, *pg.event.get()]
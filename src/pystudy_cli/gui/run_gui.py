@@ -12,13 +12,43 @@
 
 import pygame as pg
 
+from pystudy_cli.gui.renderer import FPS_CAP, DirtyRectRenderer, wait_for_events
+from pystudy_cli.gui.ui_elements import Button, Label
+
+WINDOW_SIZE = (960, 640)
+BG_COLOUR = (24, 24, 32)
+TEXT_COLOUR = (235, 235, 245)
+BUTTON_COLOUR = (60, 60, 84)
+BUTTON_HOVER_COLOUR = (84, 84, 116)
+
 
 def main():
     pg.init()
+    window = pg.display.set_mode(WINDOW_SIZE, pg.RESIZABLE)
+    pg.display.set_caption("PyStudy")
+    clock = pg.time.Clock()
+
+    renderer = DirtyRectRenderer(window, BG_COLOUR)
+    title = Label((WINDOW_SIZE[0] // 2, 80), "PyStudy", TEXT_COLOUR, 64, horiz_align="centre")
+    quit_button = Button((WINDOW_SIZE[0] // 2, WINDOW_SIZE[1] - 80), 160, 48,
+                         BUTTON_COLOUR, TEXT_COLOUR, "Quit", hover_colour=BUTTON_HOVER_COLOUR)
+    renderer.add(title, quit_button)
+
+    running = True
+    while running:
+        # Blocks while idle, so a static screen costs (almost) no CPU
+        events = wait_for_events(renderer.animating)
+
+        for e in events:
+            if e.type == pg.QUIT:
+                running = False
+
+        renderer.handle_events(events)
+        if quit_button.check_click(events):
+            running = False
 
-    # running = True
-    # while running:
-    #     pass  # TODO: Add GUI logic
+        renderer.render()
+        clock.tick(FPS_CAP)  # Caps bursts of input (e.g. mouse motion) to FPS_CAP frames
 
     pg.quit()
 
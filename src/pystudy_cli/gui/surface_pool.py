@@ -0,0 +1,104 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""Reusable overlay surfaces for draw_transparent_rect and similar widgets."""
+
+from collections import OrderedDict
+
+import pygame as pg
+
+from pystudy_cli.core.custom_types import AColour, Colour
+from pystudy_cli.core.memory import accountant
+from pystudy_cli.gui.text_cache import surface_nbytes
+
+DEFAULT_MAX_ENTRIES = 128    # Distinct overlays kept ready to blit
+DEFAULT_MAX_FREE_PER_SIZE = 4  # Evicted surfaces kept per size for reuse
+
+OverlayKey = tuple[tuple[int, int], AColour, int, Colour | None]
+
+
+class SurfacePool:
+    """Caches filled SRCALPHA overlays by (size, fill colour, border).
+
+    An unchanged overlay is returned as-is, so drawing the same panel every
+    frame allocates nothing. Evicted surfaces go to a per-size free list and
+    are refilled for the next overlay of that size instead of allocating."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_free_per_size: int = DEFAULT_MAX_FREE_PER_SIZE) -> None:
+        self.max_entries = max_entries
+        self.max_free_per_size = max_free_per_size
+        self._cache: OrderedDict[OverlayKey, pg.Surface] = OrderedDict()
+        self._free: dict[tuple[int, int], list[pg.Surface]] = {}
+
+        self.hits = 0         # Overlay returned unchanged
+        self.reuses = 0       # Pooled surface refilled
+        self.allocations = 0  # New pg.Surface created
+        self.evictions = 0
+
+    def overlay(self, size: tuple[float, float], bg_colour: AColour,
+                border_thickness: int = 0, border_colour: Colour = (255, 255, 255)) -> pg.Surface:
+        int_size = (int(size[0]), int(size[1]))
+        key = (int_size, tuple(bg_colour), border_thickness,
+               tuple(border_colour) if border_thickness else None)
+
+        surface = self._cache.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return surface
+
+        free = self._free.get(int_size)
+        if free:
+            surface = free.pop()
+            self.reuses += 1
+        else:
+            surface = pg.Surface(int_size, pg.SRCALPHA)
+            self.allocations += 1
+
+        surface.fill(bg_colour)
+        if border_thickness:
+            pg.draw.rect(surface, border_colour, surface.get_rect(), border_thickness)
+
+        self._cache[key] = surface
+        while len(self._cache) > self.max_entries:
+            (evicted_size, *_), evicted = self._cache.popitem(last=False)
+            self.evictions += 1
+            pool = self._free.setdefault(evicted_size, [])
+            if len(pool) < self.max_free_per_size:
+                pool.append(evicted)
+
+        return surface
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._cache),
+            "pooled": sum(len(pool) for pool in self._free.values()),
+            "hits": self.hits,
+            "reuses": self.reuses,
+            "allocations": self.allocations,
+            "evictions": self.evictions,
+        }
+
+    @property
+    def nbytes(self) -> int:
+        pooled = [surface for pool in self._free.values() for surface in pool]
+        return sum(surface_nbytes(surface) for surface in [*self._cache.values(), *pooled])
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._free.clear()
+
+
+# Shared pool used by draw_transparent_rect
+overlays = SurfacePool()
+accountant.register("cache", "render: overlay surfaces", lambda: overlays.nbytes)
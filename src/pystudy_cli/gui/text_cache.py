@@ -0,0 +1,121 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""Caches for fonts and rendered text surfaces."""
+
+from collections import OrderedDict
+from pathlib import Path
+
+import pygame as pg
+
+from pystudy_cli.core.custom_types import Colour
+from pystudy_cli.core.memory import accountant
+
+DEFAULT_TEXT_CACHE_BUDGET = 32 * 1024 * 1024  # bytes of surface pixel data
+
+FontKey = tuple[str | None, int]
+TextKey = tuple[str, Colour, int, str | None]
+
+
+def surface_nbytes(surface: pg.Surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+
+class FontCache:
+    """Fonts keyed by (path, size). Loading a font reads it from disk,
+    so each combination is only ever loaded once."""
+
+    def __init__(self) -> None:
+        self._fonts: dict[FontKey, pg.font.Font] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, font_path: Path | str | None, size: int) -> pg.font.Font:
+        key = (str(font_path) if font_path else None, size)
+        font = self._fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        if not pg.font.get_init():
+            pg.font.init()
+        font = pg.font.Font(key[0], size) if key[0] else pg.font.SysFont(None, size)
+        self._fonts[key] = font
+        return font
+
+    def clear(self) -> None:
+        self._fonts.clear()
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (text, colour, size, font),
+    evicting least recently used entries once over `budget` bytes."""
+
+    def __init__(self, fonts: FontCache, budget: int = DEFAULT_TEXT_CACHE_BUDGET) -> None:
+        self.fonts = fonts
+        self.budget = budget
+        self._surfaces: OrderedDict[TextKey, pg.Surface] = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, text: str, colour: Colour, size: int,
+               font_path: Path | str | None = None) -> pg.Surface:
+        key = (text, tuple(colour), size, str(font_path) if font_path else None)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.fonts.get(font_path, size).render(text, True, colour)
+        self._surfaces[key] = surface
+        self.nbytes += surface_nbytes(surface)
+
+        # Evict oldest entries, but always keep the one just rendered
+        while self.nbytes > self.budget and len(self._surfaces) > 1:
+            _, evicted = self._surfaces.popitem(last=False)
+            self.nbytes -= surface_nbytes(evicted)
+            self.evictions += 1
+
+        return surface
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "entries": len(self._surfaces),
+            "bytes": self.nbytes,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+            "font_hits": self.fonts.hits,
+            "font_misses": self.fonts.misses,
+        }
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+        self.nbytes = 0
+
+
+# Shared caches used by draw_text
+fonts = FontCache()
+texts = TextCache(fonts)
+accountant.register("cache", "render: text surfaces", lambda: texts.nbytes, lambda: texts.budget)
@@ -10,19 +10,66 @@
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
 from pathlib import Path
+from typing import Any, Callable, Literal, Sequence
 
 import pygame as pg
 
-from pystudy_cli.core.custom_types import Colour, Coord2, Surface
-from pystudy_cli.gui.utils import draw_text
+from pystudy_cli.core.custom_types import Colour, Coord2
+from pystudy_cli.gui.custom_types import Surface
+from pystudy_cli.gui.glyph_atlas import atlases
+from pystudy_cli.gui.utils import TextRenderer, align_rect, draw_text
 
 
-class Button:
+class Widget:
+    """Base class for GUI elements.
+
+    Widgets only get redrawn when they are dirty. Anything that changes
+    how a widget looks should call mark_dirty(), and the renderer will
+    redraw (and flip) just that widget's rect on the next frame."""
+
+    def __init__(self, rect: pg.Rect) -> None:
+        self.rect = rect
+        self.dirty = True
+        self.visible = True
+        self._drawn_rect: pg.Rect | None = None  # Where the widget was last drawn
+
+    def mark_dirty(self) -> None:
+        self.dirty = True
+
+    @property
+    def animating(self) -> bool:
+        """True while the widget needs redrawing every frame without input."""
+        return False
+
+    def update(self, event_list: list[pg.event.Event]) -> None:
+        """Reacts to input. Override and call mark_dirty() on visual changes."""
+        pass
+
+    def draw(self, wn: Surface) -> None:
+        raise NotImplementedError
+
+    def dirty_rects(self) -> list[pg.Rect]:
+        """Screen areas to refresh for this widget: where it is now, plus where
+        it was last drawn if it has moved or been resized since."""
+        rects = [self.rect.copy()]
+        if self._drawn_rect is not None and self._drawn_rect != self.rect:
+            rects.append(self._drawn_rect)
+        return rects
+
+    def mark_drawn(self) -> None:
+        self.dirty = False
+        self._drawn_rect = self.rect.copy()
+
+class Button(Widget):
     """Button that can return pulses in response to user input."""
 
     def __init__(self, pos: Coord2, w, h,
-                 colour: Colour, text_colour: Colour, text: str, font: Path) -> None:
+                 colour: Colour, text_colour: Colour, text: str, font: Path | None = None,
+                 text_size: int = 30, hover_colour: Colour | None = None) -> None:
         self.pos = pg.Vector2(*pos)
         self.w = w
         self.h = h
@@ -30,9 +77,22 @@ class Button:
         self.text_colour = text_colour
         self.text = text
         self.font = font
+        self.text_size = text_size
+        self.hover_colour = hover_colour
+        self.hovered = False
 
-        self.rect = pg.Rect(0, 0, self.w, self.h)
-        self.rect.center = (int(self.pos.x), int(self.pos.y))
+        rect = pg.Rect(0, 0, self.w, self.h)
+        rect.center = (int(self.pos.x), int(self.pos.y))
+        super().__init__(rect)
+
+    def update(self, event_list: list[pg.event.Event]) -> None:
+        for e in event_list:
+            if e.type == pg.MOUSEMOTION:
+                hovered = self.rect.collidepoint(e.pos)
+                if hovered != self.hovered:
+                    self.hovered = hovered
+                    if self.hover_colour is not None:
+                        self.mark_dirty()
 
     def check_click(self, event_list: list[pg.event.Event]) -> bool:
         """Returns True once when button is held down."""
@@ -43,16 +103,59 @@ class Button:
         return False
 
     def draw(self, wn: Surface):
-        pg.draw.rect(wn, self.colour, self.rect)
-        draw_text(wn, (int(self.pos.x), int(self.pos.y)), 'centre', 'centre', self.text, self.text_colour, 30, self.font)
+        colour = self.hover_colour if self.hovered and self.hover_colour is not None else self.colour
+        pg.draw.rect(wn, colour, self.rect)
+        draw_text(wn, (int(self.pos.x), int(self.pos.y)), 'centre', 'centre', self.text, self.text_colour, self.text_size, self.font)
 
 class InputField:
     """Text input field"""
     pass
 
-class Label:
+class Label(Widget):
     """Static text label"""
-    pass
+
+    def __init__(self, pos: Coord2, text: str, colour: Colour, size: int,
+                 font: Path | None = None,
+                 horiz_align: Literal["left", "centre", "right"] = "left",
+                 vert_align: Literal["top", "centre", "bottom"] = "top",
+                 renderer: TextRenderer = "cache", wrap_width: int | None = None) -> None:
+        self.pos = (int(pos[0]), int(pos[1]))
+        self.colour = colour
+        self.size = size
+        self.font = font
+        self.horiz_align: Literal["left", "centre", "right"] = horiz_align
+        self.vert_align: Literal["top", "centre", "bottom"] = vert_align
+        self.renderer: TextRenderer = renderer
+        self.wrap_width = wrap_width
+        self.text = text
+        self._buffer: Surface | None = None  # Composed text, atlas renderer only
+        super().__init__(self._measure())
+
+    def _measure(self) -> pg.Rect:
+        if self.renderer != "atlas":
+            return draw_text(None, self.pos, self.horiz_align, self.vert_align,
+                             self.text, self.colour, self.size, self.font, self.renderer, self.wrap_width)
+
+        # Compose once per text change, so drawing is a single blit
+        lines, w, h = atlases.layout(self.text, self.size, self.font, self.wrap_width)
+        self._buffer = atlases.compose(self._buffer, lines, (w, h), self.colour, self.size, self.font)
+        return align_rect(pg.Rect(0, 0, w, h), self.pos, self.horiz_align, self.vert_align)
+
+    def set_text(self, text: str) -> None:
+        if text != self.text:
+            self.text = text
+            self.rect = self._measure()
+            self.mark_dirty()
+
+    def draw(self, wn: Surface) -> None:
+        if self._buffer is None:
+            draw_text(wn, self.pos, self.horiz_align, self.vert_align,
+                      self.text, self.colour, self.size, self.font, self.renderer, self.wrap_width)
+            return
+
+        # pos may have moved since the text was composed (scrolling rows)
+        r = align_rect(pg.Rect(0, 0, self.rect.w, self.rect.h), self.pos, self.horiz_align, self.vert_align)
+        wn.blit(self._buffer, r, (0, 0, r.w, r.h))
 
 class Checkbox:
     """A simple toggleable checkbox"""
@@ -62,9 +165,190 @@ class Dropdown:
     """Select from a list of options"""
     pass
 
-class ScrollableList:
-    """Scrollable container for cards/questions"""
-    pass
+class RowIndex:
+    """Prefix-sum index of row heights.
+
+    Maps row index -> y offset in O(1) and y offset -> row index in
+    O(log n) with a binary search. Uniform row heights need no storage."""
+
+    def __init__(self, count: int, row_height: int | Sequence[int] | Callable[[int], int]) -> None:
+        self.count = count
+        self.uniform: int | None = None
+        self.offsets: array | None = None
+
+        if isinstance(row_height, int):
+            self.uniform = row_height
+        else:
+            heights = (row_height(i) for i in range(count)) if callable(row_height) else row_height
+            self.offsets = array('q', accumulate(heights, initial=0))
+
+    @property
+    def total_height(self) -> int:
+        if self.uniform is not None:
+            return self.count * self.uniform
+        assert self.offsets is not None
+        return self.offsets[-1]
+
+    def offset(self, index: int) -> int:
+        if self.uniform is not None:
+            return index * self.uniform
+        assert self.offsets is not None
+        return self.offsets[index]
+
+    def height(self, index: int) -> int:
+        return self.offset(index + 1) - self.offset(index)
+
+    def row_at(self, y: float) -> int:
+        """Index of the row containing y (clamped to valid rows)."""
+        if self.count == 0:
+            return 0
+        if self.uniform is not None:
+            index = int(y // self.uniform) if self.uniform else 0
+        else:
+            assert self.offsets is not None
+            index = bisect_right(self.offsets, y) - 1
+        return max(0, min(self.count - 1, index))
+
+class ScrollableList(Widget):
+    """Scrollable container for cards/questions
+
+    Virtualised: only the rows in view (plus `overscan` rows either side)
+    get a Label, and labels are recycled as rows scroll in and out, so the
+    cost of a frame doesn't depend on the number of items.
+
+    text_renderer="atlas" keeps text memory to a few glyph atlas pages
+    instead of a cached surface per distinct row, at the cost of slower
+    scrolling, since newly bound rows are laid out and composed in Python."""
+
+    SCROLL_EASING = 0.35  # Fraction of the remaining distance covered per frame
+
+    def __init__(self, rect: pg.Rect, items: Sequence[Any],
+                 row_height: int | Sequence[int] | Callable[[int], int],
+                 text_colour: Colour, bg_colour: Colour,
+                 item_text: Callable[[Any], str] = str,
+                 font: Path | None = None, text_size: int = 24,
+                 overscan: int = 2, scroll_step: int = 60,
+                 scrollbar_colour: Colour = (120, 120, 140),
+                 text_renderer: TextRenderer = "cache") -> None:
+        super().__init__(rect)
+        self.text_colour = text_colour
+        self.bg_colour = bg_colour
+        self.scrollbar_colour = scrollbar_colour
+        self.item_text = item_text
+        self.font = font
+        self.text_size = text_size
+        self.overscan = overscan
+        self.scroll_step = scroll_step
+        self.text_renderer: TextRenderer = text_renderer
+
+        self.scroll_y = 0.0
+        self.target_y = 0.0
+        self.hovered = False  # Tracked from MOUSEMOTION like Button, decides who gets the wheel
+        self._rows: dict[int, Label] = {}
+        self._free_rows: list[Label] = []
+        self.rows_bound = 0  # Row labels (re)bound to an item, for benchmarks
+
+        self.set_items(items, row_height)
+
+    def set_items(self, items: Sequence[Any],
+                  row_height: int | Sequence[int] | Callable[[int], int]) -> None:
+        self.items = items
+        self.index = RowIndex(len(items), row_height)
+        self._free_rows.extend(self._rows.values())
+        self._rows.clear()
+        self.scroll_y = self.target_y = 0.0
+        self.mark_dirty()
+
+    @property
+    def max_scroll(self) -> float:
+        return max(0, self.index.total_height - self.rect.height)
+
+    @property
+    def animating(self) -> bool:
+        return abs(self.target_y - self.scroll_y) >= 0.5
+
+    def scroll_to(self, y: float, smooth: bool = True) -> None:
+        self.target_y = max(0.0, min(self.max_scroll, y))
+        if not smooth:
+            self.scroll_y = self.target_y
+        self.mark_dirty()
+
+    def jump_to_row(self, index: int, smooth: bool = False) -> None:
+        self.scroll_to(self.index.offset(max(0, min(index, self.index.count - 1))), smooth)
+
+    def visible_range(self) -> range:
+        if not self.index.count:
+            return range(0)
+        first = self.index.row_at(self.scroll_y)
+        last = self.index.row_at(self.scroll_y + self.rect.height)
+        return range(max(0, first - self.overscan), min(self.index.count, last + 1 + self.overscan))
+
+    def update(self, event_list: list[pg.event.Event]) -> None:
+        for e in event_list:
+            if e.type == pg.MOUSEMOTION:
+                self.hovered = self.rect.collidepoint(e.pos)
+            elif e.type == pg.MOUSEWHEEL and self.hovered:
+                self.scroll_to(self.target_y - e.y * self.scroll_step)
+            elif e.type == pg.KEYDOWN:
+                if e.key == pg.K_DOWN:
+                    self.scroll_to(self.target_y + self.scroll_step)
+                elif e.key == pg.K_UP:
+                    self.scroll_to(self.target_y - self.scroll_step)
+                elif e.key == pg.K_PAGEDOWN:
+                    self.scroll_to(self.target_y + self.rect.height)
+                elif e.key == pg.K_PAGEUP:
+                    self.scroll_to(self.target_y - self.rect.height)
+                elif e.key == pg.K_HOME:
+                    self.scroll_to(0)
+                elif e.key == pg.K_END:
+                    self.scroll_to(self.max_scroll)
+
+        # Ease towards the target scroll position
+        if self.animating:
+            self.scroll_y += (self.target_y - self.scroll_y) * self.SCROLL_EASING
+            if not self.animating:
+                self.scroll_y = self.target_y
+            self.mark_dirty()
+
+    def _sync_rows(self) -> None:
+        """Recycles labels for rows that left the view and binds them to new ones."""
+        visible = self.visible_range()
+        for index in [i for i in self._rows if i not in visible]:
+            self._free_rows.append(self._rows.pop(index))
+
+        for index in visible:
+            if index in self._rows:
+                continue
+            text = self.item_text(self.items[index])
+            if self._free_rows:
+                row = self._free_rows.pop()
+                row.set_text(text)
+            else:
+                row = Label((0, 0), text, self.text_colour, self.text_size, self.font,
+                            vert_align="centre", renderer=self.text_renderer)
+            self._rows[index] = row
+            self.rows_bound += 1
+
+    def draw(self, wn: Surface) -> None:
+        self._sync_rows()
+
+        previous_clip = wn.get_clip()
+        wn.set_clip(self.rect)
+        wn.fill(self.bg_colour, self.rect)
+
+        top = self.rect.top - int(self.scroll_y)
+        for index, row in self._rows.items():
+            row.pos = (self.rect.left + 8, top + self.index.offset(index) + self.index.height(index) // 2)
+            row.draw(wn)
+
+        # Scrollbar
+        total = self.index.total_height
+        if total > self.rect.height:
+            bar_h = max(20, self.rect.height * self.rect.height // total)
+            bar_y = self.rect.top + int((self.rect.height - bar_h) * (self.scroll_y / self.max_scroll))
+            pg.draw.rect(wn, self.scrollbar_colour, (self.rect.right - 6, bar_y, 4, bar_h))
+
+        wn.set_clip(previous_clip)
 
 class ProgressBar:
     """Visual indicator of test/quiz progress"""
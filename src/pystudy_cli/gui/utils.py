@@ -15,21 +15,19 @@ from typing import Literal
 
 import pygame as pg
 
-from pystudy_cli.core.custom_types import AColour, Colour, Coord2, Surface
+from pystudy_cli.core.custom_types import AColour, Colour, Coord2
+from pystudy_cli.gui.custom_types import Surface
+from pystudy_cli.gui.glyph_atlas import atlases
+from pystudy_cli.gui.surface_pool import overlays
+from pystudy_cli.gui.text_cache import texts
 
+TextRenderer = Literal["cache", "atlas"]
 
-def draw_text(surface: Surface, pos: Coord2,
-              horiz_align: Literal["left", "centre", "right"],
-              vert_align: Literal["top", "centre", "bottom"],
-              text: str, colour: Colour, size: int, font_path: Path | None = None):
-    if font_path:
-        font = pg.font.Font(str(font_path), size)
-    else:
-        font = pg.font.SysFont(None, size)
-
-    img = font.render(text, True, colour)
-    r = img.get_rect()
 
+def align_rect(r: pg.Rect, pos: Coord2,
+               horiz_align: Literal["left", "centre", "right"],
+               vert_align: Literal["top", "centre", "bottom"]) -> pg.Rect:
+    """Moves r so that pos is at the given alignment point, returns r."""
     # Horizontal
     if horiz_align == "left":
         setattr(r, "left", pos[0])
@@ -49,19 +47,47 @@ def draw_text(surface: Surface, pos: Coord2,
         setattr(r, "bottom", pos[1])
     else:
         raise ValueError("Invalid vert_align")
+    return r
+
+def draw_text(surface: Surface | None, pos: Coord2,
+              horiz_align: Literal["left", "centre", "right"],
+              vert_align: Literal["top", "centre", "bottom"],
+              text: str, colour: Colour, size: int, font_path: Path | None = None,
+              renderer: TextRenderer = "cache", wrap_width: int | None = None) -> pg.Rect:
+    """Draws text aligned to pos and returns the rect it covers.
+    Pass surface=None to only measure the text.
+
+    renderer="atlas" composes the text from a glyph atlas instead of caching a
+    surface per string, which suits long lists of changing card text. Only the
+    atlas renderer can word wrap (to wrap_width pixels)."""
+    if renderer == "atlas":
+        lines, w, h = atlases.layout(text, size, font_path, wrap_width)
+        r = pg.Rect(0, 0, w, h)
+    elif renderer == "cache":
+        if wrap_width is not None:
+            raise ValueError("wrap_width needs renderer='atlas'")
+        img = texts.render(text, colour, size, font_path)
+        r = img.get_rect()
+    else:
+        raise ValueError("Invalid renderer")
+
+    align_rect(r, pos, horiz_align, vert_align)
 
-    surface.blit(img, r)
+    if surface is not None:
+        if renderer == "atlas":
+            atlases.draw(surface, r.topleft, lines, colour, size, font_path)
+        else:
+            surface.blit(img, r)
+    return r
 
 def draw_transparent_rect(surface: Surface, pos: Coord2, size: Coord2,
                           bg_colour: AColour = (0, 0, 0, 180),
                           border_thickness=0, border_colour: Colour = (255, 255, 255),
                           ):
     """Draws a semi-transparent rectangle with a border onto a surface.
-    For a transparent rect only, set border thickness to 0."""
-    box_surf = pg.Surface(size, pg.SRCALPHA)
-    box_surf.fill(bg_colour)
-    if border_thickness:
-        pg.draw.rect(box_surf, border_colour, box_surf.get_rect(), border_thickness)
+    For a transparent rect only, set border thickness to 0.
+    The overlay comes from a shared pool, so repeat draws don't allocate."""
+    box_surf = overlays.overlay(size, bg_colour, border_thickness, border_colour)
     surface.blit(box_surf, pos)
 
 def seconds_to_time(seconds: int) -> str:
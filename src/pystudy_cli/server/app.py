@@ -0,0 +1,188 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Local multi-user study server (`main.py serve`).
+
+One process serves a whole class: every student's profile is loaded once
+into a shared cache instead of each student starting their own copy of the
+app. Only binds to localhost. Endpoints (all JSON):
+
+    GET  /health
+    GET  /stats                                      cache counters
+    GET  /memory                                     resident memory, indexes and caches
+    GET  /profiles/{profile}/decks                   decks with progress
+    GET  /profiles/{profile}/decks/{deck}/cards      ?offset=0&limit=100
+    POST /profiles/{profile}/decks/{deck}/questions  {"kind": "written"|"mcq", "count": 10}
+    POST /profiles/{profile}/decks/{deck}/answers    {"term": ..., "answer": ..., "smart": false}
+
+Answers are graded with the same rules as the TUI and update familiarity
+with on_correct/on_incorrect. For multiple choice, send the chosen option's
+text as the answer.
+"""
+
+import asyncio
+import signal
+import sys
+import traceback
+from pathlib import Path
+from typing import Any
+
+from pystudy_cli.core import library, memory
+from pystudy_cli.core.constants import DEFAULT_PRACTICE_TEST_LEN, FAMILIARITY_LEVELS
+from pystudy_cli.core.objects import Deck, on_correct, on_incorrect
+from pystudy_cli.core.questions import MCQuestion, Question, gen_mcqs, gen_written_qs
+from pystudy_cli.core.stats import deck_stats
+from pystudy_cli.server.http import HTTPError, Request, Router, connection_handler
+from pystudy_cli.server.profiles import DEFAULT_CACHE_SIZE, DEFAULT_SAVE_DELAY, CachedProfile, ProfileCache
+
+HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_PAGE_SIZE = 1000
+MAX_QUESTIONS = 200
+
+
+def _deck(entry: CachedProfile, name: str) -> Deck:
+    assert entry.profile is not None
+    deck = next((d for d in entry.profile.decks if d.name == name), None)
+    if deck is None:
+        raise HTTPError(404, "no such deck")
+    return deck
+
+
+class StudyServer:
+    def __init__(self, cache: ProfileCache) -> None:
+        self.cache = cache
+        self.router = Router()
+        self.router.add("GET", "/health", self.health)
+        self.router.add("GET", "/stats", self.stats)
+        self.router.add("GET", "/memory", self.memory)
+        self.router.add("GET", "/profiles/{profile}/decks", self.list_decks)
+        self.router.add("GET", "/profiles/{profile}/decks/{deck}/cards", self.cards)
+        self.router.add("POST", "/profiles/{profile}/decks/{deck}/questions", self.questions)
+        self.router.add("POST", "/profiles/{profile}/decks/{deck}/answers", self.answer)
+
+    async def health(self, request: Request) -> tuple[int, Any]:
+        return 200, {"status": "ok"}
+
+    async def stats(self, request: Request) -> tuple[int, Any]:
+        return 200, {**self.cache.stats(), "library": library.libraries.stats()}
+
+    async def memory(self, request: Request) -> tuple[int, Any]:
+        return 200, {"resident_kib": memory.resident_memory(), "accounts": memory.accountant.report()}
+
+    async def list_decks(self, request: Request) -> tuple[int, Any]:
+        async with self.cache.use(request.params["profile"]) as entry:
+            assert entry.profile is not None
+            decks = []
+            for deck in entry.profile.decks:
+                stats = deck_stats(deck)
+                decks.append({
+                    "name": deck.name,
+                    "library": deck.library,
+                    "cards": stats.cards,
+                    "progress": round(stats.progress, 4),
+                    "levels": {FAMILIARITY_LEVELS[lvl].ui_text: n for lvl, n in stats.level_counts.items()},
+                })
+            return 200, {"profile": entry.profile.name, "decks": decks}
+
+    async def cards(self, request: Request) -> tuple[int, Any]:
+        offset = max(0, request.query_int("offset", 0))
+        limit = min(MAX_PAGE_SIZE, max(0, request.query_int("limit", 100)))
+        async with self.cache.use(request.params["profile"]) as entry:
+            deck = _deck(entry, request.params["deck"])
+            page = deck.cards[offset:offset + limit]
+            return 200, {
+                "total": len(deck.cards),
+                "offset": offset,
+                "cards": [
+                    {"term": c.term, "definition": c.def_, "familiarity_level": c.familiarity_level}
+                    for c in page
+                ],
+            }
+
+    async def questions(self, request: Request) -> tuple[int, Any]:
+        body = request.json()
+        kind = body.get("kind", "written")
+        count = body.get("count", DEFAULT_PRACTICE_TEST_LEN)
+        if kind not in ("written", "mcq"):
+            raise HTTPError(400, "kind must be 'written' or 'mcq'")
+        if not isinstance(count, int) or isinstance(count, bool) or not 1 <= count <= MAX_QUESTIONS:
+            raise HTTPError(400, f"count must be an integer from 1 to {MAX_QUESTIONS}")
+
+        async with self.cache.use(request.params["profile"]) as entry:
+            deck = _deck(entry, request.params["deck"])
+            if kind == "mcq":
+                mcqs: list[MCQuestion] = gen_mcqs(deck, count)
+                if not mcqs and deck.cards:
+                    raise HTTPError(409, "not enough cards for multiple choice")
+                return 200, {"questions": [{"term": q.text, "options": q.options} for q in mcqs]}
+
+            written: list[Question] = gen_written_qs(deck, count)
+            return 200, {"questions": [{"term": q.text} for q in written]}
+
+    async def answer(self, request: Request) -> tuple[int, Any]:
+        body = request.json()
+        term, answer = body.get("term"), body.get("answer")
+        if not isinstance(term, str) or not isinstance(answer, str):
+            raise HTTPError(400, "term and answer must be strings")
+
+        async with self.cache.use(request.params["profile"]) as entry:
+            if entry.read_only:
+                raise HTTPError(409, "profile was only partially loaded, answers can't be saved")
+            _deck(entry, request.params["deck"])
+            card = entry.card(request.params["deck"], term)
+            if card is None:
+                raise HTTPError(404, "no such card")
+
+            correct = Question.is_correct_answer(card.def_, answer, bool(body.get("smart", False)))
+            (on_correct if correct else on_incorrect)(card)
+            assert entry.profile is not None
+            entry.profile.mark_studied()
+            self.cache.mark_dirty(entry)
+            return 200, {"correct": correct, "correct_answer": card.def_,
+                         "familiarity_level": card.familiarity_level}
+
+
+def _log_error(e: BaseException) -> None:
+    traceback.print_exception(e, file=sys.stderr)
+
+async def serve(root: Path, port: int = DEFAULT_PORT, cache_size: int = DEFAULT_CACHE_SIZE,
+                save_delay: float = DEFAULT_SAVE_DELAY, library_dir: Path | None = None) -> None:
+    cache = ProfileCache(root, cache_size, save_delay, library_dir)
+    app = StudyServer(cache)
+    server = await asyncio.start_server(connection_handler(app.router, _log_error), HOST, port, backlog=1024)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows: Ctrl+C still raises KeyboardInterrupt
+
+    print(f"Serving profiles from {root} on http://{HOST}:{port}", file=sys.stderr, flush=True)
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        # Nothing answered is lost on shutdown
+        await cache.flush_all()
+        print(f"Stopped, {cache.saves} save(s) written.", file=sys.stderr)
+
+def run(root: Path, port: int = DEFAULT_PORT, cache_size: int = DEFAULT_CACHE_SIZE,
+        save_delay: float = DEFAULT_SAVE_DELAY, library_dir: Path | None = None) -> int:
+    try:
+        asyncio.run(serve(root, port, cache_size, save_delay, library_dir))
+    except KeyboardInterrupt:
+        pass
+    return 0
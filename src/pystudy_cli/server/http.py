@@ -0,0 +1,183 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Minimal HTTP/1.1 JSON server on asyncio streams.
+
+Just enough HTTP for the study server: one request at a time per
+connection, Content-Length bodies (no chunked encoding), keep-alive by
+default. Handlers take a Request and return (status, JSON-able body).
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable
+from urllib.parse import parse_qs, unquote, urlsplit
+
+MAX_HEADER_LINES = 100
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class HTTPError(Exception):
+    """Raised by handlers to send an error response."""
+
+    def __init__(self, status: int, msg: str) -> None:
+        super().__init__(msg)
+        self.status = status
+        self.msg = msg
+
+
+@dataclass
+class Request:
+    method: str
+    path: list[str]  # Unquoted path segments
+    query: dict[str, list[str]]
+    headers: dict[str, str]
+    body: bytes = b""
+    params: dict[str, str] = field(default_factory=dict)  # Filled in by the router
+
+    def json(self) -> dict[str, Any]:
+        """The body as a JSON object, {} if there's no body."""
+        if not self.body:
+            return {}
+        try:
+            data = json.loads(self.body)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise HTTPError(400, f"invalid JSON body: {e}")
+        if not isinstance(data, dict):
+            raise HTTPError(400, "expected a JSON object")
+        return data
+
+    def query_int(self, name: str, default: int) -> int:
+        try:
+            return int(self.query.get(name, [default])[0])
+        except ValueError:
+            raise HTTPError(400, f"query parameter '{name}' must be an integer")
+
+
+Handler = Callable[[Request], Awaitable[tuple[int, Any]]]
+
+
+class Router:
+    """Routes like "/profiles/{profile}/decks" to handlers by method."""
+
+    def __init__(self) -> None:
+        self._routes: list[tuple[str, list[str], Handler]] = []
+
+    def add(self, method: str, pattern: str, handler: Handler) -> None:
+        self._routes.append((method, pattern.strip("/").split("/"), handler))
+
+    def resolve(self, request: Request) -> Handler:
+        path_matched = False
+        for method, pattern, handler in self._routes:
+            if len(pattern) != len(request.path):
+                continue
+            params = {}
+            for part, segment in zip(pattern, request.path):
+                if part.startswith("{"):
+                    params[part[1:-1]] = segment
+                elif part != segment:
+                    break
+            else:
+                path_matched = True
+                if method == request.method:
+                    request.params = params
+                    return handler
+
+        if path_matched:
+            raise HTTPError(405, "method not allowed")
+        raise HTTPError(404, "not found")
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Request | None:
+    request_line = await reader.readline()
+    if not request_line:
+        return None  # Client closed the connection
+
+    try:
+        method, target, _version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "malformed request line")
+
+    headers: dict[str, str] = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise HTTPError(431, "too many headers")
+
+    try:
+        length = int(headers.get("content-length", "0") or 0)
+    except ValueError:
+        raise HTTPError(400, "invalid Content-Length")
+    if length < 0:
+        raise HTTPError(400, "invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, "request body too large")
+    body = await reader.readexactly(length) if length else b""
+
+    url = urlsplit(target)
+    path = [unquote(segment) for segment in url.path.strip("/").split("/") if segment]
+    return Request(method.upper(), path, parse_qs(url.query), headers, body)
+
+def _response(status: int, body: Any, keep_alive: bool) -> bytes:
+    payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+    reason = HTTPStatus(status).phrase
+    head = (
+        f"HTTP/1.1 {status} {reason}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + payload
+
+def connection_handler(router: Router, on_error: Callable[[BaseException], None]):
+    """Returns a callback for asyncio.start_server that serves requests with router."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                keep_alive = True
+                request = None
+                try:
+                    request = await _read_request(reader)
+                    if request is None:
+                        break
+                    keep_alive = request.headers.get("connection", "").lower() != "close"
+                    status, body = await router.resolve(request)(request)
+                except HTTPError as e:
+                    status, body = e.status, {"error": e.msg}
+                    if request is None:
+                        keep_alive = False  # Couldn't parse the request, the stream is out of sync
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except Exception as e:
+                    on_error(e)
+                    status, body = 500, {"error": "internal server error"}
+                    if request is None:
+                        keep_alive = False
+
+                writer.write(_response(status, body, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    return handle
@@ -0,0 +1,209 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Shared cache of loaded profiles for the study server.
+
+Each profile is a data directory under the server root
+(<root>/<profile id>/save_data.json + decks/). Loaded profiles stay in an
+LRU cache so a class of students doesn't re-parse JSON on every request.
+Every entry has its own asyncio lock: requests for one profile are
+serialised, requests for different profiles run concurrently.
+
+Saves are write-behind: answering a question only marks the profile
+dirty, and it's written SAVE_DELAY seconds later (batching every answer
+in between into one save). Dirty profiles are flushed before they're
+evicted and when the server stops.
+
+Library decks (see core.library) are shared by every profile using them:
+the card text is mapped once and each profile only holds its levels.
+"""
+
+import asyncio
+import contextlib
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncIterator
+
+from pystudy_cli.core.data_manager import LoadStatCategory, load_profile, save_profile
+from pystudy_cli.core.memory import accountant, deep_size
+from pystudy_cli.core.objects import Card
+from pystudy_cli.core.profile import StudyProfile
+from pystudy_cli.core.registry import ProfileRegistry
+from pystudy_cli.server.http import HTTPError
+
+DEFAULT_CACHE_SIZE = 64
+DEFAULT_SAVE_DELAY = 2.0  # seconds
+
+
+class CachedProfile:
+    def __init__(self, profile_id: str, head: Path) -> None:
+        self.profile_id = profile_id
+        self.head = head
+        self.profile: StudyProfile | None = None
+        self.read_only = False  # Partially loaded, saving would lose decks
+        self.lock = asyncio.Lock()
+        self.users = 0          # Requests currently holding this entry, never evicted while > 0
+        self.dirty = False
+        self.flush_task: asyncio.Task | None = None
+        self._card_index: dict[str, dict[str, Card]] = {}
+
+    def card(self, deck_name: str, term: str) -> Card | None:
+        """Looks a card up by term, building the deck's index on first use."""
+        index = self._card_index.get(deck_name)
+        if index is None:
+            assert self.profile is not None
+            deck = next((d for d in self.profile.decks if d.name == deck_name), None)
+            if deck is None:
+                return None
+            index = self._card_index[deck_name] = {}
+            for card in deck.cards:
+                index.setdefault(card.term, card)
+        return index.get(term)
+
+
+class ProfileCache:
+    """LRU cache of profiles with per-profile locks and write-behind saves."""
+
+    def __init__(self, root: Path, capacity: int = DEFAULT_CACHE_SIZE,
+                 save_delay: float = DEFAULT_SAVE_DELAY, library_dir: Path | None = None) -> None:
+        self.root = root
+        self.library_dir = library_dir
+        self.capacity = capacity
+        self.save_delay = save_delay
+        self._entries: OrderedDict[str, CachedProfile] = OrderedDict()
+        self._evictor: asyncio.Task | None = None
+
+        self.hits = 0
+        self.misses = 0
+        self.saves = 0
+        self.save_failures = 0
+        self.evictions = 0
+
+        accountant.register("cache", "server profiles",
+                            lambda: deep_size([e.profile for e in self._entries.values()]))
+        # The dicts only, the cards they point to are part of the profiles
+        accountant.register("index", "server card index", lambda: sum(
+            sys.getsizeof(index) for e in self._entries.values() for index in e._card_index.values()))
+
+    def head_path(self, profile_id: str) -> Path:
+        if not ProfileRegistry.is_valid_id(profile_id):
+            raise HTTPError(400, "invalid profile id")
+        return self.root / profile_id / "save_data.json"
+
+    @contextlib.asynccontextmanager
+    async def use(self, profile_id: str) -> AsyncIterator[CachedProfile]:
+        """Yields the locked, loaded entry for profile_id."""
+        entry = self._entries.get(profile_id)
+        if entry is None:
+            self.misses += 1
+            entry = self._entries[profile_id] = CachedProfile(profile_id, self.head_path(profile_id))
+        else:
+            self.hits += 1
+            self._entries.move_to_end(profile_id)
+
+        entry.users += 1
+        try:
+            async with entry.lock:
+                if entry.profile is None:
+                    await self._load(entry)
+                yield entry
+        finally:
+            entry.users -= 1
+            # Evicting may mean saving another profile first, so it never holds up this response
+            if len(self._entries) > self.capacity and (self._evictor is None or self._evictor.done()):
+                self._evictor = asyncio.get_running_loop().create_task(self._evict())
+
+    async def _load(self, entry: CachedProfile) -> None:
+        profile, status = await asyncio.to_thread(load_profile, entry.head, self.library_dir)
+        if status.category == LoadStatCategory.NEW:
+            self._entries.pop(entry.profile_id, None)
+            raise HTTPError(404, "no such profile")
+        if status.category in (LoadStatCategory.CORRUPT, LoadStatCategory.ERROR):
+            self._entries.pop(entry.profile_id, None)
+            raise HTTPError(500, f"profile can't be loaded ({status.category.name.lower()})")
+
+        entry.profile = profile
+        entry.read_only = status.category == LoadStatCategory.PARTIAL
+
+    def mark_dirty(self, entry: CachedProfile) -> None:
+        """Schedules a save of entry in save_delay seconds, unless one is pending."""
+        entry.dirty = True
+        if entry.flush_task is None or entry.flush_task.done():
+            entry.flush_task = asyncio.get_running_loop().create_task(self._flush_later(entry))
+
+    async def _flush_later(self, entry: CachedProfile) -> None:
+        await asyncio.sleep(self.save_delay)
+        async with entry.lock:
+            await self._save(entry)
+
+    async def _save(self, entry: CachedProfile) -> None:
+        """Saves entry if dirty. The caller holds entry.lock."""
+        if not entry.dirty or entry.profile is None:
+            return
+        entry.dirty = False
+        # A cancelled task must not give the lock up halfway through a write,
+        # or the next save of this profile could race it to the same files
+        write = asyncio.ensure_future(asyncio.to_thread(save_profile, entry.profile, entry.head))
+        try:
+            err = await asyncio.shield(write)
+        except asyncio.CancelledError:
+            err = await write
+            self._count_save(entry, err)
+            raise
+        self._count_save(entry, err)
+
+    def _count_save(self, entry: CachedProfile, err: str | None) -> None:
+        if err is None:
+            self.saves += 1
+            return
+
+        self.save_failures += 1
+        print(f"pystudy serve: saving {entry.profile_id} failed: {err}", file=sys.stderr)
+        entry.dirty = True
+
+    async def _evict(self) -> None:
+        while len(self._entries) > self.capacity:
+            victim = next((e for e in self._entries.values() if e.users == 0 and not e.lock.locked()), None)
+            if victim is None:
+                return  # Everything is in use, go over capacity for now
+
+            async with victim.lock:
+                await self._save(victim)
+                if victim.users or victim.dirty:
+                    return  # Picked up again while saving, or the save failed
+                if victim.flush_task is not None:
+                    victim.flush_task.cancel()
+                self._entries.pop(victim.profile_id, None)
+                self.evictions += 1
+
+    async def flush_all(self) -> None:
+        if self._evictor is not None:
+            self._evictor.cancel()
+        for entry in list(self._entries.values()):
+            if entry.flush_task is not None:
+                entry.flush_task.cancel()
+            async with entry.lock:
+                await self._save(entry)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "capacity": self.capacity,
+            "dirty": sum(1 for e in self._entries.values() if e.dirty),
+            "hits": self.hits,
+            "misses": self.misses,
+            "saves": self.saves,
+            "save_failures": self.save_failures,
+            "evictions": self.evictions,
+        }
@@ -10,6 +10,8 @@
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 
+from pystudy_cli.core.constants import FAMILIARITY_LEVELS
+
 # Define colours
 
 def rgb(r: int, g: int, b: int, bg: bool = False) -> str:
@@ -57,6 +59,11 @@ COL_CURRENT_CARD = COL_ACCENT
 # Other colours
 COL_NAME = col(123)
 
+# Familiarity levels
+FAMILIARITY_COLOURS: dict[int, str] = {
+    idx: col(level.colour_id) for idx, level in FAMILIARITY_LEVELS.items()
+}
+
 def _main():
     print("=== 256-Color Palette ===")
     for i in range(256):  # Palette viewer
@@ -93,5 +100,9 @@ def _main():
     print(f"{COL_CURRENT_CARD}COL_CURRENT_CARD: Sample Text{RESET}\n")
     print(f"{COL_NAME}COL_NAME: Sample Text{RESET}\n")
 
+    print("=== Familiarity Levels ===\n")
+    for idx, level in FAMILIARITY_LEVELS.items():
+        print(f"Familiarity Level {idx}: {FAMILIARITY_COLOURS[idx]}{level.ui_text}{RESET}")
+
 if __name__ == "__main__":
     _main()
\ No newline at end of file
@@ -0,0 +1,167 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Opt-in key-to-frame latency instrumentation (`main.py --latency`).
+
+A key is timestamped when `cursor_input`/`line_input` returns it, and the
+frame it triggered is considered complete when the next prompt is shown.
+Samples go into a fixed-size ring buffer of plain integer arrays, so
+recording is a handful of array stores and costs nothing when disabled.
+"""
+
+import atexit
+import functools
+import sys
+import time
+from array import array
+from pathlib import Path
+
+from pystudy_cli.core.memory import accountant
+from pystudy_cli.core.stats import percentile
+from pystudy_cli.core.tracing import FRAMES_TID, tracer
+
+DEFAULT_CAPACITY = 8192
+PERCENTILES = (50, 90, 99)
+
+
+class LatencyRecorder:
+    """Records key-to-frame latency per screen in a ring buffer."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.enabled = False
+        self.trace_path: Path | None = None
+        self.capacity = capacity
+
+        self._screen_ids: dict[str, int] = {}
+        self._screen_names: list[str] = []
+        self._stack: list[int] = []
+
+        self._screen = array('H', bytes(2 * capacity))
+        self._key_ns = array('q', bytes(8 * capacity))
+        self._frame_ns = array('q', bytes(8 * capacity))
+        self._next = 0
+        self._count = 0
+        self._pending_key: int | None = None
+
+    @property
+    def nbytes(self) -> int:
+        return sum(sys.getsizeof(buffer) for buffer in (self._screen, self._key_ns, self._frame_ns))
+
+    def enable(self, trace_path: Path | None = None) -> None:
+        self.enabled = True
+        self.trace_path = trace_path
+        atexit.register(self.dump)
+
+    # Screens
+    def _screen_id(self, name: str) -> int:
+        screen_id = self._screen_ids.get(name)
+        if screen_id is None:
+            screen_id = self._screen_ids[name] = len(self._screen_names)
+            self._screen_names.append(name)
+        return screen_id
+
+    def push_screen(self, name: str) -> None:
+        self._stack.append(self._screen_id(name))
+
+    def pop_screen(self) -> None:
+        self._stack.pop()
+
+    # Samples
+    def key(self) -> None:
+        """Called when a key (or line) has been read."""
+        if self.enabled or tracer.enabled:
+            self._pending_key = time.perf_counter_ns()
+
+    def frame(self) -> None:
+        """Called when a screen is done drawing and waits for input again."""
+        if self._pending_key is None:
+            return
+
+        screen_id = self._stack[-1] if self._stack else self._screen_id("<top>")
+        now = time.perf_counter_ns()
+        # Also a render span for --trace, on its own lane
+        tracer.add("render", self._pending_key, now, self._screen_names[screen_id], FRAMES_TID)
+        if not self.enabled:
+            self._pending_key = None
+            return
+
+        i = self._next
+        self._screen[i] = screen_id
+        self._key_ns[i] = self._pending_key
+        self._frame_ns[i] = now
+        self._pending_key = None
+
+        self._next = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def samples(self):
+        """Yields (screen, key_ns, frame_ns) oldest first."""
+        start = (self._next - self._count) % self.capacity
+        for n in range(self._count):
+            i = (start + n) % self.capacity
+            yield self._screen_names[self._screen[i]], self._key_ns[i], self._frame_ns[i]
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Per-screen latency percentiles in milliseconds."""
+        by_screen: dict[str, list[int]] = {}
+        for screen, key_ns, frame_ns in self.samples():
+            by_screen.setdefault(screen, []).append(frame_ns - key_ns)
+
+        result = {}
+        for screen, values in sorted(by_screen.items()):
+            values.sort()
+            stats = {"count": len(values)}
+            for pct in PERCENTILES:
+                stats[f"p{pct}"] = percentile(values, pct) / 1e6
+            stats["max"] = values[-1] / 1e6
+            result[screen] = stats
+        return result
+
+    def dump(self) -> None:
+        """Prints the summary to stderr and writes the trace file."""
+        if not self.enabled or not self._count:
+            return
+
+        print("\nKey-to-frame latency (ms)", file=sys.stderr)
+        print(f"{'screen':<20}{'count':>7}" + "".join(f"{'p' + str(p):>9}" for p in PERCENTILES) + f"{'max':>9}",
+              file=sys.stderr)
+        for screen, stats in self.summary().items():
+            cols = "".join(f"{stats[f'p{p}']:>9.2f}" for p in PERCENTILES)
+            print(f"{screen:<20}{stats['count']:>7}{cols}{stats['max']:>9.2f}", file=sys.stderr)
+
+        if self.trace_path is not None:
+            self.trace_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.trace_path.open("w", encoding="utf-8") as f:
+                f.write("screen,key_ns,frame_ns,latency_us\n")
+                for screen, key_ns, frame_ns in self.samples():
+                    f.write(f"{screen},{key_ns},{frame_ns},{(frame_ns - key_ns) / 1000:.1f}\n")
+            print(f"Trace written to {self.trace_path}", file=sys.stderr)
+
+
+recorder = LatencyRecorder()
+accountant.register("buffer", "latency samples", lambda: recorder.nbytes)
+
+def screen(func):
+    """Decorator for screen coroutines, attributes frames to the screen by name."""
+    name = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        recorder.push_screen(name)
+        try:
+            with tracer.span("screen", name):
+                return await func(*args, **kwargs)
+        finally:
+            recorder.pop_screen()
+
+    return wrapper
@@ -10,17 +10,18 @@
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 
-import difflib
 import random
+from array import array
 
 from pystudy_cli.core.constants import (
     DEFAULT_CARDS_PER_ROUND,
     DEFAULT_PRACTICE_TEST_LEN,
-    DEFAULT_SMART_GRADING_STRICTNESS,
     FAMILIARITY_LEVELS,
     NUM_MCQ_OPTIONS,
 )
 from pystudy_cli.core.objects import Deck, on_correct, on_incorrect
+from pystudy_cli.core.questions import MCQuestion, Question, gen_mcqs, gen_written_qs
+from pystudy_cli.core.terminal import terminal
 from pystudy_cli.tui.colours import (
     COL_ACCENT,
     COL_ANSWERED1,
@@ -37,94 +38,145 @@ from pystudy_cli.tui.colours import (
     COL_UNANSWERED1,
     COL_UNANSWERED2,
     COL_WHITE,
+    FAMILIARITY_COLOURS,
     RESET,
 )
+from pystudy_cli.tui.latency import screen
 from pystudy_cli.tui.ui_elements import (
     clear_screen,
     cursor_input,
     display_status_bar,
+    line_input,
     show_hotkey,
+    wrap_text,
 )
 
 
-class Question:
-    """Base class for Question objects."""
-    def __init__(self, text: str, correct_ans: str):
-        self.text = text
-        self.correct_ans = correct_ans
-        self.user_ans: str | None = None
-
-    @staticmethod
-    def is_correct_answer(
-        correct_ans: str, user_ans: str | None,
-        smart_grading: bool = False,
-        strictness: float = DEFAULT_SMART_GRADING_STRICTNESS
-    ) -> bool:
-        if user_ans is None:
-            return False
-
-        user_ans_clean = user_ans.strip().lower()
-        correct_ans_clean = correct_ans.strip().lower()
-
-        if smart_grading:
-            similarity = difflib.SequenceMatcher(None, user_ans_clean, correct_ans_clean).ratio()
-            return similarity >= strictness
-        return user_ans_clean == correct_ans_clean
-
-    def is_correct(self, smart_grading: bool = False,
-                   strictness: float = DEFAULT_SMART_GRADING_STRICTNESS) -> bool:
-        return Question.is_correct_answer(
-            self.correct_ans, self.user_ans,
-            smart_grading, strictness
-        )
-
-class MCQuestion(Question):
-    def __init__(
-            self, text: str, options: list[str], correct_ans: int):
-        self.text = text
-        self.options = options
-        self.correct_ans: int = correct_ans  # Zero-based indices for MCQs
-        self.user_ans: int | None = None     # None = no answer selected
-
-    def is_correct(self) -> bool:
-        if self.user_ans is None:
-            return False
-        return self.user_ans == self.correct_ans
-
-def gen_written_qs(deck: Deck, num_questions: int) -> list[Question]:
-    cards_sample = random.sample(deck.cards, min(num_questions, len(deck.cards)))
-    questions = [
-        Question(card.term, card.def_)
-        for card in cards_sample
-    ]
-    return questions
-
-def gen_mcqs(deck: Deck, num_questions: int) -> list[MCQuestion]:
-    if len(deck.cards) < NUM_MCQ_OPTIONS:
-        # Not enough cards to generate meaningful distractors
-        return []
-
-    all_defs: list[str] = [c.def_ for c in deck.cards]
-    cards_sample = random.sample(deck.cards, min(num_questions, len(deck.cards)))
-    questions = []
-
-    for card in cards_sample:
-        # Remove the current card's def
-        distractor_pool = [d for d in all_defs if d != card.def_]
-
-        # Select distractors
-        distractors = random.sample(distractor_pool, NUM_MCQ_OPTIONS - 1)
-
-        options: list[str] = [*distractors, card.def_]
-        random.shuffle(options)
-        correct_idx = options.index(card.def_)
-
-        questions.append(MCQuestion(card.term, options, correct_idx))
-    return questions
-
-def flashcard_mode(deck: Deck):
+# Lines of the results screen that aren't question entries
+# (status bar, score, page footer and hotkeys)
+RESULTS_RESERVED_LINES = 16
+
+class ResultsPager:
+    """Paginated view over graded test questions.
+
+    Only the entries on the current page are formatted, so rendering cost
+    depends on the page size rather than the number of questions."""
+
+    FILTERS = ("all", "incorrect", "unanswered")
+
+    def __init__(self, questions: list[Question] | list[MCQuestion]):
+        self.questions = questions
+        self.correct = bytearray(q.is_correct() for q in questions)
+        self.score = sum(self.correct)
+        self.filter_idx = 0
+        self._set_filter(0)
+
+    @property
+    def filter_name(self) -> str:
+        return self.FILTERS[self.filter_idx]
+
+    def _set_filter(self, filter_idx: int) -> None:
+        self.filter_idx = filter_idx
+        name = self.FILTERS[filter_idx]
+        if name == "all":
+            self.visible: range | array = range(len(self.questions))
+        elif name == "incorrect":
+            self.visible = array('I', (i for i, ok in enumerate(self.correct) if not ok))
+        else:
+            self.visible = array('I', (i for i, q in enumerate(self.questions) if q.user_ans is None))
+
+        self.offset = 0
+        self.page_starts: list[int] = []  # Offsets of previous pages, for paging back
+        self.shown = 0
+
+    def cycle_filter(self) -> None:
+        self._set_filter((self.filter_idx + 1) % len(self.FILTERS))
+
+    def next_page(self) -> None:
+        if self.offset + self.shown < len(self.visible):
+            self.page_starts.append(self.offset)
+            self.offset += self.shown
+
+    def prev_page(self) -> None:
+        if self.page_starts:
+            self.offset = self.page_starts.pop()
+
+    def format_entry(self, idx: int) -> list[str]:
+        """Returns the wrapped, coloured lines for one question."""
+        q = self.questions[idx]
+        is_correct = bool(self.correct[idx])
+        result_icon = f"{COL_SUCCESS}✔" if is_correct else f"{COL_ERROR}✘"
+
+        header = f"Q{idx+1}: "
+        lines = [
+            f"{result_icon} {COL_WHITE}{header}{line}{RESET}" if n == 0 else f"{COL_WHITE}{line}{RESET}"
+            for n, line in enumerate(wrap_text(q.text, indent=2, first_indent=2 + len(header)))
+        ]
+
+        def answer_line(label: str, colour: str, text: str) -> None:
+            for n, line in enumerate(wrap_text(text, indent=18, first_indent=18)):
+                prefix = f"  {COL_LIGHT_GREY}{label:<16}" if n == 0 else ""
+                lines.append(f"{prefix}{colour}{line}{RESET}")
+
+        # Handle unanswered questions
+        if q.user_ans is None:
+            lines.append(f"  {COL_DARK_GREY}Unanswered.{RESET}")
+
+        # Handle MCQs
+        elif isinstance(q, MCQuestion):
+            correct_idx = q.correct_ans
+            correct_text = f"({correct_idx + 1}) {q.options[correct_idx]}"
+            if is_correct:
+                answer_line("Your answer:", COL_SUCCESS, correct_text)
+            else:
+                answer_line("Your answer:", COL_ERROR, f"({q.user_ans + 1}) {q.options[q.user_ans]}")
+                answer_line("Correct answer:", COL_SUCCESS, correct_text)
+
+        # Handle written questions
+        elif is_correct:
+            if q.user_ans.strip().lower() == q.correct_ans.strip().lower():
+                # Correct and exact match
+                answer_line("Your answer:", COL_SUCCESS, q.correct_ans)
+            else:
+                # Correct due to Smart Grading
+                answer_line("Your answer:", COL_SUCCESS, q.user_ans)
+                answer_line("Exact answer:", COL_SUCCESS, q.correct_ans)
+        else:
+            answer_line("Your answer:", COL_ERROR, q.user_ans)
+            answer_line("Correct answer:", COL_SUCCESS, q.correct_ans)
+
+        lines.append("")
+        return lines
+
+    def render(self, reserved_lines: int) -> None:
+        """Prints as many entries as fit in the terminal (at least one)."""
+        if not self.visible:
+            print(f"{COL_DARK_GREY}No {self.filter_name} questions.{RESET}\n")
+            self.shown = 0
+            return
+
+        budget = max(1, terminal.lines - reserved_lines)
+        page: list[str] = []
+        shown = 0
+        for pos in range(self.offset, len(self.visible)):
+            entry = self.format_entry(self.visible[pos])
+            if shown and len(page) + len(entry) > budget:
+                break
+            page.extend(entry)
+            shown += 1
+
+        self.shown = shown
+        print("\n".join(page))
+
+        page_num = len(self.page_starts) + 1
+        last = self.offset + shown
+        print(f"{COL_DARK_GREY}Page {page_num} | showing {self.offset + 1}-{last} of {len(self.visible)} "
+              f"({self.filter_name}){RESET}")
+
+@screen
+async def flashcard_mode(deck: Deck):
     if not deck.cards:
-        input(f"{COL_ERROR}This deck has no cards to revise! {COL_BASE}(Enter to return)")
+        await line_input(f"{COL_ERROR}This deck has no cards to revise! {COL_BASE}(Enter to return)")
         return
 
     # Setup
@@ -133,7 +185,7 @@ def flashcard_mode(deck: Deck):
     clear_screen()
     display_status_bar(f"{deck.name} > Flashcards")
 
-    shuffle_input = input(f"\n{COL_WHITE}Shuffle cards before starting? (y/n) {COL_ACCENT}").strip().lower()
+    shuffle_input = (await line_input(f"\n{COL_WHITE}Shuffle cards before starting? (y/n) {COL_ACCENT}")).strip().lower()
     shuffle: bool = shuffle_input == 'y'
     if shuffle:
         random.shuffle(cards_to_review)
@@ -166,10 +218,10 @@ def flashcard_mode(deck: Deck):
                     show_hotkey('space', 'reveal', 9)
                     show_hotkey('q', 'exit session', 9)
 
-                key = cursor_input()
+                key = await cursor_input()
 
                 if key == 'q':
-                    exit_input = input(f"\n{COL_LIGHT_GREY}Are you sure you want to exit? (y/n) {COL_ACCENT}").strip().lower()
+                    exit_input = (await line_input(f"\n{COL_LIGHT_GREY}Are you sure you want to exit? (y/n) {COL_ACCENT}")).strip().lower()
                     if exit_input == 'y':
                         return
                     continue  # Go back to the card display loop
@@ -200,7 +252,7 @@ def flashcard_mode(deck: Deck):
                 show_hotkey('r', 'restart session')
                 show_hotkey('q', 'return to menu')
 
-                choice = cursor_input().lower()
+                choice = (await cursor_input()).lower()
                 if choice == 'r':
                     cards_to_review = list(deck.cards)
                     if shuffle:
@@ -216,7 +268,7 @@ def flashcard_mode(deck: Deck):
             show_hotkey('r', 'restart session from beginning')
             show_hotkey('q', 'exit to menu')
 
-            choice = cursor_input().lower()
+            choice = (await cursor_input()).lower()
             if choice == 'l':
                 cards_to_review = learning_cards
                 if shuffle:
@@ -230,9 +282,10 @@ def flashcard_mode(deck: Deck):
             elif choice == 'q':
                 return
 
-def learn_mode(deck: Deck) -> None:
+@screen
+async def learn_mode(deck: Deck) -> None:
     if not deck.cards:
-        input(f"{COL_ERROR}This deck has no cards to revise! {COL_BASE}(Enter to return)")
+        await line_input(f"{COL_ERROR}This deck has no cards to revise! {COL_BASE}(Enter to return)")
         return
 
     # Config
@@ -242,7 +295,7 @@ def learn_mode(deck: Deck) -> None:
 
         # Cards per round
         try:
-            cards_per_round_str = input(f"{COL_WHITE}How many cards per round? (1-{len(deck.cards)}) (default: {DEFAULT_CARDS_PER_ROUND}): {COL_ACCENT}")
+            cards_per_round_str = await line_input(f"{COL_WHITE}How many cards per round? (1-{len(deck.cards)}) (default: {DEFAULT_CARDS_PER_ROUND}): {COL_ACCENT}")
             if not cards_per_round_str:
                 cards_per_round = DEFAULT_CARDS_PER_ROUND
                 break
@@ -254,11 +307,11 @@ def learn_mode(deck: Deck) -> None:
             print(f"{COL_ERROR}Invalid: please enter an integer between 1 and {len(deck.cards)}.{RESET}")
 
     # Get shuffle option
-    shuffle_input = input(f"{COL_WHITE}Shuffle cards? (y/n) (default: y) {COL_ACCENT}").strip().lower()
+    shuffle_input = (await line_input(f"{COL_WHITE}Shuffle cards? (y/n) (default: y) {COL_ACCENT}")).strip().lower()
     shuffle = shuffle_input in ['y', '']
 
     # Get smart grading option
-    smart_grading_input = input(f"{COL_WHITE}Enable smart grading? (y/n) (default: y) {COL_ACCENT}").strip().lower()
+    smart_grading_input = (await line_input(f"{COL_WHITE}Enable smart grading? (y/n) (default: y) {COL_ACCENT}")).strip().lower()
     smart_grading = smart_grading_input in ['y', '']
 
     # Main loop
@@ -276,11 +329,11 @@ def learn_mode(deck: Deck) -> None:
                 show_hotkey('r', 'reset all card progress and restart')
                 show_hotkey('q', 'return to menu')
 
-                choice = cursor_input()
+                choice = await cursor_input()
 
                 # TODO: Add 'keep going' option that preserves progress but starts a new round
                 if choice == 'r':
-                    reset_progress_input = input(f"\n{COL_BASE}Are you sure you want to reset progress? This will also reset familiarity levels. (y/n) {COL_ACCENT}").strip().lower()
+                    reset_progress_input = (await line_input(f"\n{COL_BASE}Are you sure you want to reset progress? This will also reset familiarity levels. (y/n) {COL_ACCENT}")).strip().lower()
                     reset_progress = reset_progress_input == 'y'
                     if reset_progress:
                         # Reset mastery
@@ -306,7 +359,7 @@ def learn_mode(deck: Deck) -> None:
             clear_screen()
             display_status_bar(f"{deck.name} > Learn Mode > Card {i+1}/{len(round_cards)}")
             print(f"\n{COL_CARD_TERM}Term:      {COL_BASE}{card.term}\n")
-            user_ans = input(f"{COL_WHITE}Your Def: {COL_ACCENT}")
+            user_ans = await line_input(f"{COL_WHITE}Your Def: {COL_ACCENT}")
 
             # Grading
             is_correct_answer = Question.is_correct_answer(card.def_, user_ans, smart_grading)
@@ -332,8 +385,9 @@ def learn_mode(deck: Deck) -> None:
                 print(f"{COL_LIGHT_GREY}Your answer:    {COL_BASE}{user_ans}")
                 print(f"{COL_LIGHT_GREY}Correct answer: {COL_BASE}{card.def_}")
 
-            print(f"{COL_LIGHT_GREY}Familiarity: {FAMILIARITY_LEVELS[card.familiarity_level]}")
-            input(f"\n{COL_DARK_GREY}(Press Enter to continue){RESET}")
+            level = FAMILIARITY_LEVELS[card.familiarity_level]
+            print(f"{COL_LIGHT_GREY}Familiarity: {FAMILIARITY_COLOURS[card.familiarity_level]}{level.ui_text}{RESET}")
+            await line_input(f"\n{COL_DARK_GREY}(Press Enter to continue){RESET}")
 
         # End of round display
         while True:
@@ -344,15 +398,16 @@ def learn_mode(deck: Deck) -> None:
             show_hotkey('c', 'proceed to next round')
             show_hotkey('q', 'quit to menu')
 
-            choice = cursor_input().lower()
+            choice = (await cursor_input()).lower()
             if choice == 'c':
                 break
             elif choice == 'q':
                 return
 
-def test_mode(deck: Deck) -> None:
+@screen
+async def test_mode(deck: Deck) -> None:
     if not deck.cards:
-        input(f"{COL_ERROR}This deck has no cards to revise! {COL_BASE}(Enter to return)")
+        await line_input(f"{COL_ERROR}This deck has no cards to revise! {COL_BASE}(Enter to return)")
         return
 
     # Main loop
@@ -365,7 +420,7 @@ def test_mode(deck: Deck) -> None:
             # Get number of questions
             while True:
                 try:
-                    num_questions_str = input(f"{COL_WHITE}How many questions? (1-{len(deck.cards)}) (defualt: {DEFAULT_PRACTICE_TEST_LEN}): {COL_ACCENT}")
+                    num_questions_str = await line_input(f"{COL_WHITE}How many questions? (1-{len(deck.cards)}) (defualt: {DEFAULT_PRACTICE_TEST_LEN}): {COL_ACCENT}")
                     if not num_questions_str:
                         num_questions = min(DEFAULT_PRACTICE_TEST_LEN, len(deck.cards))  # TODO: Make this configurable
                         break
@@ -381,11 +436,11 @@ def test_mode(deck: Deck) -> None:
             print(f"{COL_LIGHT_GREY}1    {COL_BASE}multiple choice")
             print(f"{COL_LIGHT_GREY}2    {COL_BASE}written answer")
 
-            question_type = cursor_input()
+            question_type = await cursor_input()
 
             if question_type == '1':
                 if len(deck.cards) < NUM_MCQ_OPTIONS:
-                    input(f"{COL_ERROR}Not enough cards for Multiple Choice (min {NUM_MCQ_OPTIONS}).{RESET} (Enter to continue)")
+                    await line_input(f"{COL_ERROR}Not enough cards for Multiple Choice (min {NUM_MCQ_OPTIONS}).{RESET} (Enter to continue)")
                     continue
                 questions = gen_mcqs(deck, num_questions)
                 break
@@ -393,7 +448,7 @@ def test_mode(deck: Deck) -> None:
                 questions = gen_written_qs(deck, num_questions)
                 break
             else:
-                input(f"{COL_ERROR}Invalid selection.{RESET} (Enter to continue)")
+                await line_input(f"{COL_ERROR}Invalid selection.{RESET} (Enter to continue)")
                 continue
 
         current_q_idx = 0
@@ -456,7 +511,7 @@ def test_mode(deck: Deck) -> None:
                 else:
                     print(f"{COL_LIGHT_GREY}Your answer: {COL_BASE}{current_q.user_ans}")
 
-            key = cursor_input().lower()
+            key = (await cursor_input()).lower()
 
             # Previous question
             if key == 'w':
@@ -470,7 +525,7 @@ def test_mode(deck: Deck) -> None:
 
             # Edit answer
             elif key == 'e':
-                new_ans = input(f"\n{COL_LIGHT_GREY}Enter your answer: {COL_BASE}")
+                new_ans = await line_input(f"\n{COL_LIGHT_GREY}Enter your answer: {COL_BASE}")
                 if isinstance(current_q, MCQuestion):
                     try:
                         current_q.user_ans = int(new_ans)
@@ -489,57 +544,21 @@ def test_mode(deck: Deck) -> None:
                 unanswered_count = sum(1 for q in questions if q.user_ans is None)
                 if unanswered_count > 0:
                     print(f"{COL_ACCENT}You have {unanswered_count} unanswered question{'s' if unanswered_count > 1 else ''}.")
-                submit_input = input(f"{COL_BASE}Are you sure you want to submit the test? (y/n) {COL_ACCENT}").strip().lower()
+                submit_input = (await line_input(f"{COL_BASE}Are you sure you want to submit the test? (y/n) {COL_ACCENT}")).strip().lower()
                 if submit_input == 'y':
                     break
 
             # Quit test
             elif key == 'q':
-                quit_input = input(f"\n{COL_BASE}Are you sure you want to quit? (you will lose your progress for this test) (y/n) {COL_ACCENT}").strip().lower()
+                quit_input = (await line_input(f"\n{COL_BASE}Are you sure you want to quit? (you will lose your progress for this test) (y/n) {COL_ACCENT}")).strip().lower()
                 if quit_input == 'y':
                     return
 
-        # Score and question display is precomputed outside the display
-        # loop to avoid re-computing every keypress and wasting resources.
-        score = sum(1 for q in questions if q.is_correct())
+        # Correctness is graded once up front. Entry text is only built
+        # for the page currently on screen (see ResultsPager).
+        pager = ResultsPager(questions)
+        score = pager.score
         score_frac = score / len(questions)
-        question_display: str = ""
-        for i, q in enumerate(questions):
-            is_correct = q.is_correct()
-            result_icon = f"{COL_SUCCESS}✔" if is_correct else f"{COL_ERROR}✘"
-            question_display += f"{result_icon} {COL_WHITE}Q{i+1}: {q.text}{RESET}\n"
-
-            # Handle unanswered questions
-            if q.user_ans is None:
-                question_display += f"  {COL_DARK_GREY}Unanswered.{RESET}\n\n"
-                continue
-
-            # Handle MCQs
-            if isinstance(q, MCQuestion):
-                user_idx = q.user_ans
-                correct_idx = q.correct_ans
-                if is_correct:
-                    question_display += f"  {COL_LIGHT_GREY}Your answer:    {COL_SUCCESS}({correct_idx + 1}) {q.options[correct_idx]}{RESET}\n\n"
-                else:
-                    question_display += f"  {COL_LIGHT_GREY}Your answer:    {COL_ERROR}({q.user_ans + 1}) {q.options[user_idx]}{RESET}\n"
-                    question_display += f"  {COL_LIGHT_GREY}Correct answer: {COL_SUCCESS}({correct_idx + 1}) {q.options[correct_idx]}{RESET}\n\n"
-                continue
-
-            # Handle written questions
-            is_exact_match = q.user_ans.strip().lower() == q.correct_ans.strip().lower()
-
-            if is_correct:
-                if is_exact_match:
-                    # Correct and exact match
-                    question_display += f"  {COL_LIGHT_GREY}Your answer:    {COL_SUCCESS}{q.correct_ans}{RESET}\n\n"
-                else:
-                    # Correct due to Smart Grading
-                    question_display += f"  {COL_LIGHT_GREY}Your answer:    {COL_SUCCESS}{q.user_ans}{RESET}\n"
-                    question_display += f"  {COL_LIGHT_GREY}Exact answer:   {COL_SUCCESS}{q.correct_ans}{RESET}\n\n"
-            else:
-                # Incorrect
-                question_display += f"  {COL_LIGHT_GREY}Your answer:    {COL_ERROR}{q.user_ans}{RESET}\n"
-                question_display += f"  {COL_LIGHT_GREY}Correct answer: {COL_SUCCESS}{q.correct_ans}{RESET}\n\n"
 
         # Result display loop
         while True:
@@ -549,16 +568,24 @@ def test_mode(deck: Deck) -> None:
             print(f"\n{COL_WHITE}Test Complete!")
             print(f"{COL_BASE}Your score is {COL_SUCCESS if score == len(questions) else COL_ACCENT}{score}/{len(questions)} {COL_DARK_GREY}({score_frac:.2%}){RESET}\n")
 
-            print(question_display)  # FIXME: Question display sometimes wraps weird
+            pager.render(RESULTS_RESERVED_LINES)
 
             print(f"\n{COL_WHITE}What next?{RESET}")
             # TODO: add retry with same settings option
+            show_hotkey('a/d', 'previous/next page')
+            show_hotkey('f', f'filter ({pager.filter_name})')
             show_hotkey('n', 'new test')
             show_hotkey('q', 'quit to menu')
 
-            choice = cursor_input().lower()
+            choice = (await cursor_input()).lower()
 
-            if choice == 'n':
+            if choice == 'a':
+                pager.prev_page()
+            elif choice == 'd':
+                pager.next_page()
+            elif choice == 'f':
+                pager.cycle_filter()
+            elif choice == 'n':
                 break
             elif choice == 'q':
                 return
@@ -10,9 +10,12 @@
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 
+import asyncio
 import sys
 
-from pystudy_cli.core.data_manager import load_profile, save_profile, LoadStatCategory
+from pystudy_cli.core.data_manager import LoadStatCategory
+from pystudy_cli.core.registry import profiles
+from pystudy_cli.core.terminal import terminal
 from pystudy_cli.tui.colours import (
     COL_ACCENT,
     COL_BASE,
@@ -23,16 +26,19 @@ from pystudy_cli.tui.colours import (
     COL_WHITE,
     RESET,
 )
+from pystudy_cli.tui.runtime import runtime
 from pystudy_cli.tui.ui_elements import (
     clear_screen,
+    line_input,
 )
 from pystudy_cli.tui.states.input_loop import input_loop
+from pystudy_cli.tui.states.save_prompt import save_with_prompt
 
-def main():
+async def _run():
     # Load data
     clear_screen()
     print(f"{COL_DARK_GREY}Loading data...{COL_BASE}")
-    profile, status = load_profile()
+    profile, status = profiles.load()
 
     if status.category == LoadStatCategory.SUCCESS:
         print(f"{COL_SUCCESS}Data loaded!{COL_BASE}")
@@ -46,14 +52,17 @@ def main():
     else:
         print(f"{COL_ERROR}Unexpected error: {COL_WHITE}{status.msg}{COL_ERROR}. {COL_LIGHT_GREY}Making a new file...{COL_BASE}")
 
+    if profiles.read_only:
+        print(f"{COL_LIGHT_GREY}Read-only session, nothing will be saved.{COL_BASE}")
+
     if profile.config.warn_interrupt:
         print(f"{COL_ERROR}\nWARNING: {COL_LIGHT_GREY}Unexpected exits (Ctrl-C, Ctrl-D) may result in data corruption or loss.{RESET}")
 
     # Initial setup
     if not profile.name:
         try:
-            name = input(f"{COL_WHITE}\nWhat is your name? {COL_ACCENT}")  # TODO: Make name configurable in settings
-        except (KeyboardInterrupt, EOFError):
+            name = await line_input(f"{COL_WHITE}\nWhat is your name? {COL_ACCENT}")  # TODO: Make name configurable in settings
+        except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
             print(f"\n{RESET}Exited.")
             sys.exit(0)
 
@@ -63,20 +72,33 @@ def main():
     # Input loop
     while True:
         try:
-            input_loop(profile)
-            save_profile(profile)
-        except (KeyboardInterrupt, EOFError):
+            switched = await input_loop(profile)
+            if switched is not None:
+                profile = switched
+                continue
+            # Shown straight away, or every later autosave would fail the same way unnoticed
+            profile, _ = await save_with_prompt(profile)
+        except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
             print(f"{COL_ERROR}Interrupted!")
             print(f"\n{COL_LIGHT_GREY}Attempting panic save...{COL_BASE}")
 
             try:
-                save_profile(profile)
-                print(f"{COL_SUCCESS}Data saved! {RESET}But don't push your luck next time!")
-                print(f"{COL_ERROR}Panic save may contain malformed data.")
+                err = profiles.save(profile)
+                if profiles.read_only:
+                    print(f"{COL_LIGHT_GREY}Read-only session, nothing saved.{RESET}")
+                elif err is not None:
+                    print(f"{COL_ERROR}Panic save failed: {COL_WHITE}{err}{RESET}")
+                else:
+                    print(f"{COL_SUCCESS}Data saved! {RESET}But don't push your luck next time!")
+                    print(f"{COL_ERROR}Panic save may contain malformed data.")
             except Exception:
                 print(f"{COL_ERROR}Panic save failed. Your fault bucko!{RESET}")
             finally:
                 sys.exit(1)
 
+def main():
+    terminal.install()
+    runtime.run(_run())
+
 if __name__ == "__main__":
     main()
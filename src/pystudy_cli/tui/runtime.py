@@ -0,0 +1,182 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Asyncio runtime for the TUI.
+
+Screens are coroutines. Keypresses and lines of text are read on short-lived
+daemon threads and handed back to the event loop, so the loop stays free
+between keystrokes to run background tasks (status bar clock, autosave,
+prefetching, timers). All terminal output still happens on the loop thread,
+so background work never interleaves with a screen mid-print.
+"""
+
+import asyncio
+import sys
+import threading
+from typing import Any, Awaitable, Callable, Coroutine
+
+import readchar
+
+from pystudy_cli.tui.latency import recorder as latency
+
+# How often the render tick runs, in seconds
+RENDER_TICK_INTERVAL = 1.0
+
+
+class _FrameWriter:
+    """Wraps stdout to count the lines printed since the screen was cleared.
+
+    The render tick uses this to tell whether the status bar is still at
+    the top of the screen or has been scrolled away."""
+
+    def __init__(self, stream) -> None:
+        self._stream = stream
+        self.lines = 0
+
+    def write(self, s: str) -> int:
+        self.lines += s.count("\n")
+        return self._stream.write(s)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+class TUIRuntime:
+    """Owns the event loop, input readers, render tick and background tasks."""
+
+    def __init__(self) -> None:
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.key_source: Callable[[], str] = readchar.readkey
+        self.line_source: Callable[[], str] = input
+        self._tasks: set[asyncio.Task] = set()
+        self._tick_callbacks: list[Callable[[], None]] = []
+        self._writer: _FrameWriter | None = None
+
+    # Input
+    def _run_blocking(self, fn: Callable[[], Any]) -> asyncio.Future:
+        """Runs a blocking call on a daemon thread and returns a future for it.
+
+        Daemon threads (rather than the default executor) mean a pending
+        read never stops the interpreter from exiting."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve(result: Any, exc: BaseException | None) -> None:
+            if future.cancelled():
+                return
+            if exc is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+        def worker() -> None:
+            try:
+                result = fn()
+            except BaseException as e:  # KeyboardInterrupt/EOFError go to the awaiting screen
+                loop.call_soon_threadsafe(resolve, None, e)
+            else:
+                loop.call_soon_threadsafe(resolve, result, None)
+
+        threading.Thread(target=worker, name="tui-input", daemon=True).start()
+        return future
+
+    async def read_key(self) -> str:
+        # Waiting for input means the previous frame is finished
+        latency.frame()
+        key = await self._run_blocking(self.key_source)
+        latency.key()
+        return key
+
+    async def read_line(self, prompt: str = "") -> str:
+        # The prompt is printed here rather than by input() so that it goes
+        # through the loop thread like every other write
+        print(prompt, end="", flush=True)
+        latency.frame()
+        line = await self._run_blocking(self.line_source)
+        latency.key()
+        return line
+
+    # Frames
+    def begin_frame(self) -> None:
+        """Called when the screen is cleared."""
+        if self._writer is not None:
+            self._writer.lines = 0
+
+    @property
+    def frame_lines(self) -> int:
+        """Lines printed since the screen was last cleared."""
+        return self._writer.lines if self._writer is not None else 0
+
+    def on_tick(self, callback: Callable[[], None]) -> None:
+        """Registers a callback to run on every render tick."""
+        self._tick_callbacks.append(callback)
+
+    def _tick(self) -> None:
+        for callback in self._tick_callbacks:
+            callback()
+
+    # Tasks
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+
+        exc = task.exception()
+        if exc is not None:
+            # Background failures go through the same crash handler as everything else
+            sys.excepthook(type(exc), exc, exc.__traceback__)
+
+    def schedule(self, coro: Coroutine, name: str | None = None) -> asyncio.Task:
+        """Starts a background task that is cancelled when the runtime stops."""
+        task = asyncio.get_running_loop().create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+        return task
+
+    def call_every(self, interval: float, callback: Callable[[], Any],
+                   name: str | None = None) -> asyncio.Task:
+        """Runs `callback` every `interval` seconds in the background.
+        Coroutine functions are awaited before the next interval starts."""
+        async def _repeat() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                result = callback()
+                if asyncio.iscoroutine(result):
+                    await result
+
+        return self.schedule(_repeat(), name)
+
+    # Lifecycle
+    async def _main(self, main: Awaitable) -> Any:
+        self.loop = asyncio.get_running_loop()
+        self.call_every(RENDER_TICK_INTERVAL, self._tick, name="render-tick")
+        try:
+            return await main
+        finally:
+            for task in list(self._tasks):
+                task.cancel()
+            self.loop = None
+
+    def run(self, main: Awaitable) -> Any:
+        """Runs the TUI until `main` returns."""
+        self._writer = _FrameWriter(sys.stdout)
+        sys.stdout = self._writer
+        try:
+            return asyncio.run(self._main(main))
+        finally:
+            sys.stdout = self._writer._stream
+            self._writer = None
+
+
+# Shared instance used by every screen
+runtime = TUIRuntime()
@@ -12,6 +12,7 @@
 
 
 
+from pystudy_cli.core import library
 from pystudy_cli.core.objects import Card, Deck
 from pystudy_cli.tui.colours import (
     COL_ACCENT,
@@ -21,14 +22,17 @@ from pystudy_cli.tui.colours import (
     COL_UNANSWERED2,
     COL_WHITE,
 )
+from pystudy_cli.tui.latency import screen
 from pystudy_cli.tui.ui_elements import (
     clear_screen,
     cursor_input,
     display_status_bar,
+    line_input,
     show_hotkey,
 )
 
-def card_editor(deck: Deck):
+@screen
+async def card_editor(deck: Deck):
     current_idx = 0
 
     while True:
@@ -42,6 +46,21 @@ def card_editor(deck: Deck):
             context += " > No Cards"
         display_status_bar(context)
 
+        if deck.library is not None:
+            # Library decks are shared with other profiles, their text can't change
+            print(f"{COL_LIGHT_GREY}This deck is from the shared library, so its cards can't be edited.")
+            print(f"{COL_BASE}Making a private copy keeps your progress but stops sharing the deck.\n")
+            show_hotkey("c", "make a private copy")
+            show_hotkey("q", "exit editor")
+
+            key = await cursor_input()
+            if key == 'c':
+                library.make_private(deck)
+            elif key == 'q':
+                return
+
+            continue
+
         if not deck.cards:
             current_idx = 0
             print(f"{COL_LIGHT_GREY}Minimap")
@@ -49,7 +68,7 @@ def card_editor(deck: Deck):
             show_hotkey("n", "insert new card")
             show_hotkey("q", "exit editor")
 
-            key = cursor_input()
+            key = await cursor_input()
             if key == 'n':
                 deck.cards.insert(current_idx + 1, Card('...', '...'))
             elif key == 'q':
@@ -86,19 +105,19 @@ def card_editor(deck: Deck):
         print(f"\n{COL_ACCENT}Term: {COL_LIGHT_GREY}{card.term}")
         print(f"{COL_ACCENT}Def:  {COL_BASE}{card.def_}")
 
-        key = cursor_input()
+        key = await cursor_input()
 
         # Edit term
         if key == 'z':
             print(f"{COL_LIGHT_GREY}\nEnter new term {COL_BASE}(or Enter to cancel)")
-            new_term = input(f"{COL_ACCENT}> {COL_WHITE}").strip()
+            new_term = (await line_input(f"{COL_ACCENT}> {COL_WHITE}")).strip()
             if new_term:
                 card.term = new_term
 
         # Edit definition
         elif key == 'x':
             print(f"{COL_LIGHT_GREY}\nEnter new definition {COL_BASE}(or Enter to cancel)")
-            new_def = input(f"{COL_ACCENT}> {COL_WHITE}").strip()
+            new_def = (await line_input(f"{COL_ACCENT}> {COL_WHITE}")).strip()
             if new_def:
                 card.def_ = new_def
 
@@ -20,12 +20,15 @@ from pystudy_cli.tui.colours import (
     COL_WHITE,
     RESET,
 )
+from pystudy_cli.tui.latency import screen
 from pystudy_cli.tui.ui_elements import (
     clear_screen,
     display_status_bar,
+    line_input,
 )
 
-def help_menu():
+@screen
+async def help_menu():
     clear_screen()
     display_status_bar("Help")
 
@@ -52,4 +55,4 @@ def help_menu():
     print(f"{COL_ACCENT}  - {COL_LIGHT_GREY}r (revise deck):{COL_BASE} Choose a study mode (Flashcards, Learn, Test).")
     print(f"{COL_ACCENT}  - {COL_LIGHT_GREY}q (close deck):{COL_BASE} Return to the main menu.")
 
-    input(f"\n{COL_DARK_GREY}(Press Enter to return to the main menu){RESET}")
+    await line_input(f"\n{COL_DARK_GREY}(Press Enter to return to the main menu){RESET}")
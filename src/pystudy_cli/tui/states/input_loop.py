@@ -14,9 +14,10 @@ import sys
 from datetime import datetime
 
 
-from pystudy_cli.core.data_manager import make_deck_filename, save_profile
+from pystudy_cli.core.data_manager import make_deck_filename
 from pystudy_cli.core.exceptions import DeckExistsError, DeckNotFoundError
 from pystudy_cli.core.profile import StudyProfile
+from pystudy_cli.core.registry import profiles
 from pystudy_cli.tui.colours import (
     COL_ACCENT,
     COL_BASE,
@@ -29,18 +30,25 @@ from pystudy_cli.tui.colours import (
     COL_WHITE,
     COL_NAME,
 )
+from pystudy_cli.tui.latency import screen
 from pystudy_cli.tui.ui_elements import (
     clear_screen,
     cursor_input,
     display_status_bar,
     int_convertible,
+    line_input,
     show_hotkey,
 )
 from pystudy_cli.tui.states.deck_menu import deck_menu
 from pystudy_cli.tui.states.settings import settings_menu
 from pystudy_cli.tui.states.help import help_menu
+from pystudy_cli.tui.states.profile_picker import profile_picker
+from pystudy_cli.tui.states.memory_report import memory_report
+from pystudy_cli.tui.states.save_prompt import save_with_prompt
 
-def input_loop(profile: StudyProfile):
+@screen
+async def input_loop(profile: StudyProfile) -> StudyProfile | None:
+    """Main menu. Returns the new profile if the user switched profiles."""
     clear_screen()
     display_status_bar()
 
@@ -58,33 +66,34 @@ def input_loop(profile: StudyProfile):
     show_hotkey('o', 'open deck')
     show_hotkey('d', 'delete deck')
     show_hotkey('s', 'settings')
+    show_hotkey('p', 'switch profile')
     show_hotkey('h', 'help')
     show_hotkey('q', 'quit')
-    action = cursor_input()
+    action = await cursor_input()
 
     # New deck
     if action == 'n':
-        deck_name = input(f"{COL_LIGHT_GREY}\nEnter deck name (or press Enter to cancel): {COL_ACCENT}").strip()
+        deck_name = (await line_input(f"{COL_LIGHT_GREY}\nEnter deck name (or press Enter to cancel): {COL_ACCENT}")).strip()
         if not deck_name:
             return
         if int_convertible(deck_name):
-            input(f"{COL_ERROR}Invalid: Deck name cannot be a pure integer! {COL_BASE}(Enter to return)")
+            await line_input(f"{COL_ERROR}Invalid: Deck name cannot be a pure integer! {COL_BASE}(Enter to return)")
             return
 
         try:
             filename = make_deck_filename(deck_name, (d.filename for d in profile.decks))
             profile.new_deck(datetime.now().isoformat(), deck_name, filename)
-            input(f"{COL_WHITE}Deck {COL_ACCENT}{deck_name}{COL_WHITE} created. {COL_BASE}(Enter to return)")
+            await line_input(f"{COL_WHITE}Deck {COL_ACCENT}{deck_name}{COL_WHITE} created. {COL_BASE}(Enter to return)")
         except DeckExistsError:
-            input(f"{COL_ERROR}Invalid: Deck name must be unique. {COL_BASE}(Enter to return)")
+            await line_input(f"{COL_ERROR}Invalid: Deck name must be unique. {COL_BASE}(Enter to return)")
 
     # Open deck
     elif action == 'o':
         if not profile.decks:
-            input(f"{COL_ERROR}\nNo decks to open. {COL_LIGHT_GREY}Try creating one first! {COL_BASE}(Enter to return)")
+            await line_input(f"{COL_ERROR}\nNo decks to open. {COL_LIGHT_GREY}Try creating one first! {COL_BASE}(Enter to return)")
             return
 
-        deck_name = input(f"\n{COL_LIGHT_GREY}Enter the name (or index) of a deck to open (or press Enter to cancel): {COL_ACCENT}").strip()
+        deck_name = (await line_input(f"\n{COL_LIGHT_GREY}Enter the name (or index) of a deck to open (or press Enter to cancel): {COL_ACCENT}")).strip()
         if not deck_name:
             return
 
@@ -96,65 +105,65 @@ def input_loop(profile: StudyProfile):
             if not 0 <= deck_idx < len(profile.decks):
                 raise IndexError
 
-            deck_menu(profile, deck)
+            await deck_menu(profile, deck)
 
         # Name input
         except ValueError:
             deck = next((deck for deck in profile.decks if deck.name == deck_name), None)
             if deck is None:
-                input(f"{COL_ERROR}That deck doesn't exist!{COL_BASE} (Enter to return)")
+                await line_input(f"{COL_ERROR}That deck doesn't exist!{COL_BASE} (Enter to return)")
                 return
-            deck_menu(profile, deck)
+            await deck_menu(profile, deck)
 
         # Invalid index
         except IndexError:
-            input(f"{COL_ERROR}Invalid index! (must be an integer from 1 to {len(profile.decks)}) {COL_BASE}(Enter to return)")
+            await line_input(f"{COL_ERROR}Invalid index! (must be an integer from 1 to {len(profile.decks)}) {COL_BASE}(Enter to return)")
             return
 
     # Remove deck
     elif action == 'd':
-        deck_name = input(f"{COL_LIGHT_GREY}\nEnter deck name to delete (or press Enter to cancel): {COL_ACCENT}").strip()
+        deck_name = (await line_input(f"{COL_LIGHT_GREY}\nEnter deck name to delete (or press Enter to cancel): {COL_ACCENT}")).strip()
         if not deck_name:
             return
 
-        confirm = input(f"{COL_LIGHT_GREY}Are you sure you want to delete this deck (this action cannot be undone)? (y/n) {COL_ACCENT}").strip().lower()
+        confirm = (await line_input(f"{COL_LIGHT_GREY}Are you sure you want to delete this deck (this action cannot be undone)? (y/n) {COL_ACCENT}")).strip().lower()
         if confirm == 'y':
             try:
                 profile.remove_deck(deck_name)
-                input(f"{COL_WHITE}Deck {COL_ACCENT}{deck_name}{COL_WHITE} removed. {COL_BASE}(Enter to return)")
+                await line_input(f"{COL_WHITE}Deck {COL_ACCENT}{deck_name}{COL_WHITE} removed. {COL_BASE}(Enter to return)")
             except DeckNotFoundError:
-                input(f"{COL_ERROR}Invalid: Deck does not exist. {COL_BASE}(Enter to return)")
+                await line_input(f"{COL_ERROR}Invalid: Deck does not exist. {COL_BASE}(Enter to return)")
 
     # Settings
     elif action == 's':
-        settings_menu(profile)
+        await settings_menu(profile)
+
+    # Switch profile
+    elif action == 'p':
+        return await profile_picker(profile)
+
+    # Memory report (not listed, it's for diagnosing big profiles)
+    elif action == 'M':
+        await memory_report(profile)
 
     # Help
     elif action == 'h':
-        help_menu()
+        await help_menu()
 
     # Quit
     elif action == 'q':
         print(f"{COL_LIGHT_GREY}\nAre you sure you want to quit?")
         print(f"{COL_BASE}(q - quit | other - return)")
-        confirm = cursor_input()
+        confirm = await cursor_input()
 
         if confirm == 'q':
             print(f"{COL_BASE}\nSaving data and exiting...")
 
-            while True:
-                status = save_profile(profile)
-                if status is None:
-                    print(f"{COL_SUCCESS}Data saved!")
-                    break
-
-                retry = input(
-                    f"{COL_ERROR}Saving data failed: {COL_WHITE}{status}{COL_ERROR}. "
-                    f"{COL_LIGHT_GREY}Retry? (y/n) {COL_WHITE}"
-                ).strip().lower()
-                if retry != 'y':
-                    print(f"{COL_BASE}Exiting without saving...")
-                    break
+            _, saved = await save_with_prompt(profile)
+            if saved:
+                print(f"{COL_SUCCESS}Data saved!")
+            else:
+                print(f"{COL_BASE}Exiting without saving...")
 
             print(f"{COL_BASE}Goodbye!\033[0m")
             sys.exit(0)
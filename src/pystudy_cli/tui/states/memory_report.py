@@ -0,0 +1,72 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pystudy_cli.core import memory
+from pystudy_cli.core.profile import StudyProfile
+from pystudy_cli.core.registry import profiles
+from pystudy_cli.tui.colours import COL_BASE, COL_LIGHT_GREY, COL_WHITE
+from pystudy_cli.tui.latency import screen
+from pystudy_cli.tui.ui_elements import (
+    clear_screen,
+    cursor_input,
+    display_status_bar,
+    show_hotkey,
+)
+
+if TYPE_CHECKING:
+    import tracemalloc
+
+NFRAMES = 1  # Just the allocating line, so tracing slows the session as little as possible
+
+_previous: tracemalloc.Snapshot | None = None  # Of the last report, to show what grew since
+
+@screen
+async def memory_report(profile: StudyProfile) -> None:
+    """Hidden memory report (M on the main menu). Allocation tracing starts
+    when it's opened and stays on, slowing every allocation, until it's
+    stopped here with s."""
+    global _previous
+
+    first = not memory.is_tracing()
+    memory.start_tracing(NFRAMES)
+
+    while True:
+        clear_screen()
+        display_status_bar("Memory")
+
+        report = memory.build_report(profile, profiles.head_path(), _previous)
+        _previous = report.pop("_snapshot", None)
+
+        print(f"{COL_WHITE}\nMemory report{COL_BASE}")
+        for line in memory.format_report(report):
+            print(f"{COL_BASE}{line}")
+
+        print(f"\n{COL_LIGHT_GREY}Allocation tracing is on, which slows the whole session down a little.")
+        if first:
+            print(f"{COL_LIGHT_GREY}It only started just now: refresh later to see what was allocated in between.")
+        print()
+        show_hotkey("r", "refresh, showing what grew since the last report")
+        show_hotkey("s", "stop allocation tracing and return")
+        show_hotkey("q", "return, leaving tracing on")
+
+        action = await cursor_input()
+        if action == "s":
+            memory.stop_tracing()
+            _previous = None  # Can't be compared with once tracing restarts
+            return
+        if action == "q":
+            return
+        first = False
@@ -0,0 +1,130 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+from pystudy_cli.core.constants import VERSION_NUM
+from pystudy_cli.core.data_manager import LoadStatCategory
+from pystudy_cli.core.objects import ConfigObject
+from pystudy_cli.core.profile import StudyProfile
+from pystudy_cli.core.registry import profiles
+from pystudy_cli.tui.colours import (
+    COL_ACCENT,
+    COL_BASE,
+    COL_DARK_GREY,
+    COL_DECK_INDEX,
+    COL_ERROR,
+    COL_LIGHT_GREY,
+    COL_NAME,
+    COL_WHITE,
+)
+from pystudy_cli.tui.latency import screen
+from pystudy_cli.tui.ui_elements import (
+    clear_screen,
+    display_status_bar,
+    line_input,
+)
+
+MAX_LISTED = 20  # Profiles shown at once, searching narrows it down
+
+async def _switch(current: StudyProfile, profile_id: str) -> StudyProfile | None:
+    """Saves the current profile and loads another, None if that failed."""
+    err = profiles.save(current)
+    if err is not None:
+        await line_input(f"{COL_ERROR}Saving the current profile failed: {COL_WHITE}{err}{COL_ERROR}. "
+                         f"{COL_BASE}(Enter to return)")
+        return None
+
+    profile, status = profiles.load(profile_id)
+    if status.category in (LoadStatCategory.CORRUPT, LoadStatCategory.ERROR):
+        await line_input(f"{COL_ERROR}That profile can't be loaded ({status.category.name.lower()}). "
+                         f"{COL_BASE}(Enter to return)")
+        return None
+    if status.category == LoadStatCategory.PARTIAL:
+        await line_input(f"{COL_ERROR}Some deck files could not be loaded. "
+                         f"{COL_LIGHT_GREY}{status.msg} {COL_BASE}(Enter to continue)")
+
+    if not profile.name:
+        profile.name = (await line_input(f"{COL_WHITE}What is this profile's name? {COL_ACCENT}")).strip()
+
+    profiles.active = profile_id
+    return profile
+
+@screen
+async def profile_picker(current: StudyProfile) -> StudyProfile | None:
+    """Lists profiles, most recently studied first. Returns the profile switched to."""
+    query = ""
+
+    while True:
+        clear_screen()
+        display_status_bar("Profiles" + (f" > '{query}'" if query else ""))
+
+        summaries = profiles.summaries()
+        if query:
+            needle = query.casefold()
+            summaries = [s for s in summaries if needle in s.name.casefold() or needle in s.profile_id.casefold()]
+        summaries.sort(key=lambda s: s.last_studied or "", reverse=True)
+        shown = summaries[:MAX_LISTED]
+
+        if not shown:
+            print(f"{COL_BASE}No profiles found.")
+        for i, summary in enumerate(shown, 1):
+            marker = f"{COL_ACCENT}*" if summary.profile_id == profiles.active else " "
+            studied = summary.last_studied.replace("T", " ")[:16] if summary.last_studied else "never"
+            print(f"{marker}{COL_DECK_INDEX}{i:>3}. {COL_NAME}{summary.name or '(no name)'} "
+                  f"{COL_DARK_GREY}[{summary.profile_id}] {summary.decks} decks, studied {studied}")
+        if len(summaries) > len(shown):
+            print(f"{COL_LIGHT_GREY}...and {len(summaries) - len(shown)} more, search to narrow it down")
+
+        print(f"\n{COL_LIGHT_GREY}Enter a number to switch, /text to search, n for a new profile "
+              f"or nothing to return")
+        choice = (await line_input(f"{COL_ACCENT}> {COL_WHITE}")).strip()
+
+        if not choice:
+            return None
+
+        if choice.startswith("/"):
+            query = choice[1:].strip()
+            continue
+
+        if choice.lower() == "n":
+            if profiles.read_only:
+                await line_input(f"{COL_ERROR}Profiles can't be created in a read-only session. "
+                                 f"{COL_BASE}(Enter to return)")
+                continue
+            name = (await line_input(f"{COL_LIGHT_GREY}Name for the new profile (or Enter to cancel): {COL_ACCENT}")).strip()
+            if not name:
+                continue
+            err = profiles.save(current)
+            if err is not None:
+                await line_input(f"{COL_ERROR}Saving the current profile failed: {COL_WHITE}{err}{COL_ERROR}. "
+                                 f"{COL_BASE}(Enter to return)")
+                continue
+
+            profile_id = profiles.make_id(name)
+            profiles.create(profile_id)
+            profiles.active = profile_id
+            profile = StudyProfile(VERSION_NUM, name, [], ConfigObject())
+            profiles.save(profile)
+            return profile
+
+        try:
+            summary = shown[int(choice) - 1]
+            if int(choice) < 1:
+                raise IndexError
+        except (ValueError, IndexError):
+            await line_input(f"{COL_ERROR}Invalid choice. {COL_BASE}(Enter to return)")
+            continue
+
+        if summary.profile_id == profiles.active:
+            return None
+        switched = await _switch(current, summary.profile_id)
+        if switched is not None:
+            return switched
@@ -0,0 +1,52 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+from pystudy_cli.core.data_manager import LoadStatCategory
+from pystudy_cli.core.diagnostics import diagnostics
+from pystudy_cli.core.profile import StudyProfile
+from pystudy_cli.core.registry import profiles
+from pystudy_cli.tui.colours import COL_BASE, COL_ERROR, COL_LIGHT_GREY, COL_WHITE
+from pystudy_cli.tui.ui_elements import line_input
+
+async def save_with_prompt(profile: StudyProfile) -> tuple[StudyProfile, bool]:
+    """Saves profile, asking what to do if that fails (e.g. another session
+    or `serve` changed it since it was loaded). Returns the profile to carry
+    on with, reloaded from disk if the user chose that, and whether there's
+    nothing left unsaved."""
+    force = False
+    while True:
+        status = profiles.save(profile, force=force)
+        if status is None:
+            return profile, True
+
+        choice = (await line_input(
+            f"{COL_ERROR}Saving data failed: {COL_WHITE}{status}{COL_ERROR}. "
+            f"{COL_LIGHT_GREY}Retry? (y/n, o - overwrite changes made by other sessions, "
+            f"r - reload and lose your unsaved changes) {COL_WHITE}"
+        )).strip().lower()
+
+        if choice == 'r':
+            reloaded, load_status = profiles.load()
+            if load_status.category in (LoadStatCategory.SUCCESS, LoadStatCategory.PARTIAL):
+                diagnostics.event("save_reloaded", error=status)
+                if not reloaded.name:
+                    reloaded.name = profile.name
+                print(f"{COL_BASE}Reloaded the saved data.")
+                return reloaded, True
+            # Never swap in the blank profile a failed load gives back
+            print(f"{COL_ERROR}Reloading failed ({load_status.category.name.lower()}), your changes are kept.")
+            continue
+
+        force = choice == 'o'
+        diagnostics.event("save_retry" if choice in ('y', 'o') else "save_abandoned", error=status, force=force)
+        if choice not in ('y', 'o'):
+            return profile, False
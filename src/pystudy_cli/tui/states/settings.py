@@ -12,8 +12,6 @@
 
 from typing import Callable
 
-from readchar import readkey
-
 from pystudy_cli.core.profile import StudyProfile
 from pystudy_cli.tui.colours import (
     COL_ACCENT,
@@ -21,12 +19,15 @@ from pystudy_cli.tui.colours import (
     COL_LIGHT_GREY,
     col,
 )
+from pystudy_cli.tui.latency import screen
+from pystudy_cli.tui.runtime import runtime
 from pystudy_cli.tui.ui_elements import (
     clear_screen,
     display_status_bar,
 )
 
-def settings_menu(profile: StudyProfile):
+@screen
+async def settings_menu(profile: StudyProfile):
     # A config entry is: (label, getter, setter, type)
     CONFIG_ENTRIES: list[tuple[str, Callable, Callable, type]] = [
         (
@@ -55,7 +56,7 @@ def settings_menu(profile: StudyProfile):
         print(f"{COL_LIGHT_GREY}a/d    {COL_BASE}change")
         print(f"{COL_LIGHT_GREY}q      {COL_BASE}return")
 
-        key = readkey().lower()
+        key = (await runtime.read_key()).lower()
 
         if key == 'w':
             current_idx = (current_idx - 1) % len(CONFIG_ENTRIES)
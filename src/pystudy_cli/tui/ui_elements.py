@@ -11,12 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 
 import os
+import textwrap
+import time
 from typing import Any
 from datetime import datetime
 
-import readchar
-
-from pystudy_cli.core.constants import FALLBACK_STATUS_BAR_WIDTH
+from pystudy_cli.core.terminal import terminal
+from pystudy_cli.tui.runtime import runtime
 from pystudy_cli.tui.colours import (
     COL_ACCENT,
     COL_BASE,
@@ -35,14 +36,21 @@ def int_convertible(val: Any, /) -> bool:
     except (ValueError, TypeError):
         return False
 
-def cursor_input():
+async def cursor_input() -> str:
     print(f"{COL_ACCENT}>{COL_WHITE} ", end='', flush=True)
-    action = readchar.readkey()
+    action = await runtime.read_key()
     print(action)
 
     return action
 
+async def line_input(prompt: str = "") -> str:
+    """Non-blocking replacement for input()."""
+    return await runtime.read_line(prompt)
+
 def clear_screen(*, full_clear=False) -> None:
+    runtime.begin_frame()
+    _status_bar.context = None
+
     if full_clear:
         os.system('cls' if os.name == 'nt' else 'clear')
         os.system('cls' if os.name == 'nt' else 'clear')
@@ -56,16 +64,65 @@ def show_hotkey(
     ):
     print(f"{hotkey_col}{hotkey:<{alignment}}{desc_col}{desc}{COL_BASE}")
 
-def display_status_bar(context_text: str = ""):
-    """Displays a status bar at the top of the screen with centered context."""
-    try:
-        width = os.get_terminal_size().columns
-    except OSError:
-        width = FALLBACK_STATUS_BAR_WIDTH
+def wrap_text(text: str, indent: int = 0, first_indent: int | None = None,
+              width: int | None = None) -> list[str]:
+    """Wraps uncoloured text to the terminal width.
+
+    Colour codes must be added after wrapping, otherwise the escape
+    sequences count towards the line length. `first_indent` is the
+    width already used on the first line (e.g. by a label)."""
+    width = terminal.columns if width is None else width
+    first_indent = indent if first_indent is None else first_indent
+
+    lines = textwrap.wrap(
+        text, width=max(width - 1, first_indent + 10),
+        initial_indent=" " * first_indent,
+        subsequent_indent=" " * indent,
+    ) or [" " * first_indent]
+
+    # The caller prints its own prefix on the first line
+    lines[0] = lines[0][first_indent:]
+    return lines
+
+class _StatusBarSegments:
+    """Precomputed pieces of the status bar.
+
+    The left label never changes, the separator only changes with the
+    terminal width and the clock only changes once a minute, so none
+    of these need rebuilding on every screen."""
+
+    VERSION_STR = "PyStudy CLI"
+
+    def __init__(self) -> None:
+        self.version = f"{COL_TITLE}{self.VERSION_STR}{RESET}"
+        self._separator_width = -1
+        self._separator = ""
+        self._minute = -1
+        self._time_str = ""
+        self.context: str | None = None  # Context of the bar on screen, if any
+        self.drawn_minute = -1
+
+    def separator(self, width: int) -> str:
+        if width != self._separator_width:
+            self._separator_width = width
+            self._separator = f"{COL_ACCENT}{'─' * width}{RESET}"
+        return self._separator
+
+    def time_str(self) -> str:
+        minute = int(time.time() // 60)
+        if minute != self._minute:
+            self._minute = minute
+            self._time_str = datetime.now().strftime('%H:%M')
+        return self._time_str
+
+_status_bar = _StatusBarSegments()
+
+def _build_status_bar(context_text: str, width: int) -> str:
+    """Returns the top line of the status bar (without the separator)."""
 
     # 1. Create uncoloured components
-    version_str = "PyStudy CLI"
-    time_str = datetime.now().strftime('%H:%M')
+    version_str = _status_bar.VERSION_STR
+    time_str = _status_bar.time_str()
 
     # 2. Calculate layout
     if context_text:
@@ -86,7 +143,7 @@ def display_status_bar(context_text: str = ""):
 
         # Assemble and colour final bar
         bar = (
-            f"{COL_TITLE}{version_str}{RESET}"
+            f"{_status_bar.version}"
             f"{' ' * left_ws_len}"
             f"{COL_BASE}{context_text}{RESET}"
             f"{' ' * right_ws_len}"
@@ -98,10 +155,36 @@ def display_status_bar(context_text: str = ""):
             spacing = 0
 
         bar = (
-            f"{COL_TITLE}{version_str}{RESET}"
+            f"{_status_bar.version}"
             f"{' ' * spacing}"
             f"{COL_ACCENT}{time_str}{RESET}"
         )
 
-    print(bar)
-    print(f"{COL_ACCENT}{'─' * width}{RESET}")
+    return bar
+
+def display_status_bar(context_text: str = ""):
+    """Displays a status bar at the top of the screen with centered context."""
+    width = terminal.columns
+    print(_build_status_bar(context_text, width))
+    print(_status_bar.separator(width))
+
+    if runtime.frame_lines == 2:  # Only the bar has been printed, so it's at the top
+        _status_bar.context = context_text
+        _status_bar.drawn_minute = _status_bar._minute
+
+def _refresh_status_bar_clock() -> None:
+    """Render tick: redraws the clock when the minute rolls over, as long
+    as the status bar hasn't been scrolled off the top of the screen."""
+    if _status_bar.context is None or runtime.frame_lines >= terminal.lines:
+        return
+
+    _status_bar.time_str()
+    if _status_bar._minute == _status_bar.drawn_minute:
+        return
+
+    # Save cursor, jump to the top row, redraw, restore cursor
+    bar = _build_status_bar(_status_bar.context, terminal.columns)
+    print(f"\0337\033[H\033[2K{bar}\0338", end="", flush=True)
+    _status_bar.drawn_minute = _status_bar._minute
+
+runtime.on_tick(_refresh_status_bar_clock)
@@ -0,0 +1,138 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Times `main.py import-anki` on a synthetic Anki package.
+
+Builds an .apkg with the tables and columns the importer reads, in the
+legacy layout (decks as JSON in the col table) or with --schema18 the
+newer one (a decks table). Notes have two fields with a little HTML and
+some cloze markup, and two cards each (forward and reverse) in random
+review states. Then imports it into a fresh data directory, checks every
+note arrived and reports the time and peak memory of the import.
+
+Usage: python tools/bench_anki.py [--notes 200000] [--decks 20] [--schema18] [--keep FILE]
+"""
+
+import argparse
+import json
+import random
+import resource
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+_TABLES = """
+    CREATE TABLE col (id integer primary key, crt integer, mod integer, scm integer, ver integer, dty integer,
+                      usn integer, ls integer, conf text, models text, decks text, dconf text, tags text);
+    CREATE TABLE notes (id integer primary key, guid text, mid integer, mod integer, usn integer, tags text,
+                        flds text, sfld integer, csum integer, flags integer, data text);
+    CREATE TABLE cards (id integer primary key, nid integer, did integer, ord integer, mod integer, usn integer,
+                        type integer, queue integer, due integer, ivl integer, factor integer, reps integer,
+                        lapses integer, left integer, odue integer, odid integer, flags integer, data text);
+    CREATE INDEX ix_cards_nid ON cards (nid);
+"""
+
+
+def build_collection(path: Path, num_notes: int, num_decks: int, schema18: bool) -> None:
+    rng = random.Random(0)
+    deck_ids = {1_600_000_000_000 + i: f"Languages::Set {i}" for i in range(num_decks)}
+
+    conn = sqlite3.connect(path)
+    conn.executescript(_TABLES)
+    if schema18:
+        conn.execute("CREATE TABLE decks (id integer primary key, name text, mtime_secs integer, usn integer, "
+                     "common blob, kind blob)")
+        conn.executemany("INSERT INTO decks VALUES (?, ?, 0, 0, x'', x'')",
+                         [(did, name.replace("::", "\x1f")) for did, name in deck_ids.items()])
+        decks_json = "{}"
+    else:
+        decks_json = json.dumps({str(did): {"id": did, "name": name} for did, name in deck_ids.items()})
+    conn.execute("INSERT INTO col VALUES (1, 0, 0, 0, 11, 0, 0, 0, '{}', '{}', ?, '{}', '{}')", (decks_json,))
+
+    dids = list(deck_ids)
+    notes, cards = [], []
+    for nid in range(1, num_notes + 1):
+        if nid % 10 == 0:
+            front = f"Der {{{{c1::Hund::animal}}}} Nummer {nid}"
+        else:
+            front = f"Wort <b>{nid}</b>"
+        back = f"word {nid}<br>definition with &amp; some <i>markup</i>"
+        notes.append((nid, f"g{nid}", 1, 0, 0, "", f"{front}\x1f{back}", 0, 0, 0, ""))
+        did = rng.choice(dids)
+        for ord_ in (0, 1):
+            card_type = rng.choice((0, 1, 2, 2, 2, 3))
+            ivl = rng.randrange(1, 60) if card_type == 2 else 0
+            cards.append((nid * 2 + ord_, nid, did, ord_, 0, 0, card_type, card_type, 0, ivl, 2500, 0, 0, 0, 0, 0, 0, ""))
+        if len(notes) >= 10_000:
+            conn.executemany("INSERT INTO notes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", notes)
+            conn.executemany("INSERT INTO cards VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", cards)
+            notes.clear()
+            cards.clear()
+    conn.executemany("INSERT INTO notes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", notes)
+    conn.executemany("INSERT INTO cards VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", cards)
+    conn.commit()
+    conn.close()
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--notes", type=int, default=200_000, help="notes in the collection")
+    parser.add_argument("--decks", type=int, default=20, help="Anki decks the notes are spread over")
+    parser.add_argument("--schema18", action="store_true", help="newer layout with a decks table")
+    parser.add_argument("--keep", type=Path, metavar="FILE", help="also save the generated package to FILE")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="pystudy-anki-bench-") as tmp:
+        tmp_dir = Path(tmp)
+        collection = tmp_dir / "collection.anki2"
+        package = args.keep or tmp_dir / "bench.apkg"
+
+        start = time.perf_counter()
+        build_collection(collection, args.notes, args.decks, args.schema18)
+        with zipfile.ZipFile(package, "w", zipfile.ZIP_DEFLATED) as z:
+            z.write(collection, "collection.anki2")
+            z.writestr("media", "{}")
+        print(f"Built {args.notes:,} notes in {time.perf_counter() - start:.1f}s, "
+              f"{package.stat().st_size / 1e6:.1f} MB", file=sys.stderr)
+
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, str(ROOT_DIR / "main.py"), "--data-dir", str(tmp_dir / "data"),
+             "import-anki", str(package), "--levels"],
+            capture_output=True, text=True,
+        )
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            print(result.stderr, file=sys.stderr)
+            return 1
+
+    decks = json.loads(result.stdout)
+    imported = sum(deck["cards"] for deck in decks)
+    report = {
+        "notes": args.notes,
+        "schema18": args.schema18,
+        "decks": len(decks),
+        "imported": imported,
+        "seconds": round(elapsed, 2),
+        "peak_rss_mib": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1),
+    }
+    print(json.dumps(report, indent=4))
+    return 0 if imported == args.notes else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Startup import check.
+
+Fails (exit code 1) if launching the TUI through main.py imports pygame or the batch commands,
+if the batch commands import the TUI, the GUI or pygame, or if any module
+in pystudy_cli.core does.
+Each check runs in a fresh interpreter so nothing is cached between them.
+
+Usage: python tools/check_imports.py
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+# Imports every core module, reports what ended up in sys.modules
+CORE_PROBE = """
+import importlib, json, pkgutil, sys
+sys.path.insert(0, "src")
+import pystudy_cli.core as core
+for info in pkgutil.iter_modules(core.__path__, "pystudy_cli.core."):
+    importlib.import_module(info.name)
+print(json.dumps(sorted(sys.modules)))
+"""
+
+# Does everything main.py does up to handing control to the TUI
+TUI_PROBE = """
+import json, sys
+sys.argv = ["main.py"]
+import main
+main.parse_args([])
+main.diagnostics.install()
+main.get_runner("tui")
+print(json.dumps(sorted(sys.modules)))
+"""
+
+# Imports the batch commands the way main.py does before running one
+CLI_PROBE = """
+import json, sys
+sys.argv = ["main.py"]
+import main
+main.parse_args(["list"])
+import pystudy_cli.cli.commands
+print(json.dumps(sorted(sys.modules)))
+"""
+
+def _imported_modules(probe: str) -> list[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+    )
+    # pygame prints a banner on import, the module list is always the last line
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def _matching(modules: list[str], prefixes: tuple[str, ...]) -> list[str]:
+    """Modules under any of the prefixes, without listing every submodule of a match."""
+    matched = {m for m in modules if m.startswith(prefixes)}
+    return sorted(m for m in matched if m.rpartition(".")[0] not in matched)
+
+def main() -> int:
+    failures: list[str] = []
+
+    core_modules = _imported_modules(CORE_PROBE)
+    for name in _matching(core_modules, ("pygame", "pystudy_cli.tui", "pystudy_cli.gui")):
+        failures.append(f"core imports {name}")
+
+    tui_modules = _imported_modules(TUI_PROBE)
+    for name in _matching(tui_modules, ("pygame", "pystudy_cli.gui", "pystudy_cli.cli.commands")):
+        failures.append(f"main.py (tui) imports {name}")
+
+    cli_modules = _imported_modules(CLI_PROBE)
+    for name in _matching(cli_modules, ("pygame", "pystudy_cli.tui", "pystudy_cli.gui")):
+        failures.append(f"batch commands import {name}")
+
+    if failures:
+        print("Startup import check failed:")
+        for failure in sorted(set(failures)):
+            print(f"  - {failure}")
+        return 1
+
+    print(f"Startup import check passed ({len(tui_modules)} modules loaded for the TUI).")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Load test for the study server.
+
+Generates synthetic profiles in a temporary directory, starts
+`main.py serve` on a free port and runs many concurrent simulated study
+sessions against it (list decks, page through cards, generate questions,
+submit answers). Reports latency percentiles per endpoint as JSON.
+
+Afterwards the server is stopped and every profile is loaded from disk to
+check that the last familiarity level the server reported for each
+answered card was saved. Each session only answers its own share of the
+cards, so the expected final state is unambiguous.
+
+With --library every profile studies the same decks, published once to
+a shared library (see core.library), instead of each having private
+copies. Disk usage and the server's resident memory are reported either
+way, to compare the two.
+
+Exits with 1 on request errors or lost answers.
+
+Usage: python tools/load_test.py [--sessions 200] [--profiles 50] [--rounds 5] [--library]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from pystudy_cli.bench.synthetic import generate_profile, write_profile  # noqa: E402
+from pystudy_cli.core import library  # noqa: E402
+from pystudy_cli.core.constants import FAMILIARITY_LEVELS  # noqa: E402
+from pystudy_cli.core.data_manager import load_profile  # noqa: E402
+from pystudy_cli.core.stats import percentile  # noqa: E402
+
+
+class Client:
+    """Keep-alive HTTP/1.1 JSON client, one connection per session."""
+
+    def __init__(self, port: int, timings: dict[str, list[int]], statuses: dict[int, int]) -> None:
+        self.port = port
+        self.timings = timings
+        self.statuses = statuses
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def request(self, method: str, path: str, route: str, body: dict | None = None) -> tuple[int, dict]:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection("127.0.0.1", self.port)
+        assert self._reader is not None
+
+        payload = json.dumps(body).encode() if body is not None else b""
+        start = time.perf_counter_ns()
+        self._writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n".encode() + payload
+        )
+        await self._writer.drain()
+
+        status = int((await self._reader.readline()).split()[1])
+        length = 0
+        while (line := await self._reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode().partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        data = json.loads(await self._reader.readexactly(length))
+
+        self.timings.setdefault(route, []).append(time.perf_counter_ns() - start)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        return status, data
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+async def session(client: Client, profile_id: str, slot: int, slots: int, rounds: int,
+                  rng: random.Random, expected: dict) -> None:
+    _, listing = await client.request("GET", f"/profiles/{profile_id}/decks", "list_decks")
+    deck = rng.choice(listing["decks"])["name"]
+    base = f"/profiles/{profile_id}/decks/{quote(deck)}"
+
+    # Page through the deck, keeping the definitions of the cards this session owns.
+    # Synthetic decks can repeat a short term, those are skipped as the owner is ambiguous
+    owned: dict[str, str] = {}
+    seen: set[str] = set()
+    offset = 0
+    while True:
+        _, page = await client.request("GET", f"{base}/cards?offset={offset}&limit=200", "cards")
+        for i, card in enumerate(page["cards"], start=offset):
+            term = card["term"]
+            if term in seen:
+                owned.pop(term, None)
+            elif i % slots == slot:
+                owned[term] = card["definition"]
+            seen.add(term)
+        offset += len(page["cards"])
+        if not page["cards"] or offset >= page["total"]:
+            break
+
+    for _ in range(rounds):
+        kind = rng.choice(("written", "mcq"))
+        status, result = await client.request("POST", f"{base}/questions", "questions", {"kind": kind, "count": 10})
+        if status != 200:
+            continue
+        for question in result["questions"]:
+            term = question["term"]
+            if term not in owned:
+                continue
+            answer = owned[term] if rng.random() < 0.7 else "no idea"
+            status, graded = await client.request("POST", f"{base}/answers", "answers", {"term": term, "answer": answer})
+            if status == 200:
+                expected[(profile_id, deck, term)] = graded["familiarity_level"]
+
+async def run_sessions(port: int, profile_ids: list[str], sessions: int, rounds: int) -> dict:
+    timings: dict[str, list[int]] = {}
+    statuses: dict[int, int] = {}
+    expected: dict[tuple[str, str, str], int] = {}
+
+    # Sessions sharing a profile split its cards between them
+    per_profile: dict[str, int] = {}
+    assignments = []
+    for i in range(sessions):
+        profile_id = profile_ids[i % len(profile_ids)]
+        assignments.append((profile_id, per_profile.get(profile_id, 0)))
+        per_profile[profile_id] = per_profile.get(profile_id, 0) + 1
+
+    clients = [Client(port, timings, statuses) for _ in range(sessions)]
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        session(client, profile_id, slot, per_profile[profile_id], rounds, random.Random(i), expected)
+        for i, (client, (profile_id, slot)) in enumerate(zip(clients, assignments))
+    ), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    stats_client = Client(port, {}, {})
+    _, cache_stats = await stats_client.request("GET", "/stats", "stats")
+    for client in [*clients, stats_client]:
+        await client.close()
+
+    failures = [repr(r) for r in results if isinstance(r, BaseException)]
+    total = sum(statuses.values())
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "requests": total,
+        "requests_per_s": round(total / elapsed, 1),
+        "statuses": {str(k): v for k, v in sorted(statuses.items())},
+        "session_failures": failures[:10],
+        "routes": {
+            route: {
+                "count": len(values),
+                **{f"p{p}_ms": percentile(sorted(values), p) / 1e6 for p in (50, 90, 99)},
+                "max_ms": max(values) / 1e6,
+            }
+            for route, values in sorted(timings.items())
+        },
+        "cache": cache_stats,
+        "_expected": expected,
+    }
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def _wait_for_server(port: int, proc: subprocess.Popen, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with code {proc.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("server didn't start")
+
+def _write_profiles(root: Path, profile_ids: list[str], args: argparse.Namespace) -> None:
+    for i, profile_id in enumerate(profile_ids):
+        if not args.library:
+            write_profile(generate_profile(args.decks, args.cards, seed=i), root / profile_id)
+            continue
+
+        # Same curriculum for everyone, only the progress differs
+        profile = generate_profile(args.decks, args.cards, seed=0)
+        rng = random.Random(i)
+        for deck in profile.decks:
+            for card in deck.cards:
+                card.familiarity_level = rng.randrange(len(FAMILIARITY_LEVELS))
+            library.publish(deck, root / "library")
+        write_profile(profile, root / profile_id)
+
+def _disk_usage(root: Path) -> int:
+    return sum(p.stat().st_size for p in root.rglob("*") if p.is_file())
+
+def _server_memory(pid: int) -> dict[str, int] | None:
+    """Resident memory of the server in KiB, split into private (anonymous)
+    and file-backed pages. Linux only."""
+    try:
+        status = Path(f"/proc/{pid}/status").read_text()
+    except OSError:
+        return None
+    fields = dict(line.split(":", 1) for line in status.splitlines() if ":" in line)
+    return {key: int(fields[key].split()[0]) for key in ("VmRSS", "RssAnon", "RssFile") if key in fields}
+
+def _verify(root: Path, expected: dict[tuple[str, str, str], int]) -> list[str]:
+    lost = []
+    by_profile: dict[str, list[tuple[str, str, int]]] = {}
+    for (profile_id, deck, term), level in expected.items():
+        by_profile.setdefault(profile_id, []).append((deck, term, level))
+
+    for profile_id, cards in by_profile.items():
+        profile, _ = load_profile(root / profile_id / "save_data.json", root / "library")
+        levels = {(d.name, c.term): c.familiarity_level for d in profile.decks for c in d.cards}
+        for deck, term, level in cards:
+            if levels.get((deck, term)) != level:
+                lost.append(f"{profile_id}/{deck}/{term}: expected {level}, saved {levels.get((deck, term))}")
+    return lost
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=200, help="concurrent study sessions")
+    parser.add_argument("--profiles", type=int, default=50, help="distinct student profiles")
+    parser.add_argument("--rounds", type=int, default=5, help="question rounds per session")
+    parser.add_argument("--decks", type=int, default=5, help="decks per profile")
+    parser.add_argument("--cards", type=int, default=200, help="cards per deck")
+    parser.add_argument("--cache-size", type=int, default=32, help="server profile cache size")
+    parser.add_argument("--save-delay", type=float, default=0.5, help="server write-behind delay")
+    parser.add_argument("--library", action="store_true", help="share one set of library decks between profiles")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="pystudy-load-") as tmp:
+        root = Path(tmp)
+        profile_ids = [f"student-{i:04d}" for i in range(args.profiles)]
+        _write_profiles(root, profile_ids, args)
+        disk_bytes = _disk_usage(root)
+
+        port = _free_port()
+        proc = subprocess.Popen(
+            [sys.executable, str(ROOT_DIR / "main.py"), "serve", "--root", str(root), "--port", str(port),
+             "--cache-size", str(args.cache_size), "--save-delay", str(args.save_delay),
+             "--library", str(root / "library")],
+            env=dict(os.environ, PYSTUDY_DATA_DIR=str(root)),
+        )
+        try:
+            _wait_for_server(port, proc)
+            report = asyncio.run(run_sessions(port, profile_ids, args.sessions, args.rounds))
+            report["server_memory_kib"] = _server_memory(proc.pid)
+        finally:
+            proc.send_signal(signal.SIGINT)
+            proc.wait(timeout=60)
+
+        expected = report.pop("_expected")
+        lost = _verify(root, expected)
+
+    report["disk_bytes"] = disk_bytes
+    report["answered_cards"] = len(expected)
+    report["lost_answers"] = lost[:20]
+    print(json.dumps(report, indent=4))
+
+    errors = sum(v for k, v in report["statuses"].items() if int(k) >= 500)
+    return 1 if errors or lost or report["session_failures"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+# Copyright 2025-2026 Louis Masarei-Boulton
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+"""
+Stress test for concurrent sessions on one data directory.
+
+Starts many processes against the same profile in a temporary directory:
+
+    profile writers  each own a deck. Load the whole profile, add one card
+                     to their deck, save the whole profile (save_profile).
+    deck writers     each own a deck. Load their deck, add one card, save
+                     just that deck (save_deck).
+    readers          load the profile over and over and check that it
+                     always loads completely and every deck is a clean
+                     prefix of what its owner wrote.
+
+Writers reload and try again when a save is refused as a conflict, like a
+user picking "retry" would after reloading. At the end every writer's deck
+must hold each of its cards exactly once.
+
+With --unsafe the locks are disabled and conflicts are overwritten
+(force=True), to show what happened before: most cards are lost.
+
+Exits with 1 if any card was lost or duplicated, or a reader saw a bad load.
+
+Usage: python tools/stress_locks.py [--profile-writers 6] [--deck-writers 6] [--readers 4] [--saves 40] [--unsafe]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from pystudy_cli.core import locking  # noqa: E402
+from pystudy_cli.core.constants import VERSION_NUM  # noqa: E402
+from pystudy_cli.core.data_manager import (  # noqa: E402
+    LoadStatCategory,
+    decks_dir_for,
+    load_deck,
+    load_profile,
+    save_deck,
+    save_profile,
+)
+from pystudy_cli.core.objects import Card, ConfigObject  # noqa: E402
+from pystudy_cli.core.profile import StudyProfile  # noqa: E402
+
+
+def _owner(kind: str, i: int) -> str:
+    return f"{kind}{i}"
+
+def _card(owner: str, n: int) -> Card:
+    return Card(f"{owner}-{n}", f"card {n} of {owner}")
+
+def _setup(head: Path, owners: list[str]) -> None:
+    profile = StudyProfile(VERSION_NUM, "stress", [], ConfigObject())
+    for owner in owners:
+        profile.new_deck(datetime.now().isoformat(), owner, f"{owner}.json")
+    err = save_profile(profile, head)
+    assert err is None, err
+
+def profile_writer(head: Path, owner: str, saves: int, unsafe: bool) -> dict:
+    if unsafe:
+        locking.fcntl = None  # type: ignore[assignment]
+    attempts = conflicts = 0
+    for n in range(saves):
+        while True:
+            attempts += 1
+            profile, status = load_profile(head)
+            if status.category != LoadStatCategory.SUCCESS:
+                continue  # Reported by the readers, try again
+            deck = next(d for d in profile.decks if d.name == owner)
+            deck.cards.append(_card(owner, n))
+            err = save_profile(profile, head, force=unsafe)
+            if err is None:
+                break
+            conflicts += 1
+    return {"attempts": attempts, "conflicts": conflicts}
+
+def deck_writer(head: Path, owner: str, saves: int, unsafe: bool) -> dict:
+    if unsafe:
+        locking.fcntl = None  # type: ignore[assignment]
+    attempts = conflicts = 0
+    for n in range(saves):
+        while True:
+            attempts += 1
+            try:
+                deck = load_deck(f"{owner}.json", decks_dir_for(head))
+            except (OSError, ValueError):
+                continue  # Only possible without the locks
+            deck.cards.append(_card(owner, n))
+            err = save_deck(deck, head, force=unsafe)
+            if err is None:
+                break
+            conflicts += 1
+    return {"attempts": attempts, "conflicts": conflicts}
+
+def reader(head: Path, owners: list[str], seconds: float, unsafe: bool) -> dict:
+    if unsafe:
+        locking.fcntl = None  # type: ignore[assignment]
+    loads = bad = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        loads += 1
+        profile, status = load_profile(head)
+        if status.category != LoadStatCategory.SUCCESS:
+            bad += 1
+            continue
+        for deck in profile.decks:
+            if [c.term for c in deck.cards] != [_card(deck.name, n).term for n in range(len(deck.cards))]:
+                bad += 1
+                break
+    return {"loads": loads, "bad_loads": bad}
+
+def _verify(head: Path, owners: list[str], saves: int) -> dict[str, int]:
+    profile, status = load_profile(head)
+    assert status.category == LoadStatCategory.SUCCESS, status
+    lost = duplicated = 0
+    for deck in profile.decks:
+        terms = [c.term for c in deck.cards]
+        expected = {_card(deck.name, n).term for n in range(saves)}
+        lost += len(expected - set(terms))
+        duplicated += len(terms) - len(set(terms))
+    return {"lost_cards": lost, "duplicated_cards": duplicated}
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile-writers", type=int, default=6, help="processes saving the whole profile")
+    parser.add_argument("--deck-writers", type=int, default=6, help="processes saving a single deck")
+    parser.add_argument("--readers", type=int, default=4, help="processes only loading")
+    parser.add_argument("--saves", type=int, default=40, help="successful saves (cards added) per writer")
+    parser.add_argument("--unsafe", action="store_true", help="disable locks and overwrite conflicts")
+    args = parser.parse_args()
+
+    profile_owners = [_owner("p", i) for i in range(args.profile_writers)]
+    deck_owners = [_owner("d", i) for i in range(args.deck_writers)]
+    owners = profile_owners + deck_owners
+
+    with tempfile.TemporaryDirectory(prefix="pystudy-locks-") as tmp:
+        head = Path(tmp) / "save_data.json"
+        _setup(head, owners)
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=len(owners) + args.readers) as pool:
+            writers = [pool.submit(profile_writer, head, owner, args.saves, args.unsafe) for owner in profile_owners]
+            writers += [pool.submit(deck_writer, head, owner, args.saves, args.unsafe) for owner in deck_owners]
+            # Readers run for roughly as long as the writers
+            readers = [pool.submit(reader, head, owners, 2.0, args.unsafe) for _ in range(args.readers)]
+            writer_results = [w.result() for w in writers]
+            reader_results = [r.result() for r in readers]
+        elapsed = time.perf_counter() - start
+
+        report: dict = _verify(head, owners, args.saves)
+
+    report.update({
+        "unsafe": args.unsafe,
+        "seconds": round(elapsed, 2),
+        "saves": args.saves * len(owners),
+        "save_attempts": sum(r["attempts"] for r in writer_results),
+        "conflicts": sum(r["conflicts"] for r in writer_results),
+        "reader_loads": sum(r["loads"] for r in reader_results),
+        "bad_loads": sum(r["bad_loads"] for r in reader_results),
+    })
+    print(json.dumps(report, indent=4))
+    return 1 if report["lost_cards"] or report["duplicated_cards"] or report["bad_loads"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())